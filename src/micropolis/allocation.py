@@ -12,6 +12,8 @@ from result import Err, Ok, Result
 from .constants import WORLD_X, WORLD_Y, HWLDX, HWLDY, QWX, QWY, SM_X, SM_Y, OBJN, HISTLEN, MISCHISTLEN, PWRMAPSIZE, \
     HISTORIES, PROBNUM, NMAPS
 from .context import AppContext
+from .power import new_power_map
+from .tile_map import OVERLAY_GRIDS, TileMap, ensure_overlay_grid, new_overlay_grid
 
 logger = logging.getLogger(__name__)
 
@@ -33,169 +35,23 @@ def init_map_arrays(context: AppContext) -> Result[int, Exception]:
     """
     try:
         # Main map array is already initialized in types.py
-        # Here we ensure it's properly sized
+        # Here we ensure it's properly sized and array-backed
         if (
             len(context.map_data) != WORLD_X
             or len(context.map_data[0]) != WORLD_Y
         ):
-            context.map_data = [
-                [0 for _ in range(WORLD_Y)]
-                for _ in range(WORLD_X)
-            ]
+            context.map_data = TileMap(WORLD_X, WORLD_Y)
+        elif not isinstance(context.map_data, TileMap):
+            context.map_data = TileMap.from_columns(context.map_data)
 
-        # Population density overlay (already initialized in types.py)
-        if (
-            len(context.pop_density) != HWLDX
-            or len(context.pop_density[0]) != HWLDY
-        ):
-            context.pop_density = [
-                [0 for _ in range(HWLDY)]
-                for _ in range(HWLDX)
-            ]
-
-        # Traffic density overlay (already initialized in types.py)
-        if (
-            len(context.trf_density) != HWLDX
-            or len(context.trf_density[0]) != HWLDY
-        ):
-            context.trf_density = [
-                [0 for _ in range(HWLDY)]
-                for _ in range(HWLDX)
-            ]
-
-        # Pollution overlay (already initialized in types.py)
-        if (
-            len(context.pollution_mem) != HWLDX
-            or len(context.pollution_mem[0]) != HWLDY
-        ):
-            context.pollution_mem = [
-                [0 for _ in range(HWLDY)]
-                for _ in range(HWLDX)
-            ]
-
-        # Land value overlay (already initialized in types.py)
-        if (
-            len(context.land_value_mem) != HWLDX
-            or len(context.land_value_mem[0]) != HWLDY
-        ):
-            context.land_value_mem = [
-                [0 for _ in range(HWLDY)]
-                for _ in range(HWLDX)
-            ]
-
-        # Crime overlay (already initialized in types.py)
-        if (
-            len(context.crime_mem) != HWLDX
-            or len(context.crime_mem[0]) != HWLDY
-        ):
-            context.crime_mem = [
-                [0 for _ in range(HWLDY)]
-                for _ in range(HWLDX)
-            ]
-
-        # Temporary overlays (already initialized in types.py)
-        if (
-            len(context.tem) != HWLDX
-            or len(context.tem[0]) != HWLDY
-        ):
-            context.tem = [
-                [0 for _ in range(HWLDY)]
-                for _ in range(HWLDX)
-            ]
-        if (
-            len(context.tem2) != HWLDX
-            or len(context.tem2[0]) != HWLDY
-        ):
-            context.tem2 = [
-                [0 for _ in range(HWLDY)]
-                for _ in range(HWLDX)
-            ]
-
-        # Terrain memory (already initialized in types.py)
-        if (
-            len(context.terrain_mem) != QWX
-            or len(context.terrain_mem[0]) != QWY
-        ):
-            context.terrain_mem = [
-                [0 for _ in range(QWY)]
-                for _ in range(QWX)
-            ]
-        if (
-            len(context.Qtem) != QWX
-            or len(context.Qtem[0]) != QWY
-        ):
-            context.Qtem = [
-                [0 for _ in range(QWY)]
-                for _ in range(QWX)
-            ]
-
-        # Rate of growth (already initialized in types.py)
-        if (
-            len(context.rate_og_mem) != SM_X
-            or len(context.rate_og_mem[0]) != SM_Y
-        ):
-            context.rate_og_mem = [
-                [0 for _ in range(SM_Y)]
-                for _ in range(SM_X)
-            ]
-
-        # Fire station coverage (already initialized in types.py)
-        if (
-            len(context.fire_st_map) != SM_X
-            or len(context.fire_st_map[0]) != SM_Y
-        ):
-            context.fire_st_map = [
-                [0 for _ in range(SM_Y)]
-                for _ in range(SM_X)
-            ]
-
-        # Police station coverage (already initialized in types.py)
-        if (
-            len(context.police_map) != SM_X
-            or len(context.police_map[0]) != SM_Y
-        ):
-            context.police_map = [
-                [0 for _ in range(SM_Y)]
-                for _ in range(SM_X)
-            ]
-        if (
-            len(context.police_map_effect) != SM_X
-            or len(context.police_map_effect[0]) != SM_Y
-        ):
-            context.police_map_effect = [
-                [0 for _ in range(SM_Y)]
-                for _ in range(SM_X)
-            ]
-
-        # Commercial rate (already initialized in types.py)
-        if (
-            len(context.com_rate) != SM_X
-            or len(context.com_rate[0]) != SM_Y
-        ):
-            context.com_rate = [
-                [0 for _ in range(SM_Y)]
-                for _ in range(SM_X)
-            ]
-
-        # Fire rate (already initialized in types.py)
-        if (
-            len(context.fire_rate) != SM_X
-            or len(context.fire_rate[0]) != SM_Y
-        ):
-            context.fire_rate = [
-                [0 for _ in range(SM_Y)]
-                for _ in range(SM_X)
-            ]
-
-        # Temporary storage (already initialized in types.py)
-        if (
-            len(context.stem) != SM_X
-            or len(context.stem[0]) != SM_Y
-        ):
-            context.stem = [
-                [0 for _ in range(SM_Y)]
-                for _ in range(SM_X)
-            ]
+        # Overlay grids (already initialized on AppContext). Resize any that
+        # do not match and move legacy nested lists onto typed arrays.
+        for name in OVERLAY_GRIDS:
+            setattr(
+                context,
+                name,
+                ensure_overlay_grid(getattr(context, name), name),
+            )
 
         # Sprite offsets (already initialized in types.py)
         if len(context.sprite_x_offset) != OBJN:
@@ -203,25 +59,13 @@ def init_map_arrays(context: AppContext) -> Result[int, Exception]:
         if len(context.sprite_y_offset) != OBJN:
             context.sprite_y_offset = [0] * OBJN
 
-        # History arrays - initialize as proper lists
-        if not context.res_his or len(context.res_his) != HISTLEN:
-            context.res_his = [0] * HISTLEN
-        if not context.com_his or len(context.com_his) != HISTLEN:
-            context.com_his = [0] * HISTLEN
-        if not context.ind_his or len(context.ind_his) != HISTLEN:
-            context.ind_his = [0] * HISTLEN
-        if not context.money_his or len(context.money_his) != HISTLEN:
-            context.money_his = [0] * HISTLEN
-        if not context.crime_his or len(context.crime_his) != HISTLEN:
-            context.crime_his = [0] * HISTLEN
-        if not context.pollution_his or len(context.pollution_his) != HISTLEN:
-            context.pollution_his = [0] * HISTLEN
+        # History arrays; the census series are fixed-size ring buffers
         if not context.misc_his or len(context.misc_his) != MISCHISTLEN:
             context.misc_his = [0] * MISCHISTLEN
 
-        # Power grid (already initialized in types.py as array.array)
+        # Power grid (packed array('H') on AppContext)
         if len(context.power_map) != PWRMAPSIZE:
-            context.power_map = [0] * PWRMAPSIZE
+            context.power_map = new_power_map()
 
         # History buffers (already initialized in types.py)
         if len(context.History10) != HISTORIES:
@@ -314,12 +158,12 @@ def validate_array_dimensions(context: AppContext) -> bool:
         assert len(context.police_map[0]) == SM_Y
 
         # Check history arrays
-        assert len(context.res_his) == HISTLEN
-        assert len(context.com_his) == HISTLEN
-        assert len(context.ind_his) == HISTLEN
-        assert len(context.money_his) == HISTLEN
-        assert len(context.crime_his) == HISTLEN
-        assert len(context.pollution_his) == HISTLEN
+        assert len(context.res_his) == HISTLEN // 2
+        assert len(context.com_his) == HISTLEN // 2
+        assert len(context.ind_his) == HISTLEN // 2
+        assert len(context.money_his) == HISTLEN // 2
+        assert len(context.crime_his) == HISTLEN // 2
+        assert len(context.pollution_his) == HISTLEN // 2
         assert len(context.misc_his) == MISCHISTLEN
 
         # Check power map
@@ -337,82 +181,11 @@ def reset_all_arrays(context: AppContext) -> None:
     Reset all global arrays to their initial state (all zeros).
     """
     # Reset main map
-    context.map_data = [
-        [0 for _ in range(WORLD_Y)]
-        for _ in range(WORLD_X)
-    ]
-
-    # Reset overlays
-    context.pop_density = [
-        [0 for _ in range(HWLDY)]
-        for _ in range(HWLDX)
-    ]
-    context.trf_density = [
-        [0 for _ in range(HWLDY)]
-        for _ in range(HWLDX)
-    ]
-    context.pollution_mem = [
-        [0 for _ in range(HWLDY)]
-        for _ in range(HWLDX)
-    ]
-    context.land_value_mem = [
-        [0 for _ in range(HWLDY)]
-        for _ in range(HWLDX)
-    ]
-    context.crime_mem = [
-        [0 for _ in range(HWLDY)]
-        for _ in range(HWLDX)
-    ]
-
-    # Reset temporary arrays
-    context.tem = [
-        [0 for _ in range(HWLDY)]
-        for _ in range(HWLDX)
-    ]
-    context.tem2 = [
-        [0 for _ in range(HWLDY)]
-        for _ in range(HWLDX)
-    ]
-
-    # Reset terrain arrays
-    context.terrain_mem = [
-        [0 for _ in range(QWY)]
-        for _ in range(QWX)
-    ]
-    context.Qtem = [
-        [0 for _ in range(QWY)]
-        for _ in range(QWX)
-    ]
-
-    # Reset small arrays
-    context.rate_og_mem = [
-        [0 for _ in range(SM_Y)]
-        for _ in range(SM_X)
-    ]
-    context.fire_st_map = [
-        [0 for _ in range(SM_Y)]
-        for _ in range(SM_X)
-    ]
-    context.police_map = [
-        [0 for _ in range(SM_Y)]
-        for _ in range(SM_X)
-    ]
-    context.police_map_effect = [
-        [0 for _ in range(SM_Y)]
-        for _ in range(SM_X)
-    ]
-    context.com_rate = [
-        [0 for _ in range(SM_Y)]
-        for _ in range(SM_X)
-    ]
-    context.fire_rate = [
-        [0 for _ in range(SM_Y)]
-        for _ in range(SM_X)
-    ]
-    context.stem = [
-        [0 for _ in range(SM_Y)]
-        for _ in range(SM_X)
-    ]
+    context.map_data = TileMap(WORLD_X, WORLD_Y)
+
+    # Reset overlays, temporary, terrain and small arrays
+    for name in OVERLAY_GRIDS:
+        setattr(context, name, new_overlay_grid(name))
 
     # Reset history arrays
     context.res_his = [0] * HISTLEN
@@ -424,7 +197,7 @@ def reset_all_arrays(context: AppContext) -> None:
     context.misc_his = [0] * MISCHISTLEN
 
     # Reset power map
-    context.power_map = [0] * PWRMAPSIZE
+    context.power_map = new_power_map()
 
     # Reset sprite offsets
     context.sprite_x_offset = [0] * OBJN
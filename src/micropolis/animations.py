@@ -11,47 +11,41 @@
 
 from typing import Any
 
+import numpy as np
+
 from . import animation, macros
-from .constants import WORLD_X, WORLD_Y
 from .context import AppContext
+from .tile_map import TILE_DTYPE, store_tile_array, tile_array
+
+# ani_tile as a 1024-entry array indexable by a whole mask of tile ids.
+_ANI_TILE_TABLE = np.arange(macros.LOMASK + 1, dtype=TILE_DTYPE)
+_ANI_TILE_TABLE[: len(animation.ani_tile)] = animation.ani_tile[: macros.LOMASK + 1]
 
 
 def animate_tiles(context: AppContext) -> None:
     """
     Animate all tiles in the world map that have the ANIMBIT flag set.
 
-    This function iterates through the entire WORLD_X x WORLD_Y tile map
-    and updates any tiles that are marked for animation. Animated tiles
-    cycle through different visual states based on the ani_tile lookup table.
+    The whole map is processed as one vectorized pass: tiles with ANIMBIT
+    set are selected with a mask and their low 10 bits are replaced by the
+    next frame from the ani_tile lookup table.
 
     The animation preserves tile flags (status bits) while updating the
     base tile ID to create the animation effect.
 
     Called from: moveWorld, doEditWindow, scoreDoer, doMapInFront, graphDoer
     """
-    # Iterate through all tiles in the world map
-    for x in range(WORLD_X):
-        for y in range(WORLD_Y):
-            tile_value = context.map_data[x][y]
-
-            # Check if this tile should be animated
-            if tile_value & macros.ANIMBIT:
-                # Extract tile flags (upper bits including ANIMBIT)
-                tile_flags = tile_value & macros.ALLBITS
-
-                # Clear the low 10 bits to get the animation index
-                tile_index = tile_value & macros.LOMASK
-
-                # Look up the next animation frame
-                # Note: Original C code had commented synchronization logic
-                # that is not currently implemented
-                if tile_index < len(animation.ani_tile):
-                    new_tile_index = animation.ani_tile[tile_index]
-                else:
-                    new_tile_index = tile_index  # Fallback for invalid indices
+    tiles = tile_array(context.map_data)
+    animated = (tiles & macros.ANIMBIT) != 0
+    if not animated.any():
+        return
 
-                # Restore the flags and update the tile
-                context.map_data[x][y] = new_tile_index | tile_flags
+    values = tiles[animated]
+    # Note: Original C code had commented synchronization logic
+    # that is not currently implemented
+    next_frames = _ANI_TILE_TABLE[values & macros.LOMASK]
+    tiles[animated] = next_frames | (values & macros.ALLBITS)
+    store_tile_array(context.map_data, tiles)
 
 
 # ============================================================================
@@ -66,12 +60,8 @@ def count_animated_tiles(context: AppContext) -> int:
     Returns:
         Number of tiles with ANIMBIT flag set
     """
-    count = 0
-    for x in range(macros.WORLD_X):
-        for y in range(macros.WORLD_Y):
-            if context.map_data[x][y] & macros.ANIMBIT:
-                count += 1
-    return count
+    tiles = tile_array(context.map_data)
+    return int(np.count_nonzero(tiles & macros.ANIMBIT))
 
 
 def get_animated_tile_positions(context: AppContext) -> list[tuple[int, int]]:
@@ -81,12 +71,9 @@ def get_animated_tile_positions(context: AppContext) -> list[tuple[int, int]]:
     Returns:
         List of (x, y) coordinate tuples for animated tiles
     """
-    positions = []
-    for x in range(macros.WORLD_X):
-        for y in range(macros.WORLD_Y):
-            if context.map_data[x][y] & macros.ANIMBIT:
-                positions.append((x, y))
-    return positions
+    tiles = tile_array(context.map_data)
+    xs, ys = np.nonzero(tiles & macros.ANIMBIT)
+    return list(zip(xs.tolist(), ys.tolist()))
 
 
 def get_animation_info(context: AppContext,
@@ -0,0 +1,170 @@
+"""
+census_history.py - Ring-buffered census history series
+
+Each of the six census histories (``ResHis``, ``ComHis``, ``IndHis``,
+``MoneyHis``, ``CrimeHis``, ``PollutionHis`` in s_sim.c) is an array of
+``HISTLEN / 2`` shorts. Entries 0..119 hold the last 120 months and entries
+120..239 the last 120 years, newest first. ``TakeCensus`` and
+``Take2Census`` scroll their half along by one entry before writing the new
+value at its front.
+
+``HistorySeries`` keeps each half in a ring buffer, so that scroll is a head
+move instead of a 120-element copy. It still indexes, slices, iterates and
+compares like the ``list[int]`` the rest of the port expects. Range maxima
+and the scaled ``history_10``/``history_120`` rows used by the graphs are
+computed with NumPy and cached until the series is next written.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import numpy as np
+
+from .constants import HISTLEN, HISTORIES
+
+SERIES_LEN = HISTLEN // 2  # shorts per history array
+SPAN = SERIES_LEN // 2  # entries per half: 120 months, then 120 years
+MONTHS = 0  # half holding entries 0..119
+YEARS = 1  # half holding entries 120..239
+
+
+class HistorySeries:
+    """One census history: months and years halves, each a ring buffer."""
+
+    __slots__ = ("_rings", "_heads", "_cache")
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._rings = np.zeros((2, SPAN), dtype=np.int64)
+        self._heads = [0, 0]
+        self._cache: dict[tuple[Any, ...], Any] = {}
+        self.assign(values)
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        if index < 0:
+            index += SERIES_LEN
+        if not 0 <= index < SERIES_LEN:
+            raise IndexError("history index out of range")
+        half, offset = divmod(index, SPAN)
+        return half, (self._heads[half] + offset) % SPAN
+
+    def __len__(self) -> int:
+        return SERIES_LEN
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        return self._rings.item(self._locate(index))
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            values = self.tolist()
+            values[index] = value
+            if len(values) != SERIES_LEN:
+                raise ValueError("history series length is fixed")
+            self.assign(values)
+            return
+        self._rings[self._locate(index)] = value
+        self._cache.clear()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HistorySeries):
+            return self.tolist() == other.tolist()
+        if isinstance(other, (list, tuple)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"HistorySeries({self.tolist()!r})"
+
+    def half(self, half: int) -> np.ndarray:
+        """Entries of one half (MONTHS or YEARS), newest first, as a copy."""
+        return np.roll(self._rings[half], -self._heads[half])
+
+    def array(self) -> np.ndarray:
+        return np.concatenate((self.half(MONTHS), self.half(YEARS)))
+
+    def tolist(self) -> list[int]:
+        return self.array().tolist()
+
+    def assign(self, values: Iterable[int]) -> None:
+        """Replace the contents; missing entries are zero, extras ignored."""
+        data = np.zeros(SERIES_LEN, dtype=np.int64)
+        values = list(values)[:SERIES_LEN]
+        data[: len(values)] = values
+        self._rings[...] = data.reshape(2, SPAN)
+        self._heads = [0, 0]
+        self._cache.clear()
+
+    def fill(self, value: int) -> None:
+        self._rings.fill(value)
+        self._cache.clear()
+
+    def roll(self, half: int) -> None:
+        """Scroll one half along by one entry, as the census loops do.
+
+        The last entry of the half drops off and the first is duplicated
+        into the second, leaving the first ready to be overwritten.
+        """
+        ring = self._rings[half]
+        head = (self._heads[half] - 1) % SPAN
+        ring[head] = ring[(head + 1) % SPAN]
+        self._heads[half] = head
+        self._cache.clear()
+
+    def max(self, start: int, stop: int) -> int:
+        """Largest entry in ``[start, stop)``, or 0 if all are smaller.
+
+        The range must lie within one half.
+        """
+        key = ("max", start, stop)
+        cached = self._cache.get(key)
+        if cached is None:
+            half = start // SPAN
+            values = self.half(half)[start - half * SPAN : stop - half * SPAN]
+            cached = max(0, int(values.max())) if values.size else 0
+            self._cache[key] = cached
+        return cached
+
+    def scaled(self, half: int, scale: float) -> list[int]:
+        """One half scaled, clamped to 0..255 and reversed, as drawMonth."""
+        key = ("scaled", half, scale)
+        cached = self._cache.get(key)
+        if cached is None:
+            values = (self.half(half) * scale).astype(np.int64)
+            cached = np.clip(values, 0, 255)[::-1].tolist()
+            self._cache[key] = cached
+        return list(cached)
+
+
+class CensusHistory:
+    """The six census series, indexed by RES_HIST .. POLLUTION_HIST."""
+
+    __slots__ = ("series",)
+
+    def __init__(self) -> None:
+        self.series = tuple(HistorySeries() for _ in range(HISTORIES))
+
+    def __getitem__(self, kind: int) -> HistorySeries:
+        return self.series[kind]
+
+    def __iter__(self) -> Iterator[HistorySeries]:
+        return iter(self.series)
+
+    def roll_months(self) -> None:
+        for series in self.series:
+            series.roll(MONTHS)
+
+    def roll_years(self) -> None:
+        for series in self.series:
+            series.roll(YEARS)
+
+    def fill(self, value: int) -> None:
+        for series in self.series:
+            series.fill(value)
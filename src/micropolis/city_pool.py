@@ -0,0 +1,225 @@
+"""
+city_pool.py - Run many headless cities in parallel worker processes
+
+Each city needs its own AppContext, and parts of the engine still keep
+state in module globals, so two cities cannot safely share a process.
+``run_cities`` gives every ``CityJob`` its own context inside a
+``ProcessPoolExecutor`` worker. Only small picklable values cross the
+process boundary:
+
+* a city name or path, a generation seed, or a ``.cty`` image (27 KB) going
+  in;
+* ``MonthMetrics`` census snapshots streamed back as each month completes;
+* a ``HeadlessReport`` and, optionally, the final ``.cty`` image coming out.
+
+Typical use is a sweep over one setting::
+
+    jobs = [CityJob(f"tax-{t}", city="haight", months=24,
+                    settings={"city_tax": t}) for t in range(0, 21, 2)]
+    for result in run_cities(jobs, on_month=print):
+        print(result.job, result.report.census["total_funds"])
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import tempfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from . import headless, simulation
+from .context import AppContext
+from .file_io import loadFile, saveFile
+
+# How often the parent checks for finished jobs while relaying metrics.
+_POLL_SECONDS = 0.05
+
+
+@dataclass
+class CityJob:
+    """One city to simulate.
+
+    The starting city is ``state`` (a ``.cty`` image) if given, else the
+    ``city`` file, else a city generated from ``seed``. ``settings``
+    overrides AppContext fields such as ``city_tax`` before the run.
+    """
+
+    name: str
+    city: str = ""
+    seed: int | None = None
+    state: bytes | None = None
+    months: int = 12
+    sim_speed: int | None = None
+    settings: dict[str, Any] = field(default_factory=dict)
+    return_state: bool = False
+
+
+@dataclass
+class MonthMetrics:
+    """Census snapshot sent back after each simulated month of a job."""
+
+    job: str
+    month: int
+    census: dict[str, int]
+
+
+@dataclass
+class CityResult:
+    """Outcome of a job; ``error`` is set instead of ``report`` on failure."""
+
+    job: str
+    report: headless.HeadlessReport | None = None
+    state: bytes | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def dump_city_state(context: AppContext) -> bytes:
+    """Serialise the city in ``context`` as a ``.cty`` file image."""
+    fd, path = tempfile.mkstemp(suffix=".cty")
+    os.close(fd)
+    try:
+        if not saveFile(context, path):
+            raise ValueError("Unable to serialise city state")
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.unlink(path)
+
+
+def load_city_state(context: AppContext, data: bytes) -> None:
+    """Load a ``.cty`` file image into ``context`` and initialise it.
+
+    Raises:
+        ValueError: If ``data`` is not a valid city file
+    """
+    fd, path = tempfile.mkstemp(suffix=".cty")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if not loadFile(context, path):
+            raise ValueError("Unable to load city state")
+    finally:
+        os.unlink(path)
+    simulation.do_sim_init(context)
+
+
+def _apply_settings(context: AppContext, settings: dict[str, Any]) -> None:
+    for name, value in settings.items():
+        if name not in AppContext.model_fields:
+            raise ValueError(f"Unknown city setting: {name}")
+        setattr(context, name, value)
+
+
+def run_city_job(job: CityJob, metrics: Any = None) -> CityResult:
+    """Simulate ``job`` in the current process.
+
+    Args:
+        job: City to run
+        metrics: Optional queue receiving a ``MonthMetrics`` per month
+
+    Returns:
+        The job's report and, if requested, its final state
+    """
+    context = headless.create_headless_context()
+    if job.state is not None:
+        load_city_state(context, job.state)
+    elif job.city:
+        headless.load_city(context, job.city)
+    else:
+        headless.generate_city(context, job.seed)
+    if job.sim_speed is not None:
+        context.sim_speed = job.sim_speed
+    _apply_settings(context, job.settings)
+
+    on_month = None
+    if metrics is not None:
+
+        def on_month(ctx: AppContext, month: int) -> None:
+            census = headless.collect_census(ctx)
+            metrics.put(MonthMetrics(job.name, month, census))
+
+    report = headless.run_months(context, job.months, on_month)
+    state = dump_city_state(context) if job.return_state else None
+    return CityResult(job.name, report, state)
+
+
+def _default_mp_context() -> BaseContext:
+    # The engine starts helper threads, so forking a live process is unsafe;
+    # prefer a fresh interpreter per worker.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _drain(metrics: Any, on_month: Callable[[MonthMetrics], None]) -> None:
+    while True:
+        try:
+            item = metrics.get_nowait()
+        except queue.Empty:
+            return
+        on_month(item)
+
+
+def run_cities(
+    jobs: Sequence[CityJob],
+    max_workers: int | None = None,
+    on_month: Callable[[MonthMetrics], None] | None = None,
+    mp_context: BaseContext | None = None,
+) -> list[CityResult]:
+    """Run ``jobs`` across a process pool.
+
+    Args:
+        jobs: Cities to simulate; job names should be unique
+        max_workers: Worker processes (defaults to the CPU count)
+        on_month: Called in this process with each ``MonthMetrics`` as it
+            arrives from the workers
+        mp_context: Multiprocessing context for the pool and metrics queue
+            (forkserver where available, else spawn)
+
+    Returns:
+        One ``CityResult`` per job, in job order. Jobs that raise are
+        reported through ``CityResult.error`` rather than aborting the batch.
+    """
+    results: list[CityResult | None] = [None] * len(jobs)
+    mp_context = mp_context or _default_mp_context()
+    manager = None
+    metrics = None
+    if on_month is not None:
+        manager = mp_context.Manager()
+        metrics = manager.Queue()
+    try:
+        with ProcessPoolExecutor(max_workers, mp_context=mp_context) as pool:
+            futures: dict[Future[CityResult], int] = {
+                pool.submit(run_city_job, job, metrics): index
+                for index, job in enumerate(jobs)
+            }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(
+                    pending, timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED
+                )
+                if metrics is not None and on_month is not None:
+                    _drain(metrics, on_month)
+                for future in done:
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as exc:
+                        results[index] = CityResult(
+                            jobs[index].name, error=str(exc)
+                        )
+            if metrics is not None and on_month is not None:
+                _drain(metrics, on_month)
+    finally:
+        if manager is not None:
+            manager.shutdown()
+    return [result for result in results if result is not None]
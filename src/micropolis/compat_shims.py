@@ -145,3 +145,58 @@ def inject_legacy_wrappers(module, names: Iterable[str]) -> None:
         except Exception:
             # Be conservative — if we can't replace the attribute, skip it.
             continue
+
+
+def _field_default(field: str) -> Any:
+    info = AppContext.model_fields.get(field)
+    if info is None:
+        return None
+    return info.get_default(call_default_factory=True)
+
+
+class ContextShimModule(types.ModuleType):
+    """Module type whose retired globals read through to an AppContext.
+
+    Each name in ``_CONTEXT_SHIMS`` maps a legacy module global to the
+    AppContext field that now owns the value. Reads return the field from
+    the test context when one is installed, or its default otherwise, so a
+    module never holds simulation state of its own. Assigning to a shimmed
+    name raises, since the write would be invisible to every context.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        field = self.__dict__.get("_CONTEXT_SHIMS", {}).get(name)
+        if field is None:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {name!r}"
+            )
+        ctx = _find_auto_context()
+        if ctx is not None:
+            return getattr(ctx, field)
+        return _field_default(field)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        field = self.__dict__.get("_CONTEXT_SHIMS", {}).get(name)
+        if field is not None:
+            raise AttributeError(
+                f"{self.__name__}.{name} is read-only; set context.{field} instead"
+            )
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name in self.__dict__.get("_CONTEXT_SHIMS", {}):
+            raise AttributeError(f"{self.__name__}.{name} is read-only")
+        super().__delattr__(name)
+
+
+def install_context_shims(module: types.ModuleType, shims: dict[str, str]) -> None:
+    """Expose legacy globals of ``module`` as read-only views of context fields.
+
+    Args:
+        module: Module whose globals moved onto AppContext
+        shims: Legacy global name -> AppContext field name
+    """
+    for name in shims:
+        module.__dict__.pop(name, None)
+    module.__dict__.setdefault("_CONTEXT_SHIMS", {}).update(shims)
+    module.__class__ = ContextShimModule
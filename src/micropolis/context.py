@@ -1,22 +1,24 @@
+import array
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from queue import Queue
 
 from . import constants as _constants
 from .constants import (
-    HWLDX,
-    HWLDY,
     NMAPS,
-    QWX,
-    QWY,
-    SM_X,
-    SM_Y,
     WORLD_X,
     WORLD_Y,
     OBJN,
     PWRMAPSIZE,
     HISTORIES,
+    RES_HIST,
+    COM_HIST,
+    IND_HIST,
+    MONEY_HIST,
+    CRIME_HIST,
+    POLLUTION_HIST,
     PROBNUM,
     RESBASE,
     PWRSTKSIZE,
@@ -26,6 +28,14 @@ from .constants import (
     DEG_3,
 )
 from .sim_sprite import SimSprite
+from .sprite_index import SpriteIndex
+from .census_history import CensusHistory, HistorySeries
+from .pos_stack import PosStack
+from .power_index import PowerIndex
+from .sim_profiler import SimProfiler
+from .traffic_cache import TrafficRouteCache
+from .sim_rng import SimRng
+from .tile_map import ArrayGrid, TileMap, new_overlay_grid
 from typing import TYPE_CHECKING, Any, ClassVar
 
 # Avoid importing TerrainGenerator at module import time to prevent a
@@ -68,6 +78,8 @@ from .constants import (
 )
 from .legacy_state import LEGACY_ATTRIBUTE_ALIASES, LEGACY_MIRROR_ATTRS
 
+_LEGACY_MIRROR_SET = frozenset(LEGACY_MIRROR_ATTRS)
+
 
 class AppContext(BaseModel):
     """Global application context."""
@@ -91,6 +103,7 @@ class AppContext(BaseModel):
         object.__setattr__(self, "_state_contract", None)
         object.__setattr__(self, "_suspend_state_contract", False)
         object.__setattr__(self, "_tick_base", time.perf_counter())
+        object.__setattr__(self, "_session_dirty", None)
         try:
             from . import types as _legacy_types
         except Exception:
@@ -115,6 +128,13 @@ class AppContext(BaseModel):
     def detach_state_contract(self) -> None:
         object.__setattr__(self, "_state_contract", None)
 
+    def flush_state_contract(self) -> None:
+        """Push any batched state contract updates to the legacy namespace."""
+        contract = self.__dict__.get("_state_contract")
+        flush = getattr(contract, "flush", None)
+        if flush is not None:
+            flush()
+
     def _suspend_contract_notifications(self) -> None:
         object.__setattr__(self, "_suspend_state_contract", True)
 
@@ -122,10 +142,21 @@ class AppContext(BaseModel):
         object.__setattr__(self, "_suspend_state_contract", False)
 
     def __setattr__(self, name: str, value: Any) -> None:  # type: ignore[override]
+        attrs = self.__dict__
+        dirty = attrs.get("_session_dirty")
+        if dirty is not None and name in attrs and name[0] != "_":
+            # Inside sim_session(): plain store, published when it ends.
+            attrs[name] = value
+            dirty[name] = None
+            return
+
         super().__setattr__(name, value)
         if name.startswith("_"):
             return
+        self._publish(name, value)
 
+    def _publish(self, name: str, value: Any) -> None:
+        """Notify the state contract and legacy mirror of a field change."""
         try:
             state_contract = object.__getattribute__(self, "_state_contract")
             suspend = object.__getattribute__(self, "_suspend_state_contract")
@@ -136,7 +167,7 @@ class AppContext(BaseModel):
             if state_contract is not None and not suspend:
                 state_contract.on_context_update(self, name, value)
 
-        if name in LEGACY_MIRROR_ATTRS:
+        if name in _LEGACY_MIRROR_SET:
             try:
                 from . import types as _legacy_types
 
@@ -146,6 +177,66 @@ class AppContext(BaseModel):
             except Exception:
                 pass
 
+    @contextmanager
+    def sim_session(self) -> Iterator["AppContext"]:
+        """Batch field writes made by the simulation.
+
+        Within the session, assignments to existing fields are stored
+        directly, skipping pydantic's setattr and the per-write contract and
+        legacy-mirror notifications. Each field written is published once,
+        with its final value, when the outermost session exits. Nested
+        sessions join the enclosing one.
+        """
+        attrs = self.__dict__
+        if attrs.get("_session_dirty") is not None:
+            yield self
+            return
+        dirty: dict[str, None] = {}
+        attrs["_session_dirty"] = dirty
+        try:
+            yield self
+        finally:
+            attrs["_session_dirty"] = None
+            self.__pydantic_fields_set__.update(dirty)
+            for name in dirty:
+                self._publish(name, attrs[name])
+
+    @property
+    def next(self) -> int:
+        """State of the rand.c generator (``sim_rng.state``)."""
+        return self.sim_rng.state
+
+    @next.setter
+    def next(self, value: int) -> None:
+        self.sim_rng.seed(value)
+
+    @property
+    def pos_stack_num(self) -> int:
+        """Entries on the traffic position stack (``pos_stack.count``)."""
+        return self.pos_stack.count
+
+    @pos_stack_num.setter
+    def pos_stack_num(self, value: int) -> None:
+        self.pos_stack.count = value
+
+    @property
+    def s_map_x_stack(self) -> array.array:
+        """X buffer of the traffic position stack (``pos_stack.xs``)."""
+        return self.pos_stack.xs
+
+    @s_map_x_stack.setter
+    def s_map_x_stack(self, values: Sequence[int]) -> None:
+        self.pos_stack.load(values, ())
+
+    @property
+    def s_map_y_stack(self) -> array.array:
+        """Y buffer of the traffic position stack (``pos_stack.ys``)."""
+        return self.pos_stack.ys
+
+    @s_map_y_stack.setter
+    def s_map_y_stack(self, values: Sequence[int]) -> None:
+        self.pos_stack.load((), values)
+
     def __getattr__(self, name: str) -> Any:
         """Expose constant values as legacy attributes when needed."""
         if name.startswith("_"):
@@ -195,53 +286,56 @@ class AppContext(BaseModel):
     # the application startup code and assigned to this field.
     sim: Any | None = Field(default=None)  # Global simulation object
     sound_initialized: bool = Field(default=False)  # SoundInitialized
-    map_data: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(WORLD_Y)] for _ in range(WORLD_X)]
-    )  # Main map data
-    pop_density: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    map_data: TileMap | list[list[int]] = Field(
+        default_factory=lambda: TileMap(WORLD_X, WORLD_Y)
+    )  # Main map data (contiguous uint16, indexed as map_data[x][y])
+    pop_density: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("pop_density")
     )  # Population density overlay
-    trf_density: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    trf_density: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("trf_density")
     )  # Traffic density overlay
-    pollution_mem: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    pollution_mem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("pollution_mem")
     )  # Pollution overlay
-    land_value_mem: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    land_value_mem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("land_value_mem")
     )  # Land value overlay
-    crime_mem: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    crime_mem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("crime_mem")
     )  # Crime overlay
-    tem: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    tem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("tem")
     )  # Temporary overlays
-    tem2: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    tem2: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("tem2")
     )  # Temporary overlays 2
-    terrain_mem: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(QWY)] for _ in range(QWX)]
+    terrain_mem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("terrain_mem")
     )  # Terrain memory
-    rate_og_mem: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(SM_Y)] for _ in range(SM_X)]
+    Qtem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("Qtem")
+    )  # Terrain scratch (quarter resolution)
+    rate_og_mem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("rate_og_mem")
     )  # Rate of growth
-    fire_st_map: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(SM_Y)] for _ in range(SM_X)]
+    fire_st_map: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("fire_st_map")
     )  # Fire station coverage
-    police_map: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(SM_Y)] for _ in range(SM_X)]
+    police_map: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("police_map")
     )  # Police station coverage
-    police_map_effect: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(SM_Y)] for _ in range(SM_X)]
+    police_map_effect: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("police_map_effect")
     )  # Police station coverage effect
-    com_rate: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(SM_Y)] for _ in range(SM_X)]
+    com_rate: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("com_rate")
     )
-    fire_rate: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(SM_Y)] for _ in range(SM_X)]
+    fire_rate: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("fire_rate")
     )  # Fire rate
-    stem: list[list[int]] = Field(
-        default_factory=lambda: [[0 for _ in range(SM_Y)] for _ in range(SM_X)]
+    stem: ArrayGrid | list[list[int]] = Field(
+        default_factory=lambda: new_overlay_grid("stem")
     )  # Temporary storage
     sprite_x_offset: list[int] = Field(
         default_factory=lambda: [0] * OBJN
@@ -319,20 +413,17 @@ class AppContext(BaseModel):
     don_dither: int = Field(default=0)
     do_overlay: int = Field(default=0)
 
-    res_his: list[int] = Field(default_factory=list)
+    # ResHis/ComHis/IndHis/MoneyHis/CrimeHis/PollutionHis, exposed as the
+    # *_his properties
+    census_history: CensusHistory = Field(default_factory=CensusHistory)
     res_his_max: int = Field(default=0)
-    com_hist: list[int] = Field(default_factory=list)
     com_his_max: int = Field(default=0)
-    ind_his: list[int] = Field(default_factory=list)
     ind_his_max: int = Field(default=0)
-    money_his: list[int] = Field(default_factory=list)
-    crime_his: list[int] = Field(default_factory=list)
-    pollution_his: list[int] = Field(default_factory=list)
     misc_his: list[int] = Field(default_factory=list)
 
-    power_map: list[int] = Field(
-        default_factory=lambda: [0] * (PWRMAPSIZE)
-    )  # Power grid map
+    power_map: array.array = Field(
+        default_factory=lambda: array.array("H", bytes(2 * PWRMAPSIZE))
+    )  # Packed power grid map, 16 tiles per word
 
     road_percent: float = Field(default=0.0)
     police_percent: float = Field(default=0.0)
@@ -432,9 +523,8 @@ class AppContext(BaseModel):
     pol_max_x: int = Field(default=0)
     pol_max_y: int = Field(default=0)
     traffic_average: int = Field(default=0)
-    pos_stack_num: int = Field(default=0)
-    s_map_x_stack: list[int] = Field(default_factory=list)
-    s_map_y_stack: list[int] = Field(default_factory=list)
+    # SMapXStack/SMapYStack/PosStackN, preallocated to MAXDIS entries
+    pos_stack: PosStack = Field(default_factory=PosStack)
     l_dir: int = Field(default=5)
 
     z_source: int = Field(default=0)
@@ -461,6 +551,8 @@ class AppContext(BaseModel):
     crash_y: int = Field(default=0)
     cc_x: int = Field(default=0)
     cc_y: int = Field(default=0)
+    cc_x2: int = Field(default=0)  # CCx2/CCy2: city centre at half resolution
+    cc_y2: int = Field(default=0)
 
     city_pop: int = Field(default=0)
     delta_city_pop: int = Field(default=0)
@@ -658,14 +750,54 @@ class AppContext(BaseModel):
     def PYGAME_DISPLAY(self, value: Any | None) -> None:
         self.pygame_display = value
 
-    # Backwards-compatible alias accessors
+    # Census histories; assigning a sequence copies it into the series
     @property
-    def com_his(self) -> list[int]:
-        return self.com_hist
+    def res_his(self) -> HistorySeries:
+        return self.census_history[RES_HIST]
+
+    @res_his.setter
+    def res_his(self, values: Iterable[int]) -> None:
+        self.census_history[RES_HIST].assign(values)
+
+    @property
+    def com_his(self) -> HistorySeries:
+        return self.census_history[COM_HIST]
 
     @com_his.setter
-    def com_his(self, value: list[int]) -> None:
-        self.com_hist = value
+    def com_his(self, values: Iterable[int]) -> None:
+        self.census_history[COM_HIST].assign(values)
+
+    @property
+    def ind_his(self) -> HistorySeries:
+        return self.census_history[IND_HIST]
+
+    @ind_his.setter
+    def ind_his(self, values: Iterable[int]) -> None:
+        self.census_history[IND_HIST].assign(values)
+
+    @property
+    def money_his(self) -> HistorySeries:
+        return self.census_history[MONEY_HIST]
+
+    @money_his.setter
+    def money_his(self, values: Iterable[int]) -> None:
+        self.census_history[MONEY_HIST].assign(values)
+
+    @property
+    def crime_his(self) -> HistorySeries:
+        return self.census_history[CRIME_HIST]
+
+    @crime_his.setter
+    def crime_his(self, values: Iterable[int]) -> None:
+        self.census_history[CRIME_HIST].assign(values)
+
+    @property
+    def pollution_his(self) -> HistorySeries:
+        return self.census_history[POLLUTION_HIST]
+
+    @pollution_his.setter
+    def pollution_his(self, values: Iterable[int]) -> None:
+        self.census_history[POLLUTION_HIST].assign(values)
 
     @property
     def IndZPop(self) -> int:
@@ -863,11 +995,15 @@ class AppContext(BaseModel):
     power_stack_y: list[int] = [0] * PWRSTKSIZE
     max_power: int = 0
     num_power: int = 0
+    # Conductive-network connectivity maintained across power scans
+    power_index: PowerIndex = Field(default_factory=PowerIndex)
+    # Opt-in per-phase timing of simulate(), read through sim_control
+    sim_profiler: SimProfiler = Field(default_factory=SimProfiler)
     # Print output destination (could be file, stdout, etc.)
     print_output: str | None = None
     print_file: str | None = None
-    # Static variable from rand.c
-    next: int = 0
+    # Static variable from rand.c, with its state kept to 32 bits
+    sim_rng: SimRng = Field(default_factory=SimRng)
     # Global state variables
     fptr_idx: int = SEP_3 + 1  # Front pointer index
     rptr_idx: int = 1  # Rear pointer index
@@ -915,6 +1051,10 @@ class AppContext(BaseModel):
 
     # Free sprite pool
     free_sprites: SimSprite | None = None
+    # Grid/type index over the live sprites in sim.sprite
+    sprite_index: SpriteIndex = Field(default_factory=SpriteIndex)
+    # Opt-in reachability cache consulted by traffic.MakeTraf
+    traffic_cache: TrafficRouteCache = Field(default_factory=TrafficRouteCache)
 
     # Financial variables
     # total_funds: int = 0
@@ -1007,6 +1147,21 @@ class AppContext(BaseModel):
     Button_Release: ClassVar[int] = 2
 
 
+def _bind_constants(cls: type[AppContext]) -> None:
+    """Expose the upper-case ``constants`` as class attributes of ``cls``.
+
+    Code that reads ``context.LOMASK`` then resolves it through the normal
+    class lookup instead of a ``__getattr__`` miss per access. Fields and
+    names the class already defines take precedence.
+    """
+    for name, value in vars(_constants).items():
+        if name.isupper() and name not in cls.model_fields and not hasattr(cls, name):
+            setattr(cls, name, value)
+
+
+_bind_constants(AppContext)
+
+
 # END OF FILE
 
 # Module-level compatibility alias expected by some legacy code/tests that
@@ -0,0 +1,214 @@
+"""
+editor_bench.py - Frame-time benchmark for the editor map renderer
+
+Renders a city through ``MapRenderer`` (the pygame editor panel's renderer)
+into an off-screen viewport and reports per-frame times for:
+
+* ``cold``: the first frame, which draws every visible tile;
+* ``idle``: frames with no map or blink change;
+* ``blink``: frames that toggle the unpowered-zone lightning bolt;
+* ``sim``: frames after advancing the simulation by ``--ticks`` ticks.
+
+``--per-tile`` swaps the view's array tile cache for nested lists, which
+forces the per-tile resolve-and-compare loop, for comparison.
+
+Usage:
+    python -m micropolis.editor_bench --city haight --frames 120
+    python -m micropolis.editor_bench --width 1920 --height 1080 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import pygame
+
+from .context import AppContext
+from .graphics_setup import load_big_tiles_surface, load_xpm_surface
+from .headless import create_headless_context, generate_city, load_city, step
+from .map_renderer import MapRenderer
+from .sim_view import create_editor_view
+
+logger = logging.getLogger(__name__)
+
+FRAME_KINDS: tuple[str, ...] = ("cold", "idle", "blink", "sim")
+
+
+@dataclass
+class FrameStats:
+    """Render times (seconds) and tiles redrawn for one kind of frame."""
+
+    seconds: list[float] = field(default_factory=list)
+    tiles: list[int] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, float]:
+        if not self.seconds:
+            return {"frames": 0}
+        return {
+            "frames": len(self.seconds),
+            "mean_ms": statistics.fmean(self.seconds) * 1000,
+            "median_ms": statistics.median(self.seconds) * 1000,
+            "max_ms": max(self.seconds) * 1000,
+            "mean_tiles": statistics.fmean(self.tiles),
+        }
+
+
+@dataclass
+class EditorBenchReport:
+    """Frame statistics per frame kind for one viewport size."""
+
+    viewport: tuple[int, int] = (0, 0)
+    per_tile: bool = False
+    frames: dict[str, FrameStats] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "viewport": list(self.viewport),
+            "per_tile": self.per_tile,
+            "frames": {kind: stats.to_dict() for kind, stats in self.frames.items()},
+        }
+
+    def format(self) -> str:
+        width, height = self.viewport
+        mode = "per-tile" if self.per_tile else "vectorized"
+        lines = [f"editor viewport {width}x{height} ({mode})"]
+        for kind, stats in self.frames.items():
+            data = stats.to_dict()
+            if not data["frames"]:
+                continue
+            lines.append(
+                f"  {kind:<6} {data['mean_ms']:8.3f} ms mean "
+                f"{data['median_ms']:8.3f} ms median {data['max_ms']:8.3f} ms max "
+                f"({data['frames']} frames, {data['mean_tiles']:.0f} tiles/frame)"
+            )
+        return "\n".join(lines)
+
+
+def run_frames(
+    context: AppContext,
+    renderer: MapRenderer,
+    frames: int,
+    ticks: int = 1,
+) -> dict[str, FrameStats]:
+    """Render ``frames`` frames of each kind and collect their timings."""
+    clock = time.perf_counter
+    stats = {kind: FrameStats() for kind in FRAME_KINDS}
+
+    def frame(kind: str) -> None:
+        started = clock()
+        renderer.render()
+        stats[kind].seconds.append(clock() - started)
+        stats[kind].tiles.append(renderer.tiles_drawn or 0)
+
+    context.flag_blink = 1
+    frame("cold")
+    for _ in range(frames):
+        frame("idle")
+    for _ in range(frames):
+        context.flag_blink = -context.flag_blink
+        frame("blink")
+    context.flag_blink = 1
+    frame("idle")
+    for _ in range(frames):
+        for _ in range(ticks):
+            step(context)
+        frame("sim")
+    return stats
+
+
+def run(
+    city: str = "",
+    seed: int | None = None,
+    viewport: tuple[int, int] = (1920, 1080),
+    frames: int = 60,
+    ticks: int = 1,
+    per_tile: bool = False,
+) -> EditorBenchReport:
+    """Set up a city and an editor view, then benchmark its renderer."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    context = create_headless_context()
+    if city:
+        load_city(context, city)
+    else:
+        generate_city(context, seed)
+
+    view = create_editor_view(context)
+    view.bigtiles = load_xpm_surface("tiles.png") or load_big_tiles_surface()
+    if per_tile:
+        view.tiles = view.tiles.tolist()
+    renderer = MapRenderer(context, view, viewport_size=viewport)
+
+    report = EditorBenchReport(
+        viewport=renderer.viewport_size_px, per_tile=per_tile
+    )
+    report.frames = run_frames(context, renderer, frames, ticks)
+    return report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="micropolis-editor-bench",
+        description="Measure editor view frame times without a display.",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--city", default="", help="City file to load (path or name in cities/)"
+    )
+    source.add_argument(
+        "--seed", type=int, default=None, help="Seed for a generated city"
+    )
+    parser.add_argument("--width", type=int, default=1920, help="Viewport width")
+    parser.add_argument("--height", type=int, default=1080, help="Viewport height")
+    parser.add_argument(
+        "--frames", type=int, default=60, help="Frames per frame kind"
+    )
+    parser.add_argument(
+        "--ticks", type=int, default=1, help="Simulation ticks between sim frames"
+    )
+    parser.add_argument(
+        "--per-tile",
+        action="store_true",
+        help="Use the per-tile render loop instead of the vectorized diff",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the report as JSON"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command-line entry point for the editor frame benchmark."""
+    args = build_parser().parse_args(argv)
+    if args.frames < 1 or args.ticks < 0:
+        logger.error("--frames must be positive and --ticks not negative")
+        return 2
+    try:
+        report = run(
+            city=args.city,
+            seed=args.seed,
+            viewport=(args.width, args.height),
+            frames=args.frames,
+            ticks=args.ticks,
+            per_tile=args.per_tile,
+        )
+    except (FileNotFoundError, ValueError) as exc:
+        logger.error(str(exc))
+        return 1
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,20 +6,29 @@ This module implements the editor view rendering system, displaying detailed
 
 Key features:
 - 16x16 pixel tile rendering (big tiles)
-- Tile caching to avoid redrawing unchanged tiles
+- Tile caching to avoid redrawing unchanged tiles: without a dynamic
+  filter, the visible window is resolved in one vectorized pass and compared
+  with the per-view cache, so only tiles whose rendered index changed
+  (edits, growth, blinking lightning bolts) are blitted
 - Blinking lightning bolt animation for unpowered zones
 - Dynamic filtering based on city data criteria
 - Support for different color depths and rendering modes
 """
 
+import numpy as np
 import pygame
 from result import Ok, Result
 
 from .constants import WORLD_X, WORLD_Y
 from .context import AppContext
-from .graphics_setup import get_tile_surface, resolve_tile_for_render
+from .graphics_setup import (
+    get_tile_surface,
+    resolve_tile_for_render,
+    resolve_tiles_for_render,
+)
 from .map_view import dynamicFilter
 from .sim_view import SimView
+from .tile_map import SHORT_DTYPE, ArrayGrid, fill_grid, tile_array
 
 # ============================================================================
 # Editor View Rendering Functions
@@ -45,7 +54,7 @@ def mem_draw_beeg_map_rect(
     y: int,
     w: int,
     h: int,
-) -> None:
+) -> int:
     """
     ported from MemDrawBeegMapRect
     Draw a rectangle of tiles in the editor view using memory buffer.
@@ -57,29 +66,36 @@ def mem_draw_beeg_map_rect(
         view: The editor view to draw into
         x, y: Top-left tile coordinates
         w, h: Width and height in tiles
+
+    Returns:
+        Number of tiles redrawn
     """
     # Clip to view boundaries
     if x < view.tile_x:
         w -= view.tile_x - x
         if w <= 0:
-            return
+            return 0
         x = view.tile_x
 
     if y < view.tile_y:
         h -= view.tile_y - y
         if h <= 0:
-            return
+            return 0
         y = view.tile_y
 
     if (x + w) > (view.tile_x + view.tile_width):
         w = (view.tile_x + view.tile_width) - x
         if w <= 0:
-            return
+            return 0
 
     if (y + h) > (view.tile_y + view.tile_height):
         h = (view.tile_y + view.tile_height) - y
         if h <= 0:
-            return
+            return 0
+
+    drawn = _draw_changed_tiles(context, view, x, y, w, h)
+    if drawn is not None:
+        return drawn
 
     # Get display properties
     line_bytes = view.line_bytes
@@ -88,10 +104,62 @@ def mem_draw_beeg_map_rect(
     # Check if we have color display
     if view.x and view.x.color:
         # Color rendering mode
-        _draw_color_editor_rect(context, view, x, y, w, h, line_bytes, pixel_bytes)
-    else:
-        # Monochrome rendering mode
-        _draw_mono_editor_rect(context, view, x, y, w, h, line_bytes)
+        return _draw_color_editor_rect(
+            context, view, x, y, w, h, line_bytes, pixel_bytes
+        )
+    # Monochrome rendering mode
+    return _draw_mono_editor_rect(context, view, x, y, w, h, line_bytes)
+
+
+def _draw_changed_tiles(
+    context: AppContext, view: SimView, x: int, y: int, w: int, h: int
+) -> int | None:
+    """
+    Redraw only the tiles of a clipped rectangle whose rendered index changed.
+
+    Resolves the whole rectangle with resolve_tiles_for_render and compares
+    it with the view's tile cache in one pass. Returns None, drawing
+    nothing, when that is not possible (dynamic filter active, or a tile
+    cache or map that is not array-backed); the caller then falls back to
+    the per-tile loop.
+
+    Args:
+        x, y: Top-left tile coordinates, already clipped to the view
+        w, h: Width and height in tiles
+    """
+    have = view.tiles
+    if view.dynamic_filter != 0 or not isinstance(have, ArrayGrid):
+        return None
+    if not isinstance(context.map_data, ArrayGrid):
+        return None
+    surface = ensure_view_surface(view)
+    if surface is None:
+        return 0
+
+    resolved = resolve_tiles_for_render(
+        tile_array(context.map_data)[x : x + w, y : y + h],
+        context.flag_blink <= 0,
+    )
+    local_x = x - view.tile_x
+    local_y = y - view.tile_y
+    cached = have.array[local_x : local_x + w, local_y : local_y + h]
+    if cached.shape != resolved.shape:
+        return None
+    cols, rows = np.nonzero(resolved != cached)
+    if not cols.size:
+        return 0
+    tiles = resolved[cols, rows]
+    cached[cols, rows] = tiles
+
+    blits = []
+    for col, row, tile in zip(
+        (cols + local_x).tolist(), (rows + local_y).tolist(), tiles.tolist()
+    ):
+        tile_surface = get_tile_surface(tile, view)
+        if tile_surface is not None:
+            blits.append((tile_surface, (col * 16, row * 16)))
+    surface.blits(blits, doreturn=False)
+    return len(tiles)
 
 
 def _draw_color_editor_rect(
@@ -103,7 +171,7 @@ def _draw_color_editor_rect(
     h: int,
     line_bytes: int,
     pixel_bytes: int,
-) -> None:
+) -> int:
     """
     Draw editor rectangle in color mode.
 
@@ -116,11 +184,12 @@ def _draw_color_editor_rect(
     """
     surface = ensure_view_surface(view)
     if surface is None:
-        return
+        return 0
 
     have = view.tiles
     blink = context.flag_blink <= 0
     overlay_filter = dynamicFilter if view.dynamic_filter != 0 else None
+    drawn = 0
 
     for col in range(w):
         tile_x = x + col
@@ -149,11 +218,14 @@ def _draw_color_editor_rect(
             dest_x = local_col * 16
             dest_y = local_row * 16
             _blit_tile(view, resolved_tile, dest_x, dest_y)
+            drawn += 1
+
+    return drawn
 
 
 def _draw_mono_editor_rect(
     context: AppContext, view: SimView, x: int, y: int, w: int, h: int, line_bytes: int
-) -> None:
+) -> int:
     """
     Draw editor rectangle in monochrome mode.
 
@@ -166,11 +238,12 @@ def _draw_mono_editor_rect(
     """
     surface = ensure_view_surface(view)
     if surface is None:
-        return
+        return 0
 
     have = view.tiles
     blink = context.flag_blink <= 0
     overlay_filter = dynamicFilter if view.dynamic_filter != 0 else None
+    drawn = 0
 
     for col in range(w):
         tile_x = x + col
@@ -199,6 +272,9 @@ def _draw_mono_editor_rect(
             dest_x = local_col * 16
             dest_y = local_row * 16
             _blit_tile(view, resolved_tile, dest_x, dest_y)
+            drawn += 1
+
+    return drawn
 
 
 def _blit_tile(view: SimView, tile: int, dest_x: int, dest_y: int) -> None:
@@ -351,9 +427,8 @@ def initialize_editor_tiles(view: SimView) -> Result[None, Exception]:
 
     # Initialize tile cache as 2D array
     # view.tiles is short **tiles in C (array of arrays)
-    view.tiles = []
-    for i in range(view.tile_width):
-        view.tiles.append([-1] * view.tile_height)  # -1 indicates uninitialized
+    view.tiles = ArrayGrid(view.tile_width, view.tile_height, SHORT_DTYPE)
+    view.tiles.fill(-1)  # -1 indicates uninitialized
     ensure_view_surface(view)
     return Ok(None)
 
@@ -382,9 +457,7 @@ def invalidate_editor_view(view: SimView) -> None:
         view.invalid = True
         # Reset tile cache to force redraw
         if view.tiles:
-            for col in view.tiles:
-                for i in range(len(col)):
-                    col[i] = -1
+            fill_grid(view.tiles, -1)
 
 
 def ensure_view_surface(view: SimView) -> pygame.Surface:
@@ -26,6 +26,7 @@ from .audio import initialize_sound
 from .constants import (
     ALMAP,
     COMAP,
+    COMBASE,
     CRMAP,
     DEFAULT_STARTING_FUNDS,
     DIRT,
@@ -33,6 +34,7 @@ from .constants import (
     EDITOR_H,
     EDITOR_W,
     FIMAP,
+    INDBASE,
     INMAP,
     LVMAP,
     MAP_H,
@@ -42,6 +44,7 @@ from .constants import (
     PDMAP,
     PLMAP,
     POMAP,
+    POWERBASE,
     PRMAP,
     RDMAP,
     REMAP,
@@ -458,6 +461,25 @@ def initialize_view_surfaces(context: AppContext) -> Result[None, Exception]:
     return Ok(None)
 
 
+def _scaled_minimap(view, size: tuple[int, int]) -> pygame.Surface:
+    """Smoothscale the map view into the minimap area.
+
+    The last result is kept on the view and reused until the view is
+    redrawn (``view.updates`` changes) or the minimap area is resized.
+    """
+    scaled = view.minimap_surface
+    if (
+        scaled is not None
+        and view.minimap_updates == view.updates
+        and scaled.get_size() == size
+    ):
+        return scaled
+    scaled = pygame.transform.smoothscale(view.surface, size)
+    view.minimap_surface = scaled
+    view.minimap_updates = view.updates
+    return scaled
+
+
 def blit_views_to_screen(
     context: AppContext,
     screen,
@@ -468,15 +490,11 @@ def blit_views_to_screen(
 
     screen.fill((16, 32, 16))
 
-    map_surface = None
-    if context.sim and context.sim.map:
-        map_surface = getattr(context.sim.map, "surface", None)
-    if map_surface is not None:
+    map_view = context.sim.map if context.sim else None
+    if map_view is not None and getattr(map_view, "surface", None) is not None:
         try:
             # Only blit to minimap, let EditorPanel handle the main view
-            mini_scaled = pygame.transform.smoothscale(
-                map_surface, (minimap_area[2], minimap_area[3])
-            )
+            mini_scaled = _scaled_minimap(map_view, (minimap_area[2], minimap_area[3]))
             screen.blit(mini_scaled, (minimap_area[0], minimap_area[1]))
             pygame.draw.rect(
                 screen,
@@ -728,6 +746,7 @@ def sim_update(context: AppContext) -> Result[None, Exception]:
     sim_update_evaluations(context)
 
     UpdateFlush()
+    context.flush_state_contract()
 
     return Ok(None)
 
@@ -1246,6 +1265,7 @@ def DoUpdateMap(context: AppContext, view) -> bool:
         return False
 
     MemDrawMap(context, view)
+    view.updates += 1
     view.invalid = False
     return True
 
@@ -1517,10 +1537,10 @@ def pygame_main_loop(context: AppContext) -> Result[None, Exception]:
             minimap_size,
         )
         tool_hotkeys = {
-            pygame.K_r: context.RESBASE,
-            pygame.K_c: context.COMBASE,
-            pygame.K_i: context.INDBASE,
-            pygame.K_p: context.POWERBASE,
+            pygame.K_r: RESBASE,
+            pygame.K_c: COMBASE,
+            pygame.K_i: INDBASE,
+            pygame.K_p: POWERBASE,
         }
 
         ensure_sim_structures()
@@ -1682,6 +1702,8 @@ def pygame_main_loop(context: AppContext) -> Result[None, Exception]:
 
                 # Update simulation step and redraw
                 sim_loop(context, True)
+                # Settle batched state before anything reads it this frame.
+                context.flush_state_contract()
                 blit_views_to_screen(context, screen, map_area, minimap_rect)
 
                 # Render panels if PanelManager is active
@@ -10,6 +10,8 @@ import os
 import struct
 import sys
 
+import numpy as np
+
 from micropolis.constants import HISTLEN, MISCHISTLEN, WORLD_X, WORLD_Y
 from micropolis.context import AppContext
 from micropolis.engine import (
@@ -21,6 +23,7 @@ from micropolis.engine import (
 )
 from micropolis.initialization import InitWillStuff
 from micropolis.simulation import do_sim_init
+from micropolis.tile_map import TILE_DTYPE, store_tile_array, tile_array
 from micropolis.ui_utilities import eval_cmd_str, set_city_name, set_funds, set_game_level
 from micropolis.updates import UpdateFunds
 
@@ -76,6 +79,40 @@ def _half_swap_longs(buf: list, length: int) -> None:
         buf[i] = ((long_val & 0x0000FFFF) << 16) | ((long_val & 0xFFFF0000) >> 16)
 
 
+def _get_misc_long(misc_his: list, index: int) -> int:
+    """
+    Read a long stored half-swapped in MiscHis[index] and MiscHis[index + 1].
+
+    Args:
+        misc_his: MiscHis shorts
+        index: Position of the first short
+
+    Returns:
+        Signed 32-bit value
+    """
+    buf = [(misc_his[index] & 0xFFFF) | ((misc_his[index + 1] & 0xFFFF) << 16)]
+    _half_swap_longs(buf, 1)
+    value = buf[0]
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+def _set_misc_long(misc_his: list, index: int, value: int) -> None:
+    """
+    Store a long half-swapped in MiscHis[index] and MiscHis[index + 1].
+
+    The inverse of ``_get_misc_long``.
+
+    Args:
+        misc_his: MiscHis shorts
+        index: Position of the first short
+        value: Signed 32-bit value
+    """
+    buf = [value & 0xFFFFFFFF]
+    _half_swap_longs(buf, 1)
+    misc_his[index] = buf[0] & 0xFFFF
+    misc_his[index + 1] = (buf[0] >> 16) & 0xFFFF
+
+
 # ============================================================================
 # File I/O Helper Functions
 # ============================================================================
@@ -153,20 +190,15 @@ def _save_short(buf: list, length: int, file_obj) -> bool:
         True on success, False on failure
     """
     try:
-        # Convert to Mac endianness (big-endian)
-        _swap_shorts(buf, length)
-
-        # Pack as big-endian unsigned shorts
-        data = struct.pack(f">{length}H", *buf[:length])
+        # Pack as big-endian (Mac) unsigned shorts, the order _load_short
+        # reads back
+        data = struct.pack(f">{length}H", *(v & 0xFFFF for v in buf[:length]))
 
         # Write to file
         if file_obj.write(data) != len(data):
             print(f"_save_short: write failed, expected {len(data)} bytes")
             return False
 
-        # Convert back to intel endianness
-        _swap_shorts(buf, length)
-
         return True
     except (struct.error, OSError):
         return False
@@ -185,19 +217,13 @@ def _save_long(buf: list, length: int, file_obj) -> bool:
         True on success, False on failure
     """
     try:
-        # Convert to Mac endianness (big-endian)
-        _swap_longs(buf, length)
-
-        # Pack as big-endian longs
-        data = struct.pack(f">{length}l", *buf)
+        # Pack as big-endian (Mac) longs, the order _load_long reads back
+        data = struct.pack(f">{length}l", *buf[:length])
 
         # Write to file
         if file_obj.write(data) != len(data):
             return False
 
-        # Convert back to intel endianness
-        _swap_longs(buf, length)
-
         return True
     except (struct.error, OSError):
         return False
@@ -258,11 +284,8 @@ def _load_file(context: AppContext, filename: str, directory: str | None = None)
                 return False
 
             # Convert flat array to 2D map
-            for x in range(WORLD_X):
-                for y in range(WORLD_Y):
-                    context.map_data[x][y] = map_data[
-                        x * WORLD_Y + y
-                    ]
+            tiles = np.array(map_data, dtype=TILE_DTYPE).reshape(WORLD_X, WORLD_Y)
+            store_tile_array(context.map_data, tiles)
 
             return True
 
@@ -284,17 +307,14 @@ def loadFile(context: AppContext, filename: str) -> int:
     if not _load_file(context, filename, None):
         return 0
 
+    # Reset the budget before the saved values below override it
+    InitFundingLevel(context)
+
     # Extract total funds from MiscHis (stored as two shorts at positions 50-51)
-    total_funds = context.misc_his[50] | (context.misc_his[51] << 16)
-    total_funds_buf = [total_funds]
-    _half_swap_longs(total_funds_buf, 1)
-    context.total_funds = total_funds_buf[0]
+    context.total_funds = _get_misc_long(context.misc_his, 50)
 
-    # Extract city time from MiscHis (position 8)
-    city_time = context.misc_his[8]
-    city_time_buf = [city_time]
-    _half_swap_longs(city_time_buf, 1)
-    context.city_time = city_time_buf[0]
+    # Extract city time from MiscHis (positions 8-9)
+    context.city_time = _get_misc_long(context.misc_his, 8)
 
     # Extract game settings from MiscHis
     context.auto_bulldoze = context.misc_his[52]  # Auto bulldoze flag
@@ -305,20 +325,9 @@ def loadFile(context: AppContext, filename: str) -> int:
     context.sim_speed = context.misc_his[57]  # Simulation speed
 
     # Extract budget percentages (stored as fixed-point values)
-    police_pct = context.misc_his[58] | (context.misc_his[59] << 16)
-    police_pct_buf = [police_pct]
-    _half_swap_longs(police_pct_buf, 1)
-    context.police_percent = police_pct_buf[0] / 65536.0
-
-    fire_pct = context.misc_his[60] | (context.misc_his[61] << 16)
-    fire_pct_buf = [fire_pct]
-    _half_swap_longs(fire_pct_buf, 1)
-    context.fire_percent = fire_pct_buf[0] / 65536.0
-
-    road_pct = context.misc_his[62] | (context.misc_his[63] << 16)
-    road_pct_buf = [road_pct]
-    _half_swap_longs(road_pct_buf, 1)
-    context.road_percent = road_pct_buf[0] / 65536.0
+    context.police_percent = _get_misc_long(context.misc_his, 58) / 65536.0
+    context.fire_percent = _get_misc_long(context.misc_his, 60) / 65536.0
+    context.road_percent = _get_misc_long(context.misc_his, 62) / 65536.0
 
     # Validate and clamp values
     if context.city_time < 0:
@@ -332,8 +341,7 @@ def loadFile(context: AppContext, filename: str) -> int:
     setSpeed(context, context.sim_speed)
     setSkips(context, 0)
 
-    # Initialize funding and evaluation
-    InitFundingLevel(context)
+    # Initialize evaluation
     InitWillStuff(context)
     context.scenario_id = 0
     context.init_sim_load = 1
@@ -364,15 +372,10 @@ def saveFile(context: AppContext, filename: str) -> int:
     try:
         with open(filename, "wb") as f:
             # Store total funds in MiscHis (positions 50-51)
-            total_funds = context.total_funds
-            _half_swap_longs([total_funds], 1)
-            context.misc_his[50] = total_funds & 0xFFFF
-            context.misc_his[51] = (total_funds >> 16) & 0xFFFF
+            _set_misc_long(context.misc_his, 50, context.total_funds)
 
-            # Store city time in MiscHis (position 8)
-            city_time = context.city_time
-            _half_swap_longs([city_time], 1)
-            context.misc_his[8] = city_time & 0xFFFF
+            # Store city time in MiscHis (positions 8-9)
+            _set_misc_long(context.misc_his, 8, context.city_time)
 
             # Store game settings in MiscHis
             context.misc_his[52] = context.auto_bulldoze
@@ -383,26 +386,12 @@ def saveFile(context: AppContext, filename: str) -> int:
             context.misc_his[56] = context.city_tax
 
             # Store budget percentages as fixed-point values
-            police_pct = int(context.police_percent * 65536)
-            _half_swap_longs([police_pct], 1)
-            context.misc_his[58] = police_pct & 0xFFFF
-            context.misc_his[59] = (police_pct >> 16) & 0xFFFF
-
-            fire_pct = int(context.fire_percent * 65536)
-            _half_swap_longs([fire_pct], 1)
-            context.misc_his[60] = fire_pct & 0xFFFF
-            context.misc_his[61] = (fire_pct >> 16) & 0xFFFF
-
-            road_pct = int(context.road_percent * 65536)
-            _half_swap_longs([road_pct], 1)
-            context.misc_his[62] = road_pct & 0xFFFF
-            context.misc_his[63] = (road_pct >> 16) & 0xFFFF
+            _set_misc_long(context.misc_his, 58, int(context.police_percent * 65536))
+            _set_misc_long(context.misc_his, 60, int(context.fire_percent * 65536))
+            _set_misc_long(context.misc_his, 62, int(context.road_percent * 65536))
 
             # Convert 2D map to flat array for saving
-            map_data = []
-            for x in range(WORLD_X):
-                for y in range(WORLD_Y):
-                    map_data.append(context.map_data[x][y])
+            map_data = tile_array(context.map_data).ravel().tolist()
 
             # Save all data sections
             if not _save_short(context.res_his, HISTLEN // 2, f):
@@ -7,9 +7,11 @@ structures, adapted from g_setup.c for pygame instead of X11/TCL-Tk.
 
 from collections import OrderedDict
 from collections.abc import Callable, Sequence
+from math import ceil
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pygame
 
 from micropolis.asset_manager import get_asset_path
@@ -58,6 +60,8 @@ _TILE_VARIANT_CACHE: OrderedDict[
     tuple[int, tuple[int, int, int, int], str], pygame.Surface
 ] = OrderedDict()
 _VARIANT_CACHE_LIMIT = 256
+# Tile sizes (zoom levels) each TileAtlas keeps scaled sheets for
+_ATLAS_SIZE_LIMIT = 4
 
 
 # ============================================================================
@@ -747,6 +751,21 @@ def resolve_tile_for_render(
     return _normalize_tile_index(tile_index)
 
 
+def resolve_tiles_for_render(tiles: np.ndarray, blink: bool) -> np.ndarray:
+    """Vectorized resolve_tile_for_render for an array of raw tile values.
+
+    Covers the unfiltered case only; callers with a dynamic overlay filter
+    must resolve tile by tile.
+    """
+    values = tiles.astype(np.int32)
+    index = values & LOMASK
+    index = np.where(index >= TILE_COUNT, (values - TILE_COUNT) & LOMASK, index)
+    if blink:
+        unpowered = (values & (ZONEBIT | PWRBIT)) == ZONEBIT
+        index[unpowered] = LIGHTNINGBOLT
+    return index % TILE_COUNT
+
+
 def get_tile_surface(
     tile_id: int,
     view: Any,
@@ -1150,6 +1169,145 @@ def get_object_surface(
     return None
 
 
+# ============================================================================
+# Pre-scaled Tile Atlas
+# ============================================================================
+
+
+class TileAtlas:
+    """A tile sheet pre-scaled to each tile size it is drawn at.
+
+    Scaled sheets keep the source layout, so tile ``n`` sits at the same
+    column and row at every size. A size is built the first time it is
+    requested by smoothscaling each tile on its own, exactly as scaling at
+    draw time did, so neighbouring tiles never bleed into each other. Only
+    the ``max_sizes`` most recently used sizes are kept.
+    """
+
+    def __init__(
+        self,
+        sheet: pygame.Surface,
+        source_size: int,
+        *,
+        max_sizes: int = _ATLAS_SIZE_LIMIT,
+    ) -> None:
+        self.source = sheet
+        self.source_size = source_size
+        self.max_sizes = max(1, max_sizes)
+        self.tiles_per_row = max(1, sheet.get_width() // source_size)
+        self.tile_count = min(
+            TILE_COUNT, self.tiles_per_row * (sheet.get_height() // source_size)
+        )
+        self._sheets: OrderedDict[
+            int, tuple[pygame.Surface, list[pygame.Surface]]
+        ] = OrderedDict()
+        self._pixels: dict[int, np.ndarray] = {}
+
+    @property
+    def sizes(self) -> tuple[int, ...]:
+        """Tile sizes currently held, least recently used first."""
+        return tuple(self._sheets)
+
+    def sheet(self, tile_size: int) -> pygame.Surface:
+        """The whole sheet at ``tile_size``, for blits with ``tile_rect``."""
+        return self._entry(tile_size)[0]
+
+    def tile(self, tile_index: int, tile_size: int) -> pygame.Surface | None:
+        """One tile at ``tile_size`` (a subsurface of the scaled sheet)."""
+        tiles = self._entry(tile_size)[1]
+        tile_index = _normalize_tile_index(tile_index)
+        return tiles[tile_index] if tile_index < len(tiles) else None
+
+    def pixels(self, tile_size: int) -> np.ndarray:
+        """RGB pixels of every tile at ``tile_size``, as ``[tile, x, y, rgb]``.
+
+        Has ``TILE_COUNT`` entries; tiles missing from the sheet are black.
+        """
+        sheet = self.sheet(tile_size)
+        cached = self._pixels.get(tile_size)
+        if cached is None:
+            columns = self.tiles_per_row
+            rows = ceil(self.tile_count / columns)
+            array = pygame.surfarray.array3d(sheet)
+            array = array[: columns * tile_size, : rows * tile_size]
+            blocks = array.reshape(columns, tile_size, rows, tile_size, 3)
+            blocks = blocks.transpose(2, 0, 1, 3, 4)
+            blocks = blocks.reshape(-1, tile_size, tile_size, 3)
+            cached = np.zeros((TILE_COUNT, tile_size, tile_size, 3), dtype=np.uint8)
+            cached[: self.tile_count] = blocks[: self.tile_count]
+            self._pixels[tile_size] = cached
+        return cached
+
+    def tile_rect(self, tile_index: int, tile_size: int) -> pygame.Rect:
+        row, col = divmod(_normalize_tile_index(tile_index), self.tiles_per_row)
+        return pygame.Rect(col * tile_size, row * tile_size, tile_size, tile_size)
+
+    def _entry(self, tile_size: int) -> tuple[pygame.Surface, list[pygame.Surface]]:
+        if tile_size <= 0:
+            raise ValueError("tile_size must be positive")
+        entry = self._sheets.get(tile_size)
+        if entry is not None:
+            self._sheets.move_to_end(tile_size)
+            return entry
+
+        sheet = self.source
+        if tile_size != self.source_size:
+            sheet = self._scale_sheet(tile_size)
+        tiles = [
+            sheet.subsurface(self.tile_rect(index, tile_size))
+            for index in range(self.tile_count)
+        ]
+        entry = (sheet, tiles)
+        self._sheets[tile_size] = entry
+        while len(self._sheets) > self.max_sizes:
+            evicted, _ = self._sheets.popitem(last=False)
+            self._pixels.pop(evicted, None)
+        return entry
+
+    def _scale_sheet(self, tile_size: int) -> pygame.Surface:
+        rows = ceil(self.tile_count / self.tiles_per_row)
+        sheet = pygame.Surface(
+            (self.tiles_per_row * tile_size, rows * tile_size), pygame.SRCALPHA
+        )
+        size = (tile_size, tile_size)
+        for index in range(self.tile_count):
+            tile = self.source.subsurface(self.tile_rect(index, self.source_size))
+            # RGBA_MAX onto the cleared sheet copies pixels, alpha included.
+            sheet.blit(
+                pygame.transform.smoothscale(tile, size),
+                self.tile_rect(index, tile_size),
+                special_flags=pygame.BLEND_RGBA_MAX,
+            )
+        return sheet
+
+
+def get_tile_atlas(view: Any, *, small: bool = False) -> TileAtlas | None:
+    """
+    Return the view's tile atlas, for its 16×16 tiles or its 4×4 small tiles.
+
+    The atlas is kept on the view and rebuilt if the view's sheet changes.
+
+    Args:
+        view: View holding the tile sheet
+        small: Use the small (map/minimap) tiles instead of the big ones
+
+    Returns:
+        TileAtlas, or None if the view has no sheet loaded
+    """
+    if small:
+        sheet, source_size, attr = _get_small_tile_sheet(view), 4, "_small_tile_atlas"
+    else:
+        sheet, source_size, attr = _get_big_tile_sheet(view), 16, "_big_tile_atlas"
+    if sheet is None:
+        return None
+
+    atlas = getattr(view, attr, None)
+    if not isinstance(atlas, TileAtlas) or atlas.source is not sheet:
+        atlas = TileAtlas(sheet, source_size)
+        setattr(view, attr, atlas)
+    return atlas
+
+
 # ============================================================================
 # Validation Functions
 # ============================================================================
@@ -6,26 +6,28 @@ responsible for displaying historical data graphs for population, money,
 pollution, crime, and other city statistics.
 """
 
-import pygame
+from importlib import import_module
 
-# Expose a module-level flag so tests can patch "PYGAME_AVAILABLE" reliably.
-PYGAME_AVAILABLE: bool = pygame is not None
+import pygame
 
-from importlib import import_module
+from micropolis.census_history import MONTHS, SPAN, YEARS, HistorySeries
 from micropolis.constants import (
     ALL_HISTORIES,
-    HIST_NAMES,
+    COM_HIST,
+    CRIME_HIST,
     HIST_COLORS,
+    HIST_NAMES,
     HISTORIES,
-    RES_HIST,
-    COM_HIST,
     IND_HIST,
     MONEY_HIST,
-    CRIME_HIST,
     POLLUTION_HIST,
+    RES_HIST,
 )
 from micropolis.context import AppContext
 
+# Expose a module-level flag so tests can patch "PYGAME_AVAILABLE" reliably.
+PYGAME_AVAILABLE: bool = pygame is not None
+
 
 # ============================================================================
 # Graph History Data
@@ -489,6 +491,21 @@ def draw_month(hist: list[int], dest: list[int], scale: float) -> None:
         dest[119 - x] = val  # Reverse order for display
 
 
+def _draw_series(
+    series: HistorySeries, half: int, dest: list[int], scale: float
+) -> None:
+    """
+    draw_month over one half of a census series, vectorized.
+
+    Full-size destination rows are replaced with the series' cached scaled
+    values; anything else goes through draw_month.
+    """
+    if len(dest) == SPAN:
+        dest[:] = series.scaled(half, scale)
+    else:
+        draw_month(series.half(half).tolist(), dest, scale)
+
+
 def do_all_graphs(context: AppContext) -> None:
     """
     Update all graph history data.
@@ -509,14 +526,16 @@ def do_all_graphs(context: AppContext) -> None:
     scale_value = 128.0 / context.all_max if context.all_max else 1.0
 
     # Scale 10-year view data
-    draw_month(context.res_his, context.history_10[RES_HIST], scale_value)
-    draw_month(context.com_his, context.history_10[COM_HIST], scale_value)
-    draw_month(context.ind_his, context.history_10[IND_HIST], scale_value)
+    _draw_series(context.res_his, MONTHS, context.history_10[RES_HIST], scale_value)
+    _draw_series(context.com_his, MONTHS, context.history_10[COM_HIST], scale_value)
+    _draw_series(context.ind_his, MONTHS, context.history_10[IND_HIST], scale_value)
 
     # Money, crime, pollution don't get scaled
-    draw_month(context.money_his, context.history_10[MONEY_HIST], 1.0)
-    draw_month(context.crime_his, context.history_10[CRIME_HIST], 1.0)
-    draw_month(context.pollution_his, context.history_10[POLLUTION_HIST], 1.0)
+    _draw_series(context.money_his, MONTHS, context.history_10[MONEY_HIST], 1.0)
+    _draw_series(context.crime_his, MONTHS, context.history_10[CRIME_HIST], 1.0)
+    _draw_series(
+        context.pollution_his, MONTHS, context.history_10[POLLUTION_HIST], 1.0
+    )
 
     # Calculate scaling for 120-year view
     context.all_max = max(
@@ -527,56 +546,17 @@ def do_all_graphs(context: AppContext) -> None:
 
     scale_value = 128.0 / context.all_max if context.all_max else 1.0
 
-    # Scale 120-year view data (using months 120-239 from history)
-    res_120 = (
-        context.res_his[120:240]
-        if len(context.res_his) > 240
-        else context.res_his[120:]
-    )
-    com_120 = (
-        context.com_his[120:240]
-        if len(context.com_his) > 240
-        else context.com_his[120:]
-    )
-    ind_120 = (
-        context.ind_his[120:240]
-        if len(context.ind_his) > 240
-        else context.ind_his[120:]
-    )
-
-    # Pad with zeros if necessary
-    res_120.extend([0] * (120 - len(res_120)))
-    com_120.extend([0] * (120 - len(com_120)))
-    ind_120.extend([0] * (120 - len(ind_120)))
-
-    draw_month(res_120, context.history_120[RES_HIST], scale_value)
-    draw_month(com_120, context.history_120[COM_HIST], scale_value)
-    draw_month(ind_120, context.history_120[IND_HIST], scale_value)
+    # Scale 120-year view data (months 120-239 of each history)
+    _draw_series(context.res_his, YEARS, context.history_120[RES_HIST], scale_value)
+    _draw_series(context.com_his, YEARS, context.history_120[COM_HIST], scale_value)
+    _draw_series(context.ind_his, YEARS, context.history_120[IND_HIST], scale_value)
 
     # Money, crime, pollution for 120-year view
-    money_120 = (
-        context.money_his[120:240]
-        if len(context.money_his) > 240
-        else context.money_his[120:]
+    _draw_series(context.money_his, YEARS, context.history_120[MONEY_HIST], 1.0)
+    _draw_series(context.crime_his, YEARS, context.history_120[CRIME_HIST], 1.0)
+    _draw_series(
+        context.pollution_his, YEARS, context.history_120[POLLUTION_HIST], 1.0
     )
-    crime_120 = (
-        context.crime_his[120:240]
-        if len(context.crime_his) > 240
-        else context.crime_his[120:]
-    )
-    pollution_120 = (
-        context.pollution_his[120:240]
-        if len(context.pollution_his) > 240
-        else context.pollution_his[120:]
-    )
-
-    money_120.extend([0] * (120 - len(money_120)))
-    crime_120.extend([0] * (120 - len(crime_120)))
-    pollution_120.extend([0] * (120 - len(pollution_120)))
-
-    draw_month(money_120, context.history_120[MONEY_HIST], 1.0)
-    draw_month(crime_120, context.history_120[CRIME_HIST], 1.0)
-    draw_month(pollution_120, context.history_120[POLLUTION_HIST], 1.0)
 
 
 # ============================================================================
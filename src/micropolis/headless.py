@@ -0,0 +1,326 @@
+"""
+headless.py - Run the simulation without any pygame views
+
+``engine.sim_loop`` always follows a simulation step with ``sim_update``,
+which redraws editors, maps, graphs, budgets and evaluations. This module
+drives ``simulation.simulate`` directly instead, so a city can be advanced by
+a number of simulated months on a machine with no display and the engine's
+throughput measured on its own.
+
+Usage:
+    python -m micropolis.headless --city haight --months 12
+    python -m micropolis.headless --seed 1234 --months 24 --benchmark --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from . import simulation
+from .allocation import init_map_arrays
+from .app_config import AppConfig
+from .context import AppContext
+from .file_io import loadFile
+from .generation import GenerateNewCity, GenerateSomeCity
+from .sim import Sim
+
+logger = logging.getLogger(__name__)
+
+# Bundled scenario and sample cities live at the project root.
+CITIES_DIR = Path(__file__).resolve().parents[2] / "cities"
+
+# Census values reported at the end of a run.
+CENSUS_FIELDS: tuple[str, ...] = (
+    "city_time",
+    "total_funds",
+    "res_pop",
+    "com_pop",
+    "ind_pop",
+    "total_pop",
+    "city_pop",
+    "road_total",
+    "rail_total",
+    "pwrd_z_cnt",
+    "un_pwrd_z_cnt",
+)
+
+
+@dataclass
+class HeadlessConfig:
+    """Options for a headless run.
+
+    ``city`` names a ``.cty`` file (a path, or a name inside ``cities/``);
+    when it is empty a new city is generated, from ``seed`` if one is given.
+    ``profile`` names a file to receive the ``SimProfiler`` output.
+    """
+
+    city: str = ""
+    seed: int | None = None
+    months: int = 12
+    sim_speed: int | None = None
+    profile: str | None = None
+
+
+@dataclass
+class HeadlessReport:
+    """Throughput, per-phase timings and final census of a headless run."""
+
+    months: int = 0
+    ticks: int = 0
+    elapsed: float = 0.0
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    phase_calls: dict[str, int] = field(default_factory=dict)
+    census: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def months_per_second(self) -> float:
+        return self.months / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def years_per_second(self) -> float:
+        return self.months_per_second / 12
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the report, including derived rates, as plain data."""
+        data = asdict(self)
+        data["ticks_per_second"] = self.ticks_per_second
+        data["months_per_second"] = self.months_per_second
+        data["years_per_second"] = self.years_per_second
+        return data
+
+    def format(self, benchmark: bool = False) -> str:
+        """Render the report as human-readable text."""
+        lines = [
+            f"{self.months} months ({self.ticks} ticks) in {self.elapsed:.3f}s",
+            f"  {self.ticks_per_second:.1f} ticks/s, "
+            f"{self.months_per_second:.2f} months/s, "
+            f"{self.years_per_second:.3f} years/s",
+        ]
+        if benchmark:
+            lines.append("phases:")
+            for name, seconds in sorted(
+                self.phase_seconds.items(), key=lambda item: -item[1]
+            ):
+                calls = self.phase_calls.get(name, 0)
+                share = seconds / self.elapsed * 100 if self.elapsed else 0.0
+                lines.append(
+                    f"  {name:<12} {seconds:9.4f}s {share:5.1f}% ({calls} calls)"
+                )
+        lines.append("census:")
+        lines.extend(f"  {name:<20} {value}" for name, value in self.census.items())
+        return "\n".join(lines)
+
+
+def create_headless_context(config: AppConfig | None = None) -> AppContext:
+    """Build an AppContext with map arrays allocated and no views attached."""
+    context = AppContext(config=config or AppConfig())
+    init_map_arrays(context)
+    # File loading and sprite code expect a Sim, but it never gets views.
+    context.sim = Sim()
+    context.sim.context = context
+    return context
+
+
+def resolve_city_path(city: str) -> Path:
+    """Find a city file by path, or by name inside ``cities/``.
+
+    Raises:
+        FileNotFoundError: If no matching file exists
+    """
+    path = Path(city)
+    candidates = [path]
+    if not path.is_absolute():
+        candidates.append(CITIES_DIR / path)
+        if not path.suffix:
+            candidates.append(CITIES_DIR / path.with_suffix(".cty"))
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    raise FileNotFoundError(f"City file not found: {city}")
+
+
+def load_city(context: AppContext, city: str) -> Path:
+    """Load a ``.cty`` file into ``context`` and initialise the simulation.
+
+    Returns:
+        Path of the file that was loaded
+
+    Raises:
+        FileNotFoundError: If the city cannot be found
+        ValueError: If the file cannot be parsed
+    """
+    path = resolve_city_path(city)
+    if not loadFile(context, str(path)):
+        raise ValueError(f"Unable to load city from file: {path}")
+    simulation.do_sim_init(context)
+    return path
+
+
+def generate_city(context: AppContext, seed: int | None = None) -> None:
+    """Generate a new city in ``context`` and initialise the simulation."""
+    if seed is None:
+        GenerateNewCity(context)
+    else:
+        GenerateSomeCity(context, seed)
+    simulation.do_sim_init(context)
+
+
+def step(context: AppContext) -> int:
+    """Advance the simulation by one tick, ignoring the speed throttle.
+
+    Returns:
+        The ``mod16`` phase that was run
+    """
+    context.fcycle = (context.fcycle + 1) % 1024
+    mod16 = context.fcycle & 15
+    simulation.simulate(context, mod16)
+    return mod16
+
+
+def collect_census(context: AppContext) -> dict[str, int]:
+    """Snapshot the census fields reported by ``HeadlessReport``."""
+    return {name: int(getattr(context, name, 0)) for name in CENSUS_FIELDS}
+
+
+def run_months(
+    context: AppContext,
+    months: int,
+    on_month: Callable[[AppContext, int], None] | None = None,
+) -> HeadlessReport:
+    """Run ``months`` simulated months with no view updates.
+
+    Args:
+        context: Initialised simulation context
+        months: Number of months to simulate
+        on_month: Optional callback invoked with the month number (from 1)
+            once the month's last full map scan is complete
+
+    Phase 0 of every cycle zeroes the census counters that phases 1-8
+    rebuild, so a month that ends on phase 0 would read them all as 0.
+    The census and ``on_month`` are therefore taken after the month's
+    last phase 15, before the following phase 0 clears the counters (and
+    advances ``city_time``).
+
+    Returns:
+        Throughput, per-phase timings and the final census
+    """
+    report = HeadlessReport(months=months)
+    phase_seconds = dict.fromkeys(simulation.PHASE_NAMES, 0.0)
+    phase_calls = dict.fromkeys(simulation.PHASE_NAMES, 0)
+    census = collect_census(context)
+    clock = time.perf_counter
+    started = clock()
+    for month in range(1, months + 1):
+        for remaining in range(simulation.TICKS_PER_MONTH, 0, -1):
+            tick_started = clock()
+            mod16 = step(context)
+            phase = simulation.PHASE_NAMES[mod16]
+            phase_seconds[phase] += clock() - tick_started
+            phase_calls[phase] += 1
+            if mod16 == 15 and remaining <= 16:
+                census = collect_census(context)
+                if on_month is not None:
+                    on_month(context, month)
+    report.elapsed = clock() - started
+    report.ticks = months * simulation.TICKS_PER_MONTH
+    report.phase_seconds = phase_seconds
+    report.phase_calls = phase_calls
+    report.census = census
+    return report
+
+
+def run(config: HeadlessConfig) -> HeadlessReport:
+    """Set up a city as described by ``config`` and simulate it."""
+    context = create_headless_context()
+    if config.city:
+        load_city(context, config.city)
+    else:
+        generate_city(context, config.seed)
+    if config.sim_speed is not None:
+        context.sim_speed = config.sim_speed
+    if config.profile:
+        context.sim_profiler.enable(
+            max(config.months * simulation.TICKS_PER_MONTH, 1)
+        )
+    report = run_months(context, config.months)
+    if config.profile:
+        context.sim_profiler.write(config.profile)
+    return report
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="micropolis-headless",
+        description="Run the Micropolis simulation without a display.",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--city", default="", help="City file to load (path or name in cities/)"
+    )
+    source.add_argument(
+        "--seed", type=int, default=None, help="Seed for a generated city"
+    )
+    parser.add_argument(
+        "--months", type=int, default=12, help="Simulated months to run"
+    )
+    parser.add_argument(
+        "--speed",
+        type=int,
+        choices=range(4),
+        default=None,
+        help="Override the city's simulation speed (affects phase cadence)",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true", help="Include per-phase timings"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the report as JSON"
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="PATH",
+        help="Write per-handler timings (.folded for flamegraph stacks, "
+        "otherwise JSON)",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command-line entry point for headless runs."""
+    args = build_parser().parse_args(argv)
+    if args.months < 0:
+        logger.error("--months must not be negative")
+        return 2
+    config = HeadlessConfig(
+        city=args.city,
+        seed=args.seed,
+        months=args.months,
+        sim_speed=args.speed,
+        profile=args.profile,
+    )
+    try:
+        report = run(config)
+    except (FileNotFoundError, ValueError) as exc:
+        logger.error(str(exc))
+        return 1
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format(benchmark=args.benchmark))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,15 +13,10 @@ from micropolis.allocation import init_map_arrays
 from micropolis.constants import (
     ALMAP,
     DOZE_STATE,
-    HWLDX,
-    HWLDY,
-    QWX,
-    QWY,
-    SM_X,
-    SM_Y,
 )
 from micropolis.context import AppContext
 from micropolis.random import sim_srand, sim_srandom
+from micropolis.tile_map import fill_grid
 
 if TYPE_CHECKING:
     # type-only import to avoid circular import at module import time
@@ -80,6 +75,7 @@ def DestroyAllSprites(context: AppContext) -> None:
         # Clear the sprite list
         context.sim.sprite = None
         context.sim.sprites = 0
+    context.sprite_index.clear()
 
 
 def ResetLastKeys() -> None:
@@ -192,29 +188,27 @@ def InitWillStuff(context: AppContext) -> None:
     context.tax_flag = 0
 
     # Clear overlay arrays
-    for x in range(HWLDX):
-        for y in range(HWLDY):
-            context.pop_density[x][y] = 0
-            context.trf_density[x][y] = 0
-            context.pollution_mem[x][y] = 0
-            context.land_value_mem[x][y] = 0
-            context.crime_mem[x][y] = 0
+    for grid in (
+        context.pop_density,
+        context.trf_density,
+        context.pollution_mem,
+        context.land_value_mem,
+        context.crime_mem,
+    ):
+        fill_grid(grid, 0)
 
     # Clear terrain memory
-    for x in range(QWX):
-        for y in range(QWY):
-            context.terrain_mem[x][y] = 0
+    fill_grid(context.terrain_mem, 0)
 
     # Clear small arrays
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            context.rate_og_mem[x][y] = 0
-            context.fire_rate[x][y] = 0
-            context.com_rate[x][y] = 0
-            context.police_map[x][y] = 0
-            context.police_map_effect[x][y] = 0
-            # Note: FireRate is set twice in original C code, keeping both
-            context.fire_rate[x][y] = 0
+    for grid in (
+        context.rate_og_mem,
+        context.fire_rate,
+        context.com_rate,
+        context.police_map,
+        context.police_map_effect,
+    ):
+        fill_grid(grid, 0)
 
     # Reset keyboard state
     ResetLastKeys()
@@ -14,6 +14,7 @@ from micropolis.disasters import (
     spawn_monster_disaster,
 )
 from micropolis.simulation import rand
+from micropolis.tile_map import TileMap
 from micropolis.sim_control import (
     set_heat_flow,
     set_heat_rule,
@@ -86,7 +87,7 @@ def do_key_down(context: AppContext, view: SimView, char_code: str) -> None:
 
     # will cheat - scramble map
     if context.last_keys == "will":
-        context.map_data = [row[:] for row in context.map_data]
+        context.map_data = TileMap.from_columns(context.map_data)
         n = 500
         for _ in range(n):
             try:
@@ -0,0 +1,141 @@
+"""
+map_raster.py - Whole-map tile and overlay rasterization with NumPy
+
+The overview maps draw every tile as a small block of pixels (3×3 in the
+map window, 4×4 on the small-tile sheet) and overlay data as larger cells.
+Instead of one draw call per tile or cell, these helpers build the whole
+image as an ``[x, y, rgb]`` array and write it into the view surface
+through ``pygame.surfarray.pixels3d``:
+
+* ``NON_RES_TILES`` and the other ``NON_*_TILES`` tables mark, by tile id,
+  the tiles each zone or transport map mode hides, and ``tile_filter_lut``
+  turns one into a lookup table, so filtering the map is one indexing step;
+* ``tile_image`` gathers each tile's block from an array of blocks (sprites
+  cut from a tile atlas, or ``solid_blocks`` of flat colors) and
+  interleaves them into one image;
+* ``cell_image`` upscales a coarse overlay grid to pixels;
+* ``write_pixels`` copies an image, optionally masked, into a surface.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pygame
+
+from .constants import LOMASK, TILE_COUNT
+from .tile_map import tile_array
+
+# Tiles hidden by the zone and transport map modes (drawRes, drawCom,
+# drawInd and drawLilTransMap in g_smmaps.c), indexed by tile id.
+_TILE_IDS = np.arange(LOMASK + 1, dtype=np.int16)
+NON_RES_TILES = _TILE_IDS > 422
+NON_COM_TILES = (_TILE_IDS > 609) | ((_TILE_IDS >= 232) & (_TILE_IDS < 423))
+NON_IND_TILES = (
+    ((_TILE_IDS >= 240) & (_TILE_IDS <= 611))
+    | ((_TILE_IDS >= 693) & (_TILE_IDS <= 851))
+    | ((_TILE_IDS >= 860) & (_TILE_IDS <= 883))
+    | (_TILE_IDS >= 932)
+)
+NON_TRANSPORT_TILES = (
+    (_TILE_IDS >= 240) | ((_TILE_IDS >= 207) & (_TILE_IDS <= 220)) | (_TILE_IDS == 223)
+)
+
+
+def tile_filter_lut(hidden: np.ndarray) -> np.ndarray:
+    """
+    Build a tile filter lookup table from a table of hidden tiles.
+
+    Args:
+        hidden: ``LOMASK + 1`` booleans, True for tiles the map mode hides
+
+    Returns:
+        ``LOMASK + 1`` entries mapping each tile id to 0 where it is hidden
+        and to itself elsewhere
+    """
+    return np.where(hidden, 0, _TILE_IDS).astype(np.int16)
+
+
+def map_tile_ids(map_data: Any) -> np.ndarray:
+    """
+    Small-map tile ids for the whole map.
+
+    As in the g_smmaps.c loops, ids past the tile set wrap back by
+    ``TILE_COUNT`` before the flag bits are masked off.
+
+    Args:
+        map_data: Main tile map (ArrayGrid or nested lists)
+
+    Returns:
+        ``(WORLD_X, WORLD_Y)`` array of ids below ``TILE_COUNT``
+    """
+    values = tile_array(map_data).astype(np.int32)
+    index = values & LOMASK
+    return np.where(index >= TILE_COUNT, (values - TILE_COUNT) & LOMASK, index)
+
+
+def solid_blocks(
+    colors: Sequence[tuple[int, int, int]] | np.ndarray, block: int
+) -> np.ndarray:
+    """One flat ``block``×``block`` block per RGB color, as ``[i, x, y, rgb]``."""
+    colors = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+    return np.broadcast_to(colors[:, None, None, :], (len(colors), block, block, 3))
+
+
+def tile_image(tile_ids: np.ndarray, blocks: np.ndarray) -> np.ndarray:
+    """
+    Lay out one block per tile.
+
+    Args:
+        tile_ids: ``[x, y]`` indices into ``blocks``
+        blocks: ``[i, x, y, rgb]`` tile images, all the same size
+
+    Returns:
+        ``[x, y, rgb]`` image with ``blocks[tile_ids[tx, ty]]`` at tile
+        (tx, ty)
+    """
+    width, height = tile_ids.shape
+    block_w, block_h = blocks.shape[1:3]
+    image = blocks[tile_ids].transpose(0, 2, 1, 3, 4)
+    return image.reshape(width * block_w, height * block_h, 3)
+
+
+def cell_image(values: np.ndarray, cell: int) -> np.ndarray:
+    """Upscale an ``[x, y, ...]`` grid so each entry covers a ``cell``-pixel square."""
+    return values.repeat(cell, axis=0).repeat(cell, axis=1)
+
+
+def write_pixels(
+    surface: pygame.Surface,
+    image: np.ndarray,
+    mask: np.ndarray | None = None,
+) -> None:
+    """
+    Copy an ``[x, y, rgb]`` image into the top-left of a surface.
+
+    The image is clipped to the surface. Where ``mask`` is given, only
+    pixels with a True mask entry are written.
+    """
+    try:
+        pixels = pygame.surfarray.pixels3d(surface)
+        copy_back = False
+    except ValueError:
+        # Palette surfaces have no RGB view; edit a copy and blit it back.
+        pixels = pygame.surfarray.array3d(surface)
+        copy_back = True
+
+    width = min(image.shape[0], pixels.shape[0])
+    height = min(image.shape[1], pixels.shape[1])
+    region = pixels[:width, :height]
+    image = image[:width, :height]
+    if mask is None:
+        region[...] = image
+    else:
+        mask = mask[:width, :height]
+        region[mask] = image[mask]
+
+    if copy_back:
+        pygame.surfarray.blit_array(surface, pixels)
+    del region, pixels
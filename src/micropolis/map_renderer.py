@@ -2,15 +2,21 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import cache
 from math import ceil
 
+import numpy as np
 import pygame
 
 from .constants import CONDBIT, PWRBIT, WORLD_X, WORLD_Y, ZONEBIT
 from .context import AppContext
 from .sim_view import SimView
+from .tile_map import grid_array, tile_array
 
 Color = tuple[int, int, int, int]
+# Overlay colors for a block of tiles: (tiles_x, tiles_y, RGBA) uint8 array,
+# with alpha 0 where the tile has no overlay color.
+ColorGrid = np.ndarray
 
 
 def _clamp(value: int, minimum: int, maximum: int) -> int:
@@ -62,6 +68,37 @@ class ScalarOverlay:
         normalized = _clamp_float(normalized)
         return _color_from_ramp(normalized, self.ramp)
 
+    def colors_for(
+        self, context: AppContext, xs: np.ndarray, ys: np.ndarray
+    ) -> ColorGrid | None:
+        """``color_for`` over every tile in ``xs`` x ``ys`` at once.
+
+        Returns None when the field is not a rectangular grid, leaving those
+        to the per-tile path.
+        """
+        data = getattr(context, self.attr_name, None)
+        if not data or not self.ramp:
+            return _transparent(xs, ys)
+        try:
+            values = grid_array(data)
+        except (TypeError, ValueError):
+            return None
+        if values.ndim != 2 or values.size == 0:
+            return None
+
+        grid_x = np.minimum(xs // self.scale[0], values.shape[0] - 1)
+        grid_y = np.minimum(ys // self.scale[1], values.shape[1] - 1)
+        raw = values[np.ix_(grid_x, grid_y)].astype(np.float64)
+
+        min_val, max_val = self.value_range
+        if max_val == min_val:
+            normalized = np.zeros_like(raw)
+        else:
+            normalized = np.clip((raw - min_val) / (max_val - min_val), 0.0, 1.0)
+        thresholds, palette = _ramp_palette(self.ramp)
+        index = np.searchsorted(thresholds, normalized, side="left")
+        return palette[np.minimum(index, len(palette) - 1)]
+
 
 def _color_from_ramp(
     value: float, ramp: tuple[tuple[float, Color], ...]
@@ -73,6 +110,20 @@ def _color_from_ramp(
     return ramp[-1][1] if ramp else None
 
 
+@cache
+def _ramp_palette(
+    ramp: tuple[tuple[float, Color], ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Ramp thresholds and the matching RGBA palette as arrays."""
+    thresholds = np.array([threshold for threshold, _ in ramp], dtype=np.float64)
+    palette = np.array([color for _, color in ramp], dtype=np.uint8)
+    return thresholds, palette
+
+
+def _transparent(xs: np.ndarray, ys: np.ndarray) -> ColorGrid:
+    return np.zeros((len(xs), len(ys), 4), dtype=np.uint8)
+
+
 _POPULATION_OVERLAY = ScalarOverlay(
     attr_name="pop_density",
     scale=(2, 2),
@@ -147,23 +198,55 @@ _SCALAR_OVERLAYS: dict[str, ScalarOverlay] = {
 }
 
 
+_POWERED_ZONE_COLOR: Color = (255, 215, 0, 170)
+_UNPOWERED_ZONE_COLOR: Color = (60, 80, 110, 190)
+_CONDUCTOR_COLOR: Color = (200, 200, 200, 120)
+
+# Palette indexed by _power_overlay_colors: none, powered, unpowered, conductor.
+_POWER_PALETTE = np.array(
+    [(0, 0, 0, 0), _POWERED_ZONE_COLOR, _UNPOWERED_ZONE_COLOR, _CONDUCTOR_COLOR],
+    dtype=np.uint8,
+)
+
+
 def _power_overlay(context: AppContext, tile_x: int, tile_y: int) -> Color | None:
     if not (0 <= tile_x < WORLD_X and 0 <= tile_y < WORLD_Y):
         return None
     tile_value = context.map_data[tile_x][tile_y]
     if tile_value & ZONEBIT:
-        return (255, 215, 0, 170) if (tile_value & PWRBIT) else (60, 80, 110, 190)
+        return _POWERED_ZONE_COLOR if (tile_value & PWRBIT) else _UNPOWERED_ZONE_COLOR
     if tile_value & CONDBIT:
-        return (200, 200, 200, 120)
+        return _CONDUCTOR_COLOR
     return None
 
 
+def _power_overlay_colors(
+    context: AppContext, xs: np.ndarray, ys: np.ndarray
+) -> ColorGrid:
+    tiles = tile_array(context.map_data)[np.ix_(xs, ys)]
+    index = np.where(
+        tiles & ZONEBIT,
+        np.where(tiles & PWRBIT, 1, 2),
+        np.where(tiles & CONDBIT, 3, 0),
+    )
+    return _POWER_PALETTE[index]
+
+
 _OVERLAY_SAMPLERS: dict[str, Callable[[AppContext, int, int], Color | None]] = {
     "power": _power_overlay,
 }
 
+# Whole-block versions of the samplers; each returns None to fall back to
+# sampling tile by tile.
+_OVERLAY_GRIDS: dict[
+    str, Callable[[AppContext, np.ndarray, np.ndarray], ColorGrid | None]
+] = {
+    "power": _power_overlay_colors,
+}
+
 for _name, _spec in _SCALAR_OVERLAYS.items():
     _OVERLAY_SAMPLERS[_name] = _spec.color_for
+    _OVERLAY_GRIDS[_name] = _spec.colors_for
 
 
 _ENSURE_VIEW_SURFACE: Callable[[SimView], pygame.Surface] | None = None
@@ -203,6 +286,63 @@ def get_overlay_color(
     return sampler(context, tile_x, tile_y)
 
 
+def get_overlay_colors(
+    context: AppContext,
+    overlay_name: str,
+    xs: np.ndarray | None = None,
+    ys: np.ndarray | None = None,
+) -> ColorGrid:
+    """Return overlay colors for a block of tiles (the whole map by default).
+
+    Args:
+        context: Micropolis context containing overlay data.
+        overlay_name: One of the registered overlay keys.
+        xs: World X coordinates of the block's columns.
+        ys: World Y coordinates of the block's rows.
+
+    Returns:
+        ``(len(xs), len(ys), 4)`` RGBA array; alpha is 0 where
+        ``get_overlay_color`` returns None.
+    """
+
+    sampler = _OVERLAY_SAMPLERS.get(overlay_name)
+    if sampler is None:
+        raise ValueError(f"Unknown overlay '{overlay_name}'")
+    xs = np.arange(WORLD_X) if xs is None else xs
+    ys = np.arange(WORLD_Y) if ys is None else ys
+    colors_for = _OVERLAY_GRIDS.get(overlay_name)
+    colors = colors_for(context, xs, ys) if colors_for is not None else None
+    if colors is None:
+        colors = _transparent(xs, ys)
+        for i, tile_x in enumerate(xs.tolist()):
+            for j, tile_y in enumerate(ys.tolist()):
+                color = sampler(context, tile_x, tile_y)
+                if color is not None:
+                    colors[i, j] = color
+    return colors
+
+
+def color_grid_surface(
+    colors: ColorGrid, tile_size: int, like: pygame.Surface
+) -> pygame.Surface:
+    """Build a surface with one ``tile_size`` square per entry of ``colors``.
+
+    The surface takes ``like``'s pixel format, so blitting it back onto
+    ``like`` stays on pygame's fast same-format path.
+    """
+    span_x, span_y = colors.shape[:2]
+    tiles = pygame.Surface((span_x, span_y), pygame.SRCALPHA, like)
+    rgb = pygame.surfarray.pixels3d(tiles)
+    rgb[...] = colors[..., :3]
+    del rgb
+    alpha = pygame.surfarray.pixels_alpha(tiles)
+    alpha[...] = colors[..., 3]
+    del alpha
+    if tile_size == 1:
+        return tiles
+    return pygame.transform.scale(tiles, (span_x * tile_size, span_y * tile_size))
+
+
 class MapRenderer:
     """Viewport renderer for the pygame editor panel."""
 
@@ -237,6 +377,10 @@ class MapRenderer:
         self._overlay_surface = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
         self._overlay_mode: str | None = None
         self._last_overlay_mode: str | None = None
+        # Pixel origin and size of the last region copied from view.surface
+        self._last_copy: tuple[tuple[int, int], tuple[int, int]] | None = None
+        # Tiles redrawn into view.surface by the last render()
+        self.tiles_drawn: int | None = 0
 
         self.set_viewport_pixels(*viewport_size)
 
@@ -320,10 +464,21 @@ class MapRenderer:
             offset_x,
             offset_y,
         ) = self._compute_tile_region()
-        draw_rect(self.context, self.view, start_x, start_y, span_x, span_y)
-        self._copy_view_region()
-
+        drawn = draw_rect(self.context, self.view, start_x, start_y, span_x, span_y)
+        self.tiles_drawn = drawn
         overlay_target = overlay_mode or self._overlay_mode
+
+        # Idle frames (no tile redrawn, same region, no overlay on either
+        # frame) keep the previous copy as it is.
+        region = (tuple(self._pixel_origin), self._viewport_px_size)
+        if (
+            drawn != 0
+            or region != self._last_copy
+            or overlay_target
+            or self._last_overlay_mode
+        ):
+            self._copy_view_region()
+            self._last_copy = region
         if overlay_target:
             self._apply_overlay(
                 overlay_target,
@@ -389,6 +544,17 @@ class MapRenderer:
         if sampler is None:
             return
 
+        colors_for = _OVERLAY_GRIDS.get(overlay_mode)
+        if colors_for is not None:
+            xs = np.arange(start_x, min(start_x + span_x, WORLD_X))
+            ys = np.arange(start_y, min(start_y + span_y, WORLD_Y))
+            if not (xs.size and ys.size):
+                return
+            colors = colors_for(self.context, xs, ys)
+            if colors is not None:
+                self._blit_overlay_colors(colors, offset_x, offset_y)
+                return
+
         self._overlay_surface.fill((0, 0, 0, 0))
         viewport_rect = pygame.Rect(0, 0, *self._viewport_px_size)
         for dx in range(span_x):
@@ -413,6 +579,13 @@ class MapRenderer:
                     self._overlay_surface.fill(color, clipped)
         self._surface.blit(self._overlay_surface, (0, 0))
 
+    def _blit_overlay_colors(
+        self, colors: ColorGrid, offset_x: int, offset_y: int
+    ) -> None:
+        """Scale one pixel per tile up to tile size and blend it in one blit."""
+        scaled = color_grid_surface(colors, self.tile_size, self._surface)
+        self._surface.blit(scaled, (-offset_x, -offset_y))
+
     def _sync_from_view_pan(self) -> None:
         max_x = self._max_pixel_origin_x()
         max_y = self._max_pixel_origin_y()
@@ -473,6 +646,8 @@ def available_overlays() -> Iterable[str]:
 __all__ = [
     "MapRenderer",
     "available_overlays",
+    "color_grid_surface",
     "get_overlay_color",
+    "get_overlay_colors",
     "get_or_create_map_renderer",
 ]
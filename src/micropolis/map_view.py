@@ -15,6 +15,7 @@ Key features:
 # Import local modules
 from typing import Any
 
+import numpy as np
 import pygame
 
 from micropolis.constants import (
@@ -31,10 +32,6 @@ from micropolis.constants import (
     RESBASE,
     COMBASE,
     INDBASE,
-    TILE_COUNT,
-    ZONEBIT,
-    PWRBIT,
-    CONDBIT,
     HWLDX,
     HWLDY,
     SM_X,
@@ -61,6 +58,25 @@ from micropolis.constants import (
     NMAPS,
 )
 from micropolis.context import AppContext
+from micropolis.map_raster import (
+    NON_COM_TILES,
+    NON_IND_TILES,
+    NON_RES_TILES,
+    NON_TRANSPORT_TILES,
+    cell_image,
+    solid_blocks,
+    tile_image,
+    write_pixels,
+)
+from micropolis.mini_maps import dynamic_filter_mask
+from micropolis.power import (
+    POWER_SHOW_CONDUCTIVE,
+    POWER_SHOW_POWERED,
+    POWER_SHOW_TILE,
+    POWER_SHOW_UNPOWERED,
+    classify_power_tiles,
+)
+from micropolis.tile_map import grid_array, tile_array
 
 
 # ============================================================================
@@ -72,6 +88,42 @@ from micropolis.context import AppContext
 # reference map_view.mapProcs directly.
 mapProcs: list = [None] * NMAPS
 
+# Overview colors (drawAll): empty land is a checkerboard of the first two
+_OVERVIEW_COLORS = (
+    (70, 110, 70),  # Empty land, even squares
+    (60, 100, 60),  # Empty land, odd squares
+    (30, 200, 30),  # Residential - green
+    (40, 80, 200),  # Commercial - blue
+    (230, 190, 50),  # Industrial - yellow
+    (110, 110, 110),  # Everything else - gray
+    (0, 0, 0),  # Hidden by a map filter
+)
+_EMPTY, _RES, _COM, _IND, _OTHER, _HIDDEN = 0, 2, 3, 4, 5, 6
+_OVERVIEW_BLOCKS = solid_blocks(_OVERVIEW_COLORS, 3)
+
+
+def _overview_color_index(tile: int) -> int:
+    if tile <= 0:
+        return _EMPTY
+    if RESBASE <= tile < COMBASE:
+        return _RES
+    if COMBASE <= tile < INDBASE:
+        return _COM
+    if tile >= INDBASE:
+        return _IND
+    return _OTHER
+
+
+# Overview color index for each tile id
+_OVERVIEW_INDEX = np.array(
+    [_overview_color_index(tile) for tile in range(LOMASK + 1)], dtype=np.int8
+)
+
+# Color-intensity categories of GetCI, by np.digitize bucket
+_CI_VALUES = np.array(
+    [VAL_NONE, VAL_LOW, VAL_MEDIUM, VAL_HIGH, VAL_VERYHIGH], dtype=np.int8
+)
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -100,6 +152,11 @@ def GetCI(x: int) -> int:
         return VAL_VERYHIGH
 
 
+def _ci_array(values: np.ndarray) -> np.ndarray:
+    """GetCI for every entry of an array."""
+    return _CI_VALUES[np.digitize(values, (50, 100, 150, 200))]
+
+
 def maybeDrawRect(view: Any, val: int, x: int, y: int, w: int, h: int) -> None:
     """
     Draw a rectangle if the value is not VAL_NONE.
@@ -127,6 +184,15 @@ def drawRect(view: Any, val: int, x: int, y: int, w: int, h: int) -> None:
         x, y: Position coordinates
         w, h: Width and height
     """
+    color = _val_color(view, val)
+
+    # Ensure we have a valid surface to draw on
+    if hasattr(view, "surface") and view.surface:
+        pygame.draw.rect(view.surface, color, (x, y, w, h))
+
+
+def _val_color(view: Any, val: int) -> tuple[int, int, int]:
+    """RGB color drawRect uses for a color intensity value."""
     # Get the color value
     if hasattr(view, "x") and view.x and not view.x.color:
         # Grayscale mode
@@ -158,10 +224,73 @@ def drawRect(view: Any, val: int, x: int, y: int, w: int, h: int) -> None:
                 (255, 255, 0),  # VAL_VERYMINUS (yellow)
             ]
             color = fallback_colors[val] if val < len(fallback_colors) else (0, 0, 0)
+    return color
 
-    # Ensure we have a valid surface to draw on
-    if hasattr(view, "surface") and view.surface:
-        pygame.draw.rect(view.surface, color, (x, y, w, h))
+
+def _overlay_values(
+    grid: Any, view: Any, width: int, height: int, cell: int
+) -> np.ndarray:
+    """The part of an overlay grid whose ``cell``-pixel squares fit the view."""
+    nx = max(0, min(width, view.m_width // cell))
+    ny = max(0, min(height, view.m_height // cell))
+    return grid_array(grid)[:nx, :ny].astype(np.int64)
+
+
+def _draw_value_cells(view: Any, values: np.ndarray, cell: int) -> None:
+    """
+    maybeDrawRect for a whole grid of color intensity values at once.
+
+    Args:
+        view: SimView containing pygame surface
+        values: ``[x, y]`` color intensity values, one per ``cell``-pixel square
+        cell: Square size in pixels
+    """
+    if not (hasattr(view, "surface") and view.surface) or values.size == 0:
+        return
+    palette = np.array(
+        [
+            _val_color(view, val) if val != VAL_NONE else (0, 0, 0)
+            for val in range(len(valMap))
+        ],
+        dtype=np.uint8,
+    )
+    write_pixels(
+        view.surface,
+        cell_image(palette[values], cell),
+        mask=cell_image(values != VAL_NONE, cell),
+    )
+
+
+def _draw_overview(
+    context: AppContext, view: Any, hidden: np.ndarray | None = None
+) -> None:
+    """
+    Draw the overview map, blacking out hidden tiles.
+
+    Args:
+        view: SimView to render into
+        hidden: Optional lookup table by tile id, or ``[x, y]`` mask, of
+            tiles to draw black
+        :param context:
+    """
+    if not (hasattr(view, "surface") and view.surface):
+        return
+    surface = view.surface
+    surface.fill((50, 92, 50))
+
+    max_x = min(WORLD_X, view.m_width // 3)
+    max_y = min(WORLD_Y, view.m_height // 3)
+    if max_x <= 0 or max_y <= 0:
+        return
+
+    tiles = tile_array(context.map_data)[:max_x, :max_y] & LOMASK
+    index = _OVERVIEW_INDEX[tiles]
+    parity = np.add.outer(np.arange(max_x), np.arange(max_y)) % 2
+    index = np.where(index == _EMPTY, parity, index)
+    if hidden is not None:
+        mask = hidden[tiles] if hidden.ndim == 1 else hidden[:max_x, :max_y]
+        index[mask] = _HIDDEN
+    write_pixels(surface, tile_image(index, _OVERVIEW_BLOCKS))
 
 
 # ============================================================================
@@ -176,30 +305,7 @@ def drawAll(context: AppContext, view: Any) -> None:
     Args:
         view: SimView to render into
     """
-    # For pygame implementation, we'll render tiles directly
-    # This is a simplified version - full implementation would need tile graphics
-    if hasattr(view, "surface") and view.surface:
-        surface = view.surface
-        surface.fill((50, 92, 50))
-
-        max_x = min(WORLD_X, view.m_width // 3)
-        max_y = min(WORLD_Y, view.m_height // 3)
-        for x in range(max_x):
-            for y in range(max_y):
-                tile = context.map_data[x][y] & LOMASK
-                if tile <= 0:
-                    # Default terrain checkerboard to visualize empty land
-                    color = (70, 110, 70) if (x + y) % 2 == 0 else (60, 100, 60)
-                elif RESBASE <= tile < COMBASE:
-                    color = (30, 200, 30)  # Residential - green
-                elif COMBASE <= tile < INDBASE:
-                    color = (40, 80, 200)  # Commercial - blue
-                elif tile >= INDBASE:
-                    color = (230, 190, 50)  # Industrial - yellow
-                else:
-                    color = (110, 110, 110)
-
-                pygame.draw.rect(surface, color, (x * 3, y * 3, 3, 3))
+    _draw_overview(context, view)
 
 
 def drawRes(context: AppContext, view: Any) -> None:
@@ -210,15 +316,7 @@ def drawRes(context: AppContext, view: Any) -> None:
         view: SimView to render into
         :param context:
     """
-    drawAll(context, view)
-    # Filter to show only residential tiles
-    if hasattr(view, "surface") and view.surface:
-        for x in range(min(WORLD_X, view.m_width // 3)):
-            for y in range(min(WORLD_Y, view.m_height // 3)):
-                tile = context.map_data[x][y] & LOMASK
-                if tile > 422:  # Non-residential tile
-                    # Draw black rectangle to hide non-residential tiles
-                    pygame.draw.rect(view.surface, (0, 0, 0), (x * 3, y * 3, 3, 3))
+    _draw_overview(context, view, NON_RES_TILES)
 
 
 def drawCom(context: AppContext, view: Any) -> None:
@@ -229,17 +327,7 @@ def drawCom(context: AppContext, view: Any) -> None:
         view: SimView to render into
         :param context:
     """
-    drawAll(context, view)
-    # Filter to show only commercial tiles
-    if hasattr(view, "surface") and view.surface:
-        for x in range(min(WORLD_X, view.m_width // 3)):
-            for y in range(min(WORLD_Y, view.m_height // 3)):
-                tile = context.map_data[x][y] & LOMASK
-                if (tile > 609) or (
-                    (tile >= 232) and (tile < 423)
-                ):  # Non-commercial tile
-                    # Draw black rectangle to hide non-commercial tiles
-                    pygame.draw.rect(view.surface, (0, 0, 0), (x * 3, y * 3, 3, 3))
+    _draw_overview(context, view, NON_COM_TILES)
 
 
 def drawInd(context: AppContext, view: Any) -> None:
@@ -250,20 +338,7 @@ def drawInd(context: AppContext, view: Any) -> None:
         view: SimView to render into
         :param context:
     """
-    drawAll(context, view)
-    # Filter to show only industrial tiles
-    if hasattr(view, "surface") and view.surface:
-        for x in range(min(WORLD_X, view.m_width // 3)):
-            for y in range(min(WORLD_Y, view.m_height // 3)):
-                tile = context.map_data[x][y] & LOMASK
-                if (
-                    ((tile >= 240) and (tile <= 611))
-                    or ((tile >= 693) and (tile <= 851))
-                    or ((tile >= 860) and (tile <= 883))
-                    or (tile >= 932)
-                ):  # Non-industrial tile
-                    # Draw black rectangle to hide non-industrial tiles
-                    pygame.draw.rect(view.surface, (0, 0, 0), (x * 3, y * 3, 3, 3))
+    _draw_overview(context, view, NON_IND_TILES)
 
 
 def drawPower(context: AppContext, view: Any) -> None:
@@ -291,32 +366,20 @@ def drawPower(context: AppContext, view: Any) -> None:
 
     view.surface.fill((0, 0, 0))  # Clear background
 
-    for x in range(min(WORLD_X, view.m_width // 3)):
-        for y in range(min(WORLD_Y, view.m_height // 3)):
-            tile = context.map_data[x][y]
-
-            if (tile & LOMASK) >= TILE_COUNT:
-                tile -= TILE_COUNT
-
-            tile_val = tile & LOMASK
-
-            if tile_val <= 63:
-                # Terrain tile - show normally
-                color = (100, 100, 100)  # Gray
-            elif tile & ZONEBIT:
-                # Zone tile - show power status
-                if tile & PWRBIT:
-                    color = powered_color
-                else:
-                    color = unpowered_color
-            else:
-                # Infrastructure tile
-                if tile & CONDBIT:
-                    color = conductive_color
-                else:
-                    color = (0, 0, 0)  # Black for non-conductive
+    width = min(WORLD_X, view.m_width // 3)
+    height = min(WORLD_Y, view.m_height // 3)
+    if width <= 0 or height <= 0:
+        return
 
-            pygame.draw.rect(view.surface, color, (x * 3, y * 3, 3, 3))
+    # Classify the whole map at once and blit 3x3 colour blocks in one go.
+    palette = np.zeros((5, 3), dtype=np.uint8)
+    palette[POWER_SHOW_TILE] = (100, 100, 100)  # Terrain tile - gray
+    palette[POWER_SHOW_POWERED] = powered_color
+    palette[POWER_SHOW_UNPOWERED] = unpowered_color
+    palette[POWER_SHOW_CONDUCTIVE] = conductive_color
+    classes, _ = classify_power_tiles(tile_array(context.map_data))
+    pixels = palette[classes[:width, :height]].repeat(3, axis=0).repeat(3, axis=1)
+    view.surface.blit(pygame.surfarray.make_surface(pixels), (0, 0))
 
 
 def drawLilTransMap(context: AppContext, view: Any) -> None:
@@ -327,17 +390,7 @@ def drawLilTransMap(context: AppContext, view: Any) -> None:
         view: SimView to render into
         :param context:
     """
-    drawAll(context, view)
-    # Filter to show only transportation tiles
-    if hasattr(view, "surface") and view.surface:
-        for x in range(min(WORLD_X, view.m_width // 3)):
-            for y in range(min(WORLD_Y, view.m_height // 3)):
-                tile = context.map_data[x][y] & LOMASK
-                if (
-                    (tile >= 240) or ((tile >= 207) and tile <= 220) or (tile == 223)
-                ):  # Non-transportation tile
-                    # Draw black rectangle to hide non-transportation tiles
-                    pygame.draw.rect(view.surface, (0, 0, 0), (x * 3, y * 3, 3, 3))
+    _draw_overview(context, view, NON_TRANSPORT_TILES)
 
 
 def drawPopDensity(context: AppContext, view: Any) -> None:
@@ -351,10 +404,8 @@ def drawPopDensity(context: AppContext, view: Any) -> None:
     drawAll(context, view)
 
     # Draw population density overlay
-    for x in range(min(HWLDX, view.m_width // 6)):
-        for y in range(min(HWLDY, view.m_height // 6)):
-            val = GetCI(context.pop_density[x][y])
-            maybeDrawRect(view, val, x * 6, y * 6, 6, 6)
+    values = _overlay_values(context.pop_density, view, HWLDX, HWLDY, 6)
+    _draw_value_cells(view, _ci_array(values), 6)
 
 
 def drawRateOfGrowth(context: AppContext, view: Any) -> None:
@@ -368,21 +419,13 @@ def drawRateOfGrowth(context: AppContext, view: Any) -> None:
     drawAll(context, view)
 
     # Draw rate of growth overlay
-    for x in range(min(SM_X, view.m_width // 24)):
-        for y in range(min(SM_Y, view.m_height // 24)):
-            z = context.rate_og_mem[x][y]
-            if z > 100:
-                val = VAL_VERYPLUS
-            elif z > 20:
-                val = VAL_PLUS
-            elif z < -100:
-                val = VAL_VERYMINUS
-            elif z < -20:
-                val = VAL_MINUS
-            else:
-                val = VAL_NONE
-
-            maybeDrawRect(view, val, x * 24, y * 24, 24, 24)
+    z = _overlay_values(context.rate_og_mem, view, SM_X, SM_Y, 24)
+    values = np.select(
+        [z > 100, z > 20, z < -100, z < -20],
+        [VAL_VERYPLUS, VAL_PLUS, VAL_VERYMINUS, VAL_MINUS],
+        VAL_NONE,
+    )
+    _draw_value_cells(view, values, 24)
 
 
 def drawTrafMap(context: AppContext, view: Any) -> None:
@@ -396,10 +439,8 @@ def drawTrafMap(context: AppContext, view: Any) -> None:
     drawLilTransMap(context, view)
 
     # Draw traffic density overlay
-    for x in range(min(HWLDX, view.m_width // 6)):
-        for y in range(min(HWLDY, view.m_height // 6)):
-            val = GetCI(context.trf_density[x][y])
-            maybeDrawRect(view, val, x * 6, y * 6, 6, 6)
+    values = _overlay_values(context.trf_density, view, HWLDX, HWLDY, 6)
+    _draw_value_cells(view, _ci_array(values), 6)
 
 
 def drawPolMap(context: AppContext, view: Any) -> None:
@@ -413,10 +454,8 @@ def drawPolMap(context: AppContext, view: Any) -> None:
     drawAll(context, view)
 
     # Draw pollution overlay
-    for x in range(min(HWLDX, view.m_width // 6)):
-        for y in range(min(HWLDY, view.m_height // 6)):
-            val = GetCI(10 + context.pollution_mem[x][y])
-            maybeDrawRect(view, val, x * 6, y * 6, 6, 6)
+    values = _overlay_values(context.pollution_mem, view, HWLDX, HWLDY, 6)
+    _draw_value_cells(view, _ci_array(10 + values), 6)
 
 
 def drawCrimeMap(context: AppContext, view: Any) -> None:
@@ -430,10 +469,8 @@ def drawCrimeMap(context: AppContext, view: Any) -> None:
     drawAll(context, view)
 
     # Draw crime overlay
-    for x in range(min(HWLDX, view.m_width // 6)):
-        for y in range(min(HWLDY, view.m_height // 6)):
-            val = GetCI(context.crime_mem[x][y])
-            maybeDrawRect(view, val, x * 6, y * 6, 6, 6)
+    values = _overlay_values(context.crime_mem, view, HWLDX, HWLDY, 6)
+    _draw_value_cells(view, _ci_array(values), 6)
 
 
 def drawLandMap(context: AppContext, view: Any) -> None:
@@ -447,10 +484,8 @@ def drawLandMap(context: AppContext, view: Any) -> None:
     drawAll(context, view)
 
     # Draw land value overlay
-    for x in range(min(HWLDX, view.m_width // 6)):
-        for y in range(min(HWLDY, view.m_height // 6)):
-            val = GetCI(context.land_value_mem[x][y])
-            maybeDrawRect(view, val, x * 6, y * 6, 6, 6)
+    values = _overlay_values(context.land_value_mem, view, HWLDX, HWLDY, 6)
+    _draw_value_cells(view, _ci_array(values), 6)
 
 
 def drawFireRadius(context: AppContext, view: Any) -> None:
@@ -464,10 +499,8 @@ def drawFireRadius(context: AppContext, view: Any) -> None:
     drawAll(context, view)
 
     # Draw fire radius overlay
-    for x in range(min(SM_X, view.m_width // 24)):
-        for y in range(min(SM_Y, view.m_height // 24)):
-            val = GetCI(context.fire_rate[x][y])
-            maybeDrawRect(view, val, x * 24, y * 24, 24, 24)
+    values = _overlay_values(context.fire_rate, view, SM_X, SM_Y, 24)
+    _draw_value_cells(view, _ci_array(values), 24)
 
 
 def drawPoliceRadius(context: AppContext, view: Any) -> None:
@@ -481,10 +514,8 @@ def drawPoliceRadius(context: AppContext, view: Any) -> None:
     drawAll(context, view)
 
     # Draw police radius overlay
-    for x in range(min(SM_X, view.m_width // 24)):
-        for y in range(min(SM_Y, view.m_height // 24)):
-            val = GetCI(context.police_map_effect[x][y])
-            maybeDrawRect(view, val, x * 24, y * 24, 24, 24)
+    values = _overlay_values(context.police_map_effect, view, SM_X, SM_Y, 24)
+    _draw_value_cells(view, _ci_array(values), 24)
 
 
 def drawDynamic(context: AppContext, view: Any) -> None:
@@ -495,17 +526,12 @@ def drawDynamic(context: AppContext, view: Any) -> None:
         view: SimView to render into
         :param context:
     """
-    drawAll(context, view)
+    if not (hasattr(view, "surface") and view.surface):
+        return
 
-    # Apply dynamic filtering
-    if hasattr(view, "surface") and view.surface:
-        for x in range(min(WORLD_X, view.m_width // 3)):
-            for y in range(min(WORLD_Y, view.m_height // 3)):
-                tile = context.map_data[x][y] & LOMASK
-                if tile > 63:  # Only filter non-terrain tiles
-                    if not dynamicFilter(context, x, y):
-                        # Hide tiles that don't match dynamic criteria
-                        pygame.draw.rect(view.surface, (0, 0, 0), (x * 3, y * 3, 3, 3))
+    # Hide non-terrain tiles that don't match the dynamic criteria
+    tiles = tile_array(context.map_data) & LOMASK
+    _draw_overview(context, view, (tiles > 63) & ~dynamic_filter_mask(context))
 
 
 def dynamicFilter(context: AppContext, col: int, row: int) -> bool:
@@ -2,22 +2,26 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
+import numpy as np
 import pygame
 
 from .context import AppContext
-from .constants import WORLD_X, WORLD_Y
-from .graphics_setup import get_small_tile_surface
+from .constants import LIGHTNINGBOLT, PWRBIT, WORLD_X, WORLD_Y, ZONEBIT
+from .graphics_setup import TileAtlas, get_tile_atlas, resolve_tiles_for_render
 from .map_renderer import (
     available_overlays as _available_map_overlays,
+    color_grid_surface,
     get_or_create_map_renderer,
-    get_overlay_color,
+    get_overlay_colors,
 )
-from .mini_maps import dynamicFilter
+from .mini_maps import dynamic_filter_mask
 from .sim_view import SimView
+from .tile_map import tile_array
 
 Color = tuple[int, int, int, int]
 
 _MINIMAP_TILE_SIZE = 4
+_CLEAR: Color = (0, 0, 0, 0)
 _VIEWPORT_COLOR: Color = (255, 255, 255, 220)
 _DYNAMIC_FILTER_COLOR: Color = (0, 200, 255, 140)
 
@@ -26,7 +30,13 @@ _AVAILABLE_OVERLAY_SET = set(_AVAILABLE_OVERLAYS)
 
 
 class MiniMapRenderer:
-    """Renders the 4×4 tile minimap surface with overlays and viewport overlays."""
+    """Renders the 4×4 tile minimap surface with overlays and viewport overlays.
+
+    The base map is kept between frames and only tiles whose (unblinked)
+    sprite changed are redrawn. The blinking lightning bolts of unpowered
+    zones are drawn over a copy of it, and overlay layers are rebuilt only
+    when their colors change.
+    """
 
     def __init__(
         self,
@@ -48,6 +58,19 @@ class MiniMapRenderer:
         self._dynamic_filter_enabled = False
         self._overlay_cache: dict[str, pygame.Surface] = {}
         self._overlay_tokens: dict[str, int] = {}
+        self._overlay_colors: dict[str, np.ndarray] = {}
+        # Raw map the base surface was drawn from, and the sprite index drawn
+        # at each tile (-1 = not drawn yet)
+        self._base_source: np.ndarray | None = None
+        self._base_tiles = np.full((WORLD_X, WORLD_Y), -1, dtype=np.int16)
+        self._base_atlas: TileAtlas | None = None
+        # Unpowered zone tiles, drawn as lightning bolts on blink frames
+        self._blink_cells: list[tuple[int, int]] = []
+        self._dynamic_token: tuple[int, tuple[int, ...]] | None = None
+        self._dynamic_mask: np.ndarray | None = None
+        self._dynamic_surface: pygame.Surface | None = None
+        # Base-map tiles redrawn by the last render()
+        self.tiles_drawn = 0
 
     # ------------------------------------------------------------------
     def set_overlay_mode(self, mode: str | None) -> None:
@@ -63,11 +86,20 @@ class MiniMapRenderer:
         if overlay_name is None:
             self._overlay_cache.clear()
             self._overlay_tokens.clear()
+            self._overlay_colors.clear()
+            self._dynamic_token = None
+            self._dynamic_mask = None
             return
 
         normalized = overlay_name.lower()
         self._overlay_cache.pop(normalized, None)
         self._overlay_tokens.pop(normalized, None)
+        self._overlay_colors.pop(normalized, None)
+
+    def invalidate_base(self) -> None:
+        """Redraw every base-map tile on the next render."""
+        self._base_source = None
+        self._base_tiles.fill(-1)
 
     # ------------------------------------------------------------------
     def render(
@@ -84,8 +116,10 @@ class MiniMapRenderer:
             if blink_override is not None
             else self.context.flag_blink <= 0
         )
-        self._draw_base_map(blink)
+        self.tiles_drawn = self._draw_base_map()
         result = self._base_surface.copy()
+        if blink:
+            self._draw_blink_layer(result)
 
         overlay_target = overlay_mode or self._overlay_mode
         if overlay_target:
@@ -126,22 +160,22 @@ class MiniMapRenderer:
         if cached is not None and cached_cycle == current_cycle and not force:
             return cached
 
-        surface = pygame.Surface(self._base_surface.get_size(), pygame.SRCALPHA)
-        for tile_x in range(WORLD_X):
-            for tile_y in range(WORLD_Y):
-                color = get_overlay_color(self.context, normalized, tile_x, tile_y)
-                if color is None:
-                    continue
-                rect = pygame.Rect(
-                    tile_x * self.tile_size,
-                    tile_y * self.tile_size,
-                    self.tile_size,
-                    self.tile_size,
-                )
-                surface.fill(color, rect)
+        # A new cycle only means the data may have changed; keep the layer
+        # if its colors did not.
+        self._overlay_tokens[normalized] = current_cycle
+        colors = get_overlay_colors(self.context, normalized)
+        previous = self._overlay_colors.get(normalized)
+        if (
+            cached is not None
+            and not force
+            and previous is not None
+            and np.array_equal(colors, previous)
+        ):
+            return cached
 
+        surface = color_grid_surface(colors, self.tile_size, self._base_surface)
         self._overlay_cache[normalized] = surface
-        self._overlay_tokens[normalized] = current_cycle
+        self._overlay_colors[normalized] = colors
         return surface
 
     def world_coords_from_point(
@@ -177,53 +211,88 @@ class MiniMapRenderer:
         return tile_x, tile_y
 
     # ------------------------------------------------------------------
-    def _draw_base_map(self, blink: bool) -> None:
-        self._base_surface.fill((0, 0, 0, 0))
-        for tile_x in range(WORLD_X):
-            for tile_y in range(WORLD_Y):
-                tile_value = self.context.map_data[tile_x][tile_y]
-                tile_surface = get_small_tile_surface(
-                    tile_value,
-                    self.view,
-                    context=self.context,
-                    coords=(tile_x, tile_y),
-                    blink=blink,
-                    treat_input_as_raw=True,
-                )
-                if tile_surface is None:
-                    continue
-
-                dest = (tile_x * self.tile_size, tile_y * self.tile_size)
-                if (
-                    tile_surface.get_width() == self.tile_size
-                    and tile_surface.get_height() == self.tile_size
-                ):
-                    self._base_surface.blit(tile_surface, dest)
-                else:
-                    scaled = pygame.transform.smoothscale(
-                        tile_surface, (self.tile_size, self.tile_size)
+    def _draw_base_map(self) -> int:
+        """Redraw the base-map tiles whose sprite changed; returns their count."""
+        tiles = tile_array(self.context.map_data)
+        atlas = get_tile_atlas(self.view, small=True)
+        if atlas is not self._base_atlas:
+            self.invalidate_base()
+            self._base_atlas = atlas
+        if self._base_source is not None and np.array_equal(tiles, self._base_source):
+            return 0
+        self._base_source = tiles.copy()
+
+        unpowered = (tiles & (ZONEBIT | PWRBIT)) == ZONEBIT
+        blink_xs, blink_ys = np.nonzero(unpowered)
+        self._blink_cells = list(zip(blink_xs.tolist(), blink_ys.tolist()))
+
+        resolved = resolve_tiles_for_render(tiles, False)
+        xs, ys = np.nonzero(resolved != self._base_tiles)
+        self._base_tiles = resolved.astype(np.int16)
+        if xs.size == 0:
+            return 0
+
+        size = self.tile_size
+        full = xs.size == WORLD_X * WORLD_Y
+        if full:
+            self._base_surface.fill(_CLEAR)
+        else:
+            for tile_x, tile_y in zip(xs.tolist(), ys.tolist()):
+                rect = (tile_x * size, tile_y * size, size, size)
+                self._base_surface.fill(_CLEAR, rect)
+        if atlas is not None:
+            # Straight blits from the atlas sheet at this tile size.
+            sheet = atlas.sheet(size)
+            self._base_surface.blits(
+                [
+                    (sheet, (tile_x * size, tile_y * size), atlas.tile_rect(tile, size))
+                    for tile_x, tile_y, tile in zip(
+                        xs.tolist(), ys.tolist(), resolved[xs, ys].tolist()
                     )
-                    self._base_surface.blit(scaled, dest)
+                ],
+                doreturn=False,
+            )
+        return int(xs.size)
+
+    def _draw_blink_layer(self, result_surface: pygame.Surface) -> None:
+        if not self._blink_cells:
+            return
+        size = self.tile_size
+        for tile_x, tile_y in self._blink_cells:
+            result_surface.fill(_CLEAR, (tile_x * size, tile_y * size, size, size))
+        if self._base_atlas is not None:
+            bolt = self._base_atlas.tile(LIGHTNINGBOLT, size)
+            result_surface.blits(
+                [
+                    (bolt, (tile_x * size, tile_y * size))
+                    for tile_x, tile_y in self._blink_cells
+                ],
+                doreturn=False,
+            )
 
     def _build_dynamic_filter_overlay(self) -> pygame.Surface | None:
-        if len(self.context.dynamic_data) < 16:
+        dynamic_data = self.context.dynamic_data
+        if len(dynamic_data) < 16:
             return None
 
-        surface = pygame.Surface(self._base_surface.get_size(), pygame.SRCALPHA)
-        has_data = False
-        for tile_x in range(WORLD_X):
-            for tile_y in range(WORLD_Y):
-                if not dynamicFilter(self.context, tile_x, tile_y):
-                    continue
-                has_data = True
-                rect = pygame.Rect(
-                    tile_x * self.tile_size,
-                    tile_y * self.tile_size,
-                    self.tile_size,
-                    self.tile_size,
-                )
-                surface.fill(_DYNAMIC_FILTER_COLOR, rect)
-        return surface if has_data else None
+        token = (getattr(self.context, "cycle", 0), tuple(dynamic_data[:16]))
+        if token == self._dynamic_token:
+            return self._dynamic_surface
+        self._dynamic_token = token
+
+        mask = dynamic_filter_mask(self.context)
+        if self._dynamic_mask is not None and np.array_equal(mask, self._dynamic_mask):
+            return self._dynamic_surface
+        self._dynamic_mask = mask
+        if not mask.any():
+            self._dynamic_surface = None
+            return None
+        colors = np.zeros((WORLD_X, WORLD_Y, 4), dtype=np.uint8)
+        colors[mask] = _DYNAMIC_FILTER_COLOR
+        self._dynamic_surface = color_grid_surface(
+            colors, self.tile_size, self._base_surface
+        )
+        return self._dynamic_surface
 
     def _draw_viewport_rect(self, result_surface: pygame.Surface) -> None:
         try:
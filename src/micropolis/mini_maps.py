@@ -13,23 +13,49 @@ Key features:
 - Support for multiple color depths and rendering modes
 """
 
-from collections.abc import Callable
 from typing import Any
 
+import numpy as np
+import pygame
+
 from micropolis.constants import (
     WORLD_X,
     WORLD_Y,
     POWERED,
     UNPOWERED,
     CONDUCTIVE,
-    LOMASK,
-    ZONEBIT,
-    PWRBIT,
-    CONDBIT,
     TILE_COUNT,
 )
 from micropolis.context import AppContext
+from micropolis.graphics_setup import get_tile_atlas
+from micropolis.map_raster import (
+    NON_COM_TILES,
+    NON_IND_TILES,
+    NON_RES_TILES,
+    NON_TRANSPORT_TILES,
+    map_tile_ids,
+    solid_blocks,
+    tile_filter_lut,
+    tile_image,
+    write_pixels,
+)
+from micropolis.power import (
+    POWER_SHOW_BLANK,
+    POWER_SHOW_CONDUCTIVE,
+    POWER_SHOW_POWERED,
+    POWER_SHOW_TILE,
+    POWER_SHOW_UNPOWERED,
+    classify_power_tiles,
+)
 from micropolis.sim_view import SimView
+from micropolis.tile_map import grid_array, tile_array
+
+# Tile filters of the zone and transport maps (drawRes, drawCom, drawInd and
+# drawLilTransMap in g_smmaps.c): hidden tiles map to tile 0.
+RES_FILTER = tile_filter_lut(NON_RES_TILES)
+COM_FILTER = tile_filter_lut(NON_COM_TILES)
+IND_FILTER = tile_filter_lut(NON_IND_TILES)
+TRANSPORT_FILTER = tile_filter_lut(NON_TRANSPORT_TILES)
 
 
 # ============================================================================
@@ -75,13 +101,7 @@ def drawRes(context: AppContext, view: SimView) -> None:
         view: The view to draw into
         :param context:
     """
-
-    def filter_func(col: int, row: int, tile: int) -> int:
-        if tile > 422:
-            return 0
-        return tile
-
-    _draw_filtered_map(context, view, filter_func)
+    _draw_filtered_map(context, view, RES_FILTER)
 
 
 def drawCom(context: AppContext, view: SimView) -> None:
@@ -94,13 +114,7 @@ def drawCom(context: AppContext, view: SimView) -> None:
         view: The view to draw into
         :param context:
     """
-
-    def filter_func(col: int, row: int, tile: int) -> int:
-        if (tile > 609) or ((tile >= 232) and (tile < 423)):
-            return 0
-        return tile
-
-    _draw_filtered_map(context, view, filter_func)
+    _draw_filtered_map(context, view, COM_FILTER)
 
 
 def drawInd(context: AppContext, view: SimView) -> None:
@@ -113,18 +127,7 @@ def drawInd(context: AppContext, view: SimView) -> None:
         view: The view to draw into
         :param context:
     """
-
-    def filter_func(col: int, row: int, tile: int) -> int:
-        if (
-            ((tile >= 240) and (tile <= 611))
-            or ((tile >= 693) and (tile <= 851))
-            or ((tile >= 860) and (tile <= 883))
-            or (tile >= 932)
-        ):
-            return 0
-        return tile
-
-    _draw_filtered_map(context, view, filter_func)
+    _draw_filtered_map(context, view, IND_FILTER)
 
 
 def drawLilTransMap(context: AppContext, view: SimView) -> None:
@@ -137,13 +140,7 @@ def drawLilTransMap(context: AppContext, view: SimView) -> None:
         view: The view to draw into
         :param context:
     """
-
-    def filter_func(col: int, row: int, tile: int) -> int:
-        if (tile >= 240) or ((tile >= 207) and tile <= 220) or (tile == 223):
-            return 0
-        return tile
-
-    _draw_filtered_map(context, view, filter_func)
+    _draw_filtered_map(context, view, TRANSPORT_FILTER)
 
 
 def drawPower(context: AppContext, view: SimView) -> None:
@@ -161,7 +158,8 @@ def drawPower(context: AppContext, view: SimView) -> None:
     # Get pixel values for current color mode
     view_x = _get_view_attr(view, "x", None)
     pixels = _get_view_attr(view, "pixels", None)
-    if view_x and getattr(view_x, "color", None) and pixels:
+    color_mode = bool(view_x and getattr(view_x, "color", None) and pixels)
+    if color_mode:
         powered = pixels[POWERED] if pixels else 0
         unpowered = pixels[UNPOWERED] if pixels else 0
         conductive = pixels[CONDUCTIVE] if pixels else 0
@@ -180,8 +178,30 @@ def drawPower(context: AppContext, view: SimView) -> None:
     else:
         image_base = _get_view_attr(view, "data8", None)  # type: ignore
 
+    # Classify every tile up front; the loop below only dispatches renders.
+    classes, tiles = classify_power_tiles(tile_array(context.map_data))
+    colors = {
+        POWER_SHOW_POWERED: powered,
+        POWER_SHOW_UNPOWERED: unpowered,
+        POWER_SHOW_CONDUCTIVE: conductive,
+    }
+    tiles[classes == POWER_SHOW_BLANK] = 0
+
+    # Solid-colour tiles index blocks appended after the small tiles.
+    solid_kinds = (POWER_SHOW_POWERED, POWER_SHOW_UNPOWERED, POWER_SHOW_CONDUCTIVE)
+    ids = tiles.copy()
+    for offset, kind in enumerate(solid_kinds):
+        ids[classes == kind] = TILE_COUNT + offset
+    solid = solid_blocks(
+        [_pixel_rgb(colors[kind], color_mode) for kind in solid_kinds], 4
+    )
+    if _draw_small_tile_image(view, ids, solid):
+        return
+
     # Process each tile
-    for col in range(WORLD_X):
+    for col, (col_classes, col_tiles) in enumerate(
+        zip(classes.tolist(), tiles.tolist())
+    ):
         # Calculate image buffer offset (for pygame integration)
         if image_base and isinstance(image_base, bytes):
             # For testing, skip actual buffer manipulation
@@ -191,40 +211,15 @@ def drawPower(context: AppContext, view: SimView) -> None:
                 image_base  # For pygame surfaces, this would be calculated differently
             )
 
-        for row in range(WORLD_Y):
-            tile = context.map_data[col][row]
-
-            if (tile & LOMASK) >= TILE_COUNT:
-                tile -= TILE_COUNT
-
-            tile &= LOMASK
-            pix = -1
-
-            # Determine pixel color based on tile properties
-            if tile <= 63:
-                # Terrain/water tiles - use normal rendering
-                tile &= LOMASK
-                pix = -1
-            elif tile & ZONEBIT:
-                # Zone tiles - show power status
-                pix = powered if (tile & PWRBIT) else unpowered
-            else:
-                # Other tiles - check if conductive
-                if tile & CONDBIT:
-                    pix = conductive
-                else:
-                    tile = 0
-                    pix = -1
-
-            if pix < 0:
+        for kind, tile in zip(col_classes, col_tiles):
+            if kind == POWER_SHOW_TILE or kind == POWER_SHOW_BLANK:
                 # Use normal tile rendering
                 _render_small_tile(view, image, tile, line_bytes, pixel_bytes)
             else:
                 # Use solid color rendering
-                _render_solid_color(view, image, pix, line_bytes, pixel_bytes)
-
-            # Move to next row (3 pixels down)
-            # In pygame, this would update the surface position
+                _render_solid_color(
+                    view, image, colors[kind], line_bytes, pixel_bytes
+                )
 
             # Move to next row (3 pixels down)
             if image:
@@ -241,14 +236,7 @@ def drawDynamic(context: AppContext, view: SimView) -> None:
         view: The view to draw into
         :param context:
     """
-
-    def filter_func(col: int, row: int, tile: int) -> int:
-        if tile > 63:
-            if not dynamicFilter(context, col, row):
-                return 0
-        return tile
-
-    _draw_filtered_map(context, view, filter_func)
+    _draw_filtered_map(context, view, visible=dynamic_filter_mask(context))
 
 
 # ============================================================================
@@ -256,19 +244,39 @@ def drawDynamic(context: AppContext, view: SimView) -> None:
 # ============================================================================
 
 
+def _pixel_rgb(value: int, color_mode: bool) -> tuple[int, int, int]:
+    """RGB for a view pixel value: 0xRRGGBB in colour mode, else a gray level."""
+    if color_mode:
+        return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+    return (value & 0xFF,) * 3
+
+
 def _draw_filtered_map(
     context: AppContext,
     view: SimView,
-    filter_func: Callable[[int, int, int], int] | None = None,
+    tile_filter: np.ndarray | None = None,
+    visible: np.ndarray | None = None,
 ) -> None:
     """
     Generic function to draw a filtered small map.
 
     Args:
         view: The view to draw into
-        filter_func: Optional filter function that takes (col, row, tile) and returns filtered tile
+        tile_filter: Optional lookup table mapping each tile id to the tile
+            drawn in its place (see ``tile_filter_lut``)
+        visible: Optional ``(WORLD_X, WORLD_Y)`` mask; non-terrain tiles
+            (ids above 63) outside it are drawn as tile 0
         :param context:
     """
+    tiles = map_tile_ids(context.map_data)
+    if tile_filter is not None:
+        tiles = tile_filter[tiles]
+    if visible is not None:
+        tiles = np.where((tiles > 63) & ~visible, 0, tiles)
+
+    if _draw_small_tile_image(view, tiles):
+        return
+
     line_bytes = _get_view_attr(view, "line_bytes8", 0)
     pixel_bytes = _get_view_attr(view, "pixel_bytes", 0)
 
@@ -281,7 +289,7 @@ def _draw_filtered_map(
         image_base = _get_view_attr(view, "data8", None)  # type: ignore
 
     # Process each tile
-    for col in range(WORLD_X):
+    for col, col_tiles in enumerate(tiles.tolist()):
         # Calculate image buffer offset (for pygame integration)
         if image_base and isinstance(image_base, bytes):
             # For testing, skip actual buffer manipulation
@@ -291,18 +299,7 @@ def _draw_filtered_map(
                 image_base  # For pygame surfaces, this would be calculated differently
             )
 
-        for row in range(WORLD_Y):
-            tile = context.map_data[col][row]
-
-            if (tile & LOMASK) >= TILE_COUNT:
-                tile -= TILE_COUNT
-
-            tile &= LOMASK
-
-            # Apply filtering if provided
-            if filter_func:
-                tile = filter_func(col, row, tile)
-
+        for tile in col_tiles:
             # Render the tile
             _render_small_tile(view, image, tile, line_bytes, pixel_bytes)
 
@@ -310,6 +307,44 @@ def _draw_filtered_map(
             # In pygame, this would update the surface position
 
 
+def _draw_small_tile_image(
+    view: SimView,
+    tiles: np.ndarray,
+    extra_blocks: np.ndarray | None = None,
+) -> bool:
+    """
+    Draw the whole map into the view's pygame surface in one write.
+
+    Each tile takes the visible 3×3 corner of its 4×4 small tile, or the
+    whole tile if the surface is 4 pixels per tile wide.
+
+    Args:
+        view: The view to draw into
+        tiles: ``(WORLD_X, WORLD_Y)`` small tile ids; ids from
+            ``TILE_COUNT`` up select ``extra_blocks``
+        extra_blocks: Optional ``[i, x, y, rgb]`` blocks, e.g. solid colors
+
+    Returns:
+        False if the view has no surface or small tile sheet to draw with
+    """
+    surface = _get_view_attr(view, "surface", None)
+    if not isinstance(surface, pygame.Surface):
+        return False
+    try:
+        atlas = get_tile_atlas(view, small=True)
+    except pygame.error:
+        return False
+    if atlas is None:
+        return False
+
+    block = 4 if surface.get_width() >= WORLD_X * 4 else 3
+    blocks = atlas.pixels(4)[:, :block, :block]
+    if extra_blocks is not None:
+        blocks = np.concatenate((blocks, extra_blocks[:, :block, :block]))
+    write_pixels(surface, tile_image(tiles, blocks))
+    return True
+
+
 def _render_small_tile(
     view: SimView,
     image: Any | None,
@@ -457,3 +492,52 @@ def dynamicFilter(context: AppContext, col: int, row: int) -> int:
         return 0
 
     return 1
+
+
+# dynamicFilter criteria in dynamic_data order: (context field, extra shift
+# applied to the half-size index, scale and bias applied to the bounds).
+_DYNAMIC_CRITERIA: tuple[tuple[str, int, int, int], ...] = (
+    ("pop_density", 0, 1, 0),
+    ("rate_og_mem", 2, 2, -256),
+    ("trf_density", 0, 1, 0),
+    ("pollution_mem", 0, 1, 0),
+    ("crime_mem", 0, 1, 0),
+    ("land_value_mem", 0, 1, 0),
+    ("police_map_effect", 2, 1, 0),
+    ("fire_rate", 2, 1, 0),
+)
+
+
+def dynamic_filter_mask(context: AppContext) -> np.ndarray:
+    """
+    Evaluate dynamicFilter for every tile of the map at once.
+
+    Args:
+        context: Application context holding dynamic_data and the scan maps
+
+    Returns:
+        ``(WORLD_X, WORLD_Y)`` boolean array, True where dynamicFilter
+        returns 1
+    """
+    dynamic_data = context.dynamic_data
+    cols = np.arange(WORLD_X) >> 1
+    rows = np.arange(WORLD_Y) >> 1
+    mask = np.ones((WORLD_X, WORLD_Y), dtype=bool)
+    try:
+        for i, (name, shift, scale, bias) in enumerate(_DYNAMIC_CRITERIA):
+            low = dynamic_data[2 * i]
+            high = dynamic_data[2 * i + 1]
+            if low > high:
+                continue
+            values = grid_array(getattr(context, name))
+            values = values[np.ix_(cols >> shift, rows >> shift)].astype(np.int64)
+            mask &= (values >= scale * low + bias) & (values <= scale * high + bias)
+    except (IndexError, TypeError, ValueError):
+        # Ragged or undersized grids: evaluate tile by tile.
+        return np.array(
+            [
+                [bool(dynamicFilter(context, col, row)) for row in range(WORLD_Y)]
+                for col in range(WORLD_X)
+            ]
+        )
+    return mask
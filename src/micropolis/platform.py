@@ -670,6 +670,7 @@ def do_stop_micropolis(context: AppContext, sim: Sim) -> None:
     sim.maps = 0
     sim.graphs = 0
     sim.sprites = 0
+    context.sprite_index.clear()
 
 
 def do_timeout_listen() -> None:
@@ -679,8 +680,12 @@ def do_timeout_listen() -> None:
     pass
 
 
-def make_new_sim() -> Sim:
-    """Create a new Sim instance (adapted for pygame)."""
+def make_new_sim(context: AppContext | None = None) -> Sim:
+    """Create a new Sim instance (adapted for pygame).
+
+    If ``context`` is given, its sprite index is cleared to match the new
+    sim's empty sprite list.
+    """
     sim = Sim()
     sim.editors = 0
     sim.editor = None
@@ -690,4 +695,6 @@ def make_new_sim() -> Sim:
     sim.graph = None
     sim.sprites = 0
     sim.sprite = None
+    if context is not None:
+        context.sprite_index.clear()
     return sim
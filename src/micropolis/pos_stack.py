@@ -0,0 +1,80 @@
+"""
+pos_stack.py - Fixed-size position stack for traffic routing
+
+s_traf.c records the route of a trip in two ``short`` arrays,
+``SMapXStack[MAXDIS]`` and ``SMapYStack[MAXDIS]``, with ``PosStackN`` as the
+top index. Entries are stored from index 1 upward: ``PushPos`` increments
+before writing. ``PosStack`` keeps the same layout in two preallocated
+``array('h')`` buffers. The traffic code pushes and pops on this object
+directly instead of growing lists on the context one step at a time.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+
+from .constants import MAXDIS
+
+
+class PosStack:
+    """Route positions of the trip being traced, bottom (index 1) to top.
+
+    Attributes:
+        xs: X coordinates; ``xs[1..count]`` are in use
+        ys: Y coordinates; ``ys[1..count]`` are in use
+        count: Number of positions on the stack (``PosStackN``)
+    """
+
+    __slots__ = ("xs", "ys", "count")
+
+    def __init__(self, capacity: int = MAXDIS) -> None:
+        self.xs = array("h", bytes(2 * (capacity + 1)))
+        self.ys = array("h", bytes(2 * (capacity + 1)))
+        self.count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.xs) - 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Positions from the bottom of the stack to the top."""
+        xs = self.xs
+        ys = self.ys
+        for i in range(1, self.count + 1):
+            yield xs[i], ys[i]
+
+    def push(self, x: int, y: int) -> None:
+        """Push (x, y); raises IndexError when the stack is full."""
+        n = self.count + 1
+        self.xs[n] = x
+        self.ys[n] = y
+        self.count = n
+
+    def pop(self) -> tuple[int, int]:
+        """Remove and return the top position."""
+        n = self.count
+        if n <= 0:
+            raise IndexError("pop from empty PosStack")
+        self.count = n - 1
+        return self.xs[n], self.ys[n]
+
+    def extend(self, positions: Iterable[tuple[int, int]]) -> None:
+        for x, y in positions:
+            self.push(x, y)
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def load(self, xs: Iterable[int], ys: Iterable[int]) -> None:
+        """Overwrite the buffers from index 0 without changing ``count``."""
+        for i, x in enumerate(xs):
+            self.xs[i] = x
+        for i, y in enumerate(ys):
+            self.ys[i] = y
+
+    def __repr__(self) -> str:
+        return f"PosStack(count={self.count}, top={list(self)[-1:]})"
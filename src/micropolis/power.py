@@ -9,82 +9,236 @@ Based on s_power.c from the original C codebase.
 """
 
 import array
+import sys
+
+import numpy as np
 
 from micropolis.constants import (
     CONDBIT,
+    LOMASK,
     PWRBIT,
     PWRMAPSIZE,
     PWRSTKSIZE,
     POWERMAPROW,
+    TILE_COUNT,
     WORLD_X,
     WORLD_Y,
+    ZONEBIT,
 )
+from micropolis import compat_shims
 from micropolis.context import AppContext
+from micropolis.tile_map import tile_array
 
-power_stack_num = 0
-max_power = 0
-num_power = 0
+# Power scan statistics live on AppContext; these names are read-only views.
+_CONTEXT_SHIMS: dict[str, str] = {
+    "power_stack_num": "power_stack_num",
+    "max_power": "max_power",
+    "num_power": "num_power",
+}
 
 
 def DoPowerScan(context: AppContext) -> None:
     """
     Perform power grid connectivity scan.
 
-    This function implements a flood-fill algorithm to determine which areas
-    of the city receive power from power plants. It starts from all power
-    plants and spreads power to connected conductive tiles.
+    Determines which areas of the city receive power from power plants:
+    every PWRBIT source plus every conductive network touching one. The
+    result is written to the packed power map.
     :param context:
     """
-    # AppContext is now the authoritative source for all state
-
-    # Clear the power map
-    # context.power_map = array.array("H", [0] * PWRMAPSIZE)
-    context.power_map = [0] * PWRMAPSIZE
-
     # Reset power statistics
     context.max_power = context.coal_pop * 700 + context.nuclear_pop * 2000
     context.num_power = 0
-    # Find all power plants and add them to the stack
     context.power_stack_num = 0
-    for x in range(WORLD_X):
-        for y in range(WORLD_Y):
-            tile = context.map_data[x][y]
-            # Check if this is a power plant tile
-            if tile & PWRBIT != 0:
-                if context.power_stack_num < PWRSTKSIZE:
-                    context.power_stack_x[context.power_stack_num] = x
-                    context.power_stack_y[context.power_stack_num] = y
-                    context.power_stack_num += 1
-                # Mark this tile as powered
-                SetPowerBit(context, x, y)
-
-    # Process the power stack using flood-fill
-    while context.power_stack_num > 0:
-        context.power_stack_num -= 1
-        x = context.power_stack_x[context.power_stack_num]
-        y = context.power_stack_y[context.power_stack_num]
-
-        # Spread power to adjacent conductive tiles
-        for dir in range(4):  # 4 directions: north, east, south, west
-            nx, ny = MoveMapSim(x, y, dir)
-            if (
-                    nx >= 0
-                    and nx < WORLD_X
-                    and ny >= 0
-                    and ny < WORLD_Y
-            ):
-                if TestForCond(context, nx, ny):
-                    if not TestPowerBit(context, nx, ny):
-                        SetPowerBit(context, nx, ny)
-                        if context.power_stack_num < PWRSTKSIZE:
-                            context.power_stack_x[context.power_stack_num] = nx
-                            context.power_stack_y[context.power_stack_num] = ny
-                            context.power_stack_num += 1
-
-    global power_stack_num, max_power, num_power
-    power_stack_num = context.power_stack_num
-    max_power = context.max_power
-    num_power = context.num_power
+
+    # Connectivity comes from the incremental index rather than a fresh
+    # flood fill; it only rebuilds after conductors have been removed.
+    tiles = tile_array(context.map_data)
+    powered = context.power_index.powered_mask(tiles)
+    store_power_words(context, pack_power_map(powered))
+
+
+# ============================================================================
+# Packed Power Map
+# ============================================================================
+
+# Bit weights of the 16 tiles held in each power map word.
+_WORD_BITS = np.arange(16, dtype=np.uint16)
+
+
+def new_power_map() -> array.array:
+    """Return a zeroed packed power map of ``PWRMAPSIZE`` unsigned shorts."""
+    return array.array("H", bytes(2 * PWRMAPSIZE))
+
+
+def pack_power_map(powered: np.ndarray) -> np.ndarray:
+    """
+    Pack a ``(WORLD_X, WORLD_Y)`` bool grid into power map words.
+
+    Each word holds 16 horizontally adjacent tiles, laid out as in
+    ``powerword``.
+    """
+    padded = np.zeros((POWERMAPROW * 16, WORLD_Y), dtype=np.uint16)
+    padded[:WORLD_X] = powered
+    bits = padded.reshape(POWERMAPROW, 16, WORLD_Y) << _WORD_BITS[None, :, None]
+    return np.bitwise_or.reduce(bits, axis=1).T.ravel()
+
+
+def unpack_power_map(words: np.ndarray) -> np.ndarray:
+    """Expand power map words into a ``(WORLD_X, WORLD_Y)`` bool grid."""
+    rows = words.reshape(WORLD_Y, POWERMAPROW, 1) >> _WORD_BITS
+    bits = (rows & 1).reshape(WORLD_Y, POWERMAPROW * 16)
+    return bits[:, :WORLD_X].T.astype(bool)
+
+
+def power_words(context: AppContext) -> np.ndarray:
+    """
+    Return the power map as a ``uint16`` word array.
+
+    For the packed ``array('H')`` backend this is a live view sharing the
+    buffer; other sequences (older saves and tests) are copied.
+    :param context:
+    """
+    power_map = context.power_map
+    if isinstance(power_map, array.array) and power_map.typecode == "H":
+        return np.frombuffer(power_map, dtype=np.uint16)
+    return np.array(power_map, dtype=np.int64).astype(np.uint16)
+
+
+def store_power_words(context: AppContext, words: np.ndarray | int) -> None:
+    """
+    Write words (or one value for every word) into the power map.
+
+    Non-packed power maps are replaced with a packed ``array('H')``.
+    :param context:
+    """
+    power_map = context.power_map
+    if not (
+        isinstance(power_map, array.array)
+        and power_map.typecode == "H"
+        and len(power_map) == PWRMAPSIZE
+    ):
+        power_map = context.power_map = new_power_map()
+    np.frombuffer(power_map, dtype=np.uint16)[:] = words
+
+
+def powered_grid(context: AppContext) -> np.ndarray:
+    """
+    Export the power map as a ``(WORLD_X, WORLD_Y)`` bool grid.
+    :param context:
+    """
+    return unpack_power_map(power_words(context))
+
+
+def count_powered_tiles(context: AppContext) -> int:
+    """
+    Count the tiles marked powered in the power map.
+    :param context:
+    """
+    return int(np.unpackbits(power_words(context).view(np.uint8)).sum())
+
+
+def powered_rect(
+    context: AppContext, x: int, y: int, width: int, height: int
+) -> np.ndarray:
+    """
+    Test the power bits of a rectangle of tiles.
+
+    Args:
+        context: Application context
+        x: Left column
+        y: Top row
+        width: Rectangle width in tiles
+        height: Rectangle height in tiles
+
+    Returns:
+        ``(width, height)`` bool array, with off-map tiles unpowered
+    """
+    result = np.zeros((width, height), dtype=bool)
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + width, WORLD_X), min(y + height, WORLD_Y)
+    if x0 < x1 and y0 < y1:
+        rows = power_words(context).reshape(WORLD_Y, POWERMAPROW)[y0:y1]
+        bits = (rows[:, :, None] >> _WORD_BITS) & 1
+        grid = bits.reshape(y1 - y0, POWERMAPROW * 16)[:, x0:x1].T
+        result[x0 - x : x1 - x, y0 - y : y1 - y] = grid
+    return result
+
+
+def zone_powered(context: AppContext, x: int, y: int, size: int = 3) -> bool:
+    """
+    Test whether any tile of a zone footprint is powered.
+
+    Args:
+        context: Application context
+        x: Zone centre column
+        y: Zone centre row
+        size: Zone width and height (3, 4 or 6)
+
+    Returns:
+        True if at least one footprint tile has its power bit set
+    """
+    return bool(powered_rect(context, x - 1, y - 1, size, size).any())
+
+
+# Power overlay classes shared by the map view and mini-map drawers,
+# following drawPower() in g_smmaps.c.
+POWER_SHOW_TILE = 0
+POWER_SHOW_POWERED = 1
+POWER_SHOW_UNPOWERED = 2
+POWER_SHOW_CONDUCTIVE = 3
+POWER_SHOW_BLANK = 4
+
+
+def classify_power_tiles(tiles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Classify every tile for the power overlay in one pass.
+
+    Args:
+        tiles: ``(WORLD_X, WORLD_Y)`` tile array
+
+    Returns:
+        Tuple of (class per tile as ``POWER_SHOW_*``, tile number with
+        animation offsets folded back below ``TILE_COUNT``)
+    """
+    low = tiles & LOMASK
+    low = np.where(low >= TILE_COUNT, low - TILE_COUNT, low)
+    zone = (tiles & ZONEBIT) != 0
+    classes = np.where(
+        (tiles & CONDBIT) != 0, POWER_SHOW_CONDUCTIVE, POWER_SHOW_BLANK
+    )
+    classes = np.where(
+        zone,
+        np.where((tiles & PWRBIT) != 0, POWER_SHOW_POWERED, POWER_SHOW_UNPOWERED),
+        classes,
+    )
+    classes = np.where(low <= 63, POWER_SHOW_TILE, classes).astype(np.uint8)
+    return classes, low
+
+
+def fill_power_map(context: AppContext, value: int) -> None:
+    """
+    Set every power map word to ``value``.
+    :param context:
+    """
+    store_power_words(context, value & 0xFFFF)
+
+
+def note_conductor_change(
+    context: AppContext, x: int, y: int, width: int = 1, height: int = 1
+) -> None:
+    """
+    Tell the power index that tiles in a rectangle were edited.
+
+    Tools call this after placing or removing wires and zones so the
+    connectivity index stays current between power scans.
+    :param context:
+    """
+    context.power_index.note_region(
+        tile_array(context.map_data), x, y, width, height
+    )
+
+
 def MoveMapSim(x: int, y: int, dir: int) -> tuple[int, int]:
     """
     Move to adjacent tile in specified direction.
@@ -183,8 +337,6 @@ def PushPowerStack(context: AppContext) -> None:
     Used by power plants to add themselves to the flood-fill stack.
     :param context:
     """
-    # global power_stack_num
-
     if context.power_stack_num < (PWRSTKSIZE - 2):
         context.power_stack_num += 1
         context.power_stack_x[context.power_stack_num] = context.s_map_x
@@ -204,10 +356,13 @@ def ClearPowerBit(context: AppContext, x: int, y: int) -> None:
     word = powerword(x, y)
     # Calculate the bit position within the word
     bit = x & 15
-    # Clear the bit
-    context.power_map[word] &= ~(1 << bit)
+    # Clear the bit (masked so packed unsigned words stay in range)
+    context.power_map[word] &= ~(1 << bit) & 0xFFFF
 
 
 def setpowerbit(x: int, y: int, power_map: array.array) -> None:
     """Set power bit at coordinates in power map"""
     power_map[powerword(x, y)] |= 1 << ((x) & 15)
+
+
+compat_shims.install_context_shims(sys.modules[__name__], _CONTEXT_SHIMS)
@@ -0,0 +1,175 @@
+"""
+power_index.py - Incremental connectivity index for the power grid
+
+DoPowerScan in s_power.c rediscovers every power source and flood-fills the
+conductive network on each power phase, even when the map has not changed.
+``PowerIndex`` keeps the conductive tiles (``CONDBIT``) grouped into
+4-connected components with a union-find structure instead:
+
+* Adding a conductor unions it with its conductive neighbours.
+* Removing one marks the index for a rebuild on next use, since union-find
+  cannot split components.
+
+Powered tiles are then every ``PWRBIT`` source plus every component that
+touches a source, which is the same set the flood fill reaches. Tool and
+disaster code can report edits through ``note_region`` as they happen; each
+scan also reconciles against the live tile map so edits made elsewhere are
+never missed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .constants import CONDBIT, PWRBIT, WORLD_X, WORLD_Y
+
+
+class PowerIndex:
+    """Union-find over conductive tiles, indexed as ``x * height + y``."""
+
+    def __init__(self, width: int = WORLD_X, height: int = WORLD_Y) -> None:
+        self.width = width
+        self.height = height
+        self._parent: list[int] = list(range(width * height))
+        self._conductive = np.zeros((width, height), dtype=bool)
+        self._labels: np.ndarray | None = None
+        self._needs_rebuild = True
+        self.rebuilds = 0
+
+    # ------------------------------------------------------------------
+    # Union-find primitives
+    # ------------------------------------------------------------------
+
+    def _find(self, cell: int) -> int:
+        parent = self._parent
+        root = cell
+        while parent[root] != root:
+            root = parent[root]
+        while parent[cell] != root:
+            parent[cell], cell = root, parent[cell]
+        return root
+
+    def _union(self, a: int, b: int) -> None:
+        root_a = self._find(a)
+        root_b = self._find(b)
+        if root_a != root_b:
+            # Keep the smaller index as root so labels are deterministic.
+            if root_a < root_b:
+                self._parent[root_b] = root_a
+            else:
+                self._parent[root_a] = root_b
+
+    def _link(self, x: int, y: int) -> None:
+        """Union a conductive cell with its conductive neighbours."""
+        conductive = self._conductive
+        height = self.height
+        cell = x * height + y
+        if x > 0 and conductive[x - 1, y]:
+            self._union(cell, cell - height)
+        if x < self.width - 1 and conductive[x + 1, y]:
+            self._union(cell, cell + height)
+        if y > 0 and conductive[x, y - 1]:
+            self._union(cell, cell - 1)
+        if y < height - 1 and conductive[x, y + 1]:
+            self._union(cell, cell + 1)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def rebuild(self, tiles: np.ndarray) -> None:
+        """Rebuild all components from the ``(width, height)`` tile array."""
+        self._conductive = (tiles & CONDBIT) != 0
+        self._parent = list(range(self.width * self.height))
+        conductive = self._conductive
+        height = self.height
+        # Vertical then horizontal conductive pairs, as flat cell indices.
+        xs, ys = np.nonzero(conductive[:, :-1] & conductive[:, 1:])
+        for cell in (xs * height + ys).tolist():
+            self._union(cell, cell + 1)
+        xs, ys = np.nonzero(conductive[:-1, :] & conductive[1:, :])
+        for cell in (xs * height + ys).tolist():
+            self._union(cell, cell + height)
+        self._labels = None
+        self._needs_rebuild = False
+        self.rebuilds += 1
+
+    def note_region(
+        self, tiles: np.ndarray, x: int, y: int, width: int = 1, height: int = 1
+    ) -> None:
+        """Record edits to the tiles in a rectangle of the map.
+
+        Args:
+            tiles: ``(width, height)`` tile array after the edit
+            x: Left column of the edited rectangle
+            y: Top row of the edited rectangle
+            width: Rectangle width in tiles
+            height: Rectangle height in tiles
+        """
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.width), min(y + height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        now = (tiles[x0:x1, y0:y1] & CONDBIT) != 0
+        before = self._conductive[x0:x1, y0:y1]
+        if (before & ~now).any():
+            self._needs_rebuild = True
+        if self._needs_rebuild:
+            return
+        added = np.nonzero(now & ~before)
+        if not added[0].size:
+            return
+        self._conductive[x0:x1, y0:y1] = now
+        for dx, dy in zip(*(axis.tolist() for axis in added)):
+            self._link(x0 + dx, y0 + dy)
+        self._labels = None
+
+    def sync(self, tiles: np.ndarray) -> None:
+        """Bring the index in line with ``tiles``, rebuilding if needed."""
+        if self._needs_rebuild:
+            self.rebuild(tiles)
+            return
+        self.note_region(tiles, 0, 0, self.width, self.height)
+        if self._needs_rebuild:
+            self.rebuild(tiles)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def labels(self) -> np.ndarray:
+        """Component root for every cell.
+
+        Non-conductive cells get the sentinel ``width * height``.
+        """
+        if self._labels is None:
+            find = self._find
+            size = self.width * self.height
+            labels = np.full(size, size, dtype=np.intp)
+            cells = np.flatnonzero(self._conductive)
+            labels[cells] = [find(cell) for cell in cells.tolist()]
+            self._labels = labels.reshape(self.width, self.height)
+        return self._labels
+
+    def powered_mask(self, tiles: np.ndarray) -> np.ndarray:
+        """Return the tiles reached from ``PWRBIT`` sources as a bool grid.
+
+        Args:
+            tiles: ``(width, height)`` tile array
+
+        Returns:
+            Boolean array marking sources and every conductive component
+            that touches a source
+        """
+        self.sync(tiles)
+        sources = (tiles & PWRBIT) != 0
+        touched = sources.copy()
+        touched[1:, :] |= sources[:-1, :]
+        touched[:-1, :] |= sources[1:, :]
+        touched[:, 1:] |= sources[:, :-1]
+        touched[:, :-1] |= sources[:, 1:]
+        labels = self.labels()
+        live = np.zeros(labels.size + 1, dtype=bool)
+        live[labels[touched & self._conductive]] = True
+        live[-1] = False
+        return sources | live[labels]
@@ -4,7 +4,9 @@ random.py - Random number generation for Micropolis Python port
 This module contains the random number generation functions ported from rand.c and random.c,
 maintaining exact algorithmic compatibility with the original C implementation.
 """
-from micropolis.constants import SIM_RAND_MAX, TYPE_0, MAX_TYPES, BREAK_0, BREAK_1, DEG_0, SEP_0, BREAK_2, TYPE_1, \
+import numpy as np
+
+from micropolis.constants import TYPE_0, MAX_TYPES, BREAK_0, BREAK_1, DEG_0, SEP_0, BREAK_2, TYPE_1, \
     DEG_1, SEP_1, BREAK_3, TYPE_2, DEG_2, SEP_2, BREAK_4, TYPE_3, DEG_3, SEP_3, TYPE_4, DEG_4, SEP_4
 from micropolis.context import AppContext
 
@@ -29,9 +31,7 @@ def sim_rand(context: AppContext) -> int:
     Uses the same algorithm as the original C implementation.
     :param context:
     """
-    # global _next
-    context.next = context.next * 1103515245 + 12345
-    return (context.next % ((SIM_RAND_MAX + 1) << 8)) >> 8
+    return context.sim_rng.rand()
 
 def sim_srand(context: AppContext, seed: int) -> None:
     """
@@ -40,8 +40,21 @@ def sim_srand(context: AppContext, seed: int) -> None:
     Args:
         seed: The seed value to initialize the generator
     """
-    # global _next
-    context.next = seed
+    context.sim_rng.seed(seed)
+
+
+def sim_rand_n(context: AppContext, k: int) -> np.ndarray:
+    """
+    Draw the next k values of sim_rand() at once.
+
+    Args:
+        k: Number of values to draw
+
+    Returns:
+        uint16 array equal to k successive sim_rand() results
+        :param context:
+    """
+    return context.sim_rng.draw_n(k)
 
 # ============================================================================
 # Advanced Random Number Generator (from random.c)
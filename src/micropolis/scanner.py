@@ -5,29 +5,62 @@ This module contains the scanning and analysis functions ported from s_scan.c,
 implementing fire analysis, population density scanning, pollution/terrain/land value
 analysis, crime scanning, and various smoothing operations.
 """
-from micropolis.constants import NMAPS, SM_X, SM_Y, DYMAP, FIMAP, WORLD_X, WORLD_Y, ZONEBIT, LOMASK, HWLDX, HWLDY, \
-    PDMAP, RGMAP, FREEZ, COMBASE, INDBASE, PORTBASE, QWX, QWY, RUBBLE, ROADBASE, PLMAP, LVMAP, POWERBASE, HTRFBASE, \
-    LTRFBASE, FIREBASE, RADTILE, LASTIND, LASTPOWERPLANT, CRMAP, POMAP
+import sys
+
+from micropolis.constants import (
+    CRMAP,
+    DYMAP,
+    FIMAP,
+    FREEZ,
+    HWLDX,
+    HWLDY,
+    LOMASK,
+    LVMAP,
+    PDMAP,
+    PLMAP,
+    POMAP,
+    RGMAP,
+    ROADBASE,
+    RUBBLE,
+    SM_X,
+    SM_Y,
+    WORLD_X,
+    WORLD_Y,
+    ZONEBIT,
+)
+from micropolis import compat_shims
 from micropolis.context import AppContext
 from micropolis.simulation import rand16
-from micropolis.zones import DoFreePop, RZPop, CZPop, IZPop
+from micropolis.smoothing import (
+    serpentine_dither,
+    smooth_average,
+    smooth_half,
+    smooth_into,
+)
+from micropolis.tile_classes import POLLUTION, POP_DENSITY
+from micropolis.tile_map import fill_grid, grid_array, store_grid_array
+from micropolis.zones import DoFreePop
 
 # ============================================================================
-# Global Scanner State
+# Legacy Scanner Globals
 # ============================================================================
 
-# Map update flags
-NewMap: int = 0
-NewMapFlags: list[int] = [0] * NMAPS
-CCx: int = 0
-CCy: int = 0
-CCx2: int = 0
-CCy2: int = 0
-PolMaxX: int = 0
-PolMaxY: int = 0
-CrimeMaxX: int = 0
-CrimeMaxY: int = 0
-DonDither: int = 0
+# s_scan.c kept these as globals; they now live on AppContext so several
+# cities can be scanned in one interpreter. The module names remain as
+# read-only views (see compat_shims.install_context_shims).
+_CONTEXT_SHIMS: dict[str, str] = {
+    "NewMap": "new_map",
+    "NewMapFlags": "new_map_flags",
+    "CCx": "cc_x",
+    "CCy": "cc_y",
+    "CCx2": "cc_x2",
+    "CCy2": "cc_y2",
+    "PolMaxX": "pol_max_x",
+    "PolMaxY": "pol_max_y",
+    "CrimeMaxX": "crime_max_x",
+    "CrimeMaxY": "crime_max_y",
+    "DonDither": "don_dither",
+}
 
 
 # ============================================================================
@@ -47,12 +80,10 @@ def FireAnalysis(context: AppContext) -> None:
     SmoothFSMap(context)
     SmoothFSMap(context)
 
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            context.fire_rate[x][y] = context.fire_st_map[x][y]
+    store_grid_array(context.fire_rate, grid_array(context.fire_st_map))
 
-    NewMapFlags[DYMAP] = 1
-    NewMapFlags[FIMAP] = 1
+    context.new_map_flags[DYMAP] = 1
+    context.new_map_flags[FIMAP] = 1
 
 
 # ============================================================================
@@ -81,7 +112,7 @@ def PopDenScan(context: AppContext) -> None:
                 z = z & LOMASK
                 context.s_map_x = x
                 context.s_map_y = y
-                z = GetPDen(z) << 3
+                z = GetPDen(context, z) << 3
                 if z > 254:
                     z = 254
                 context.tem[x >> 1][y >> 1] = z
@@ -93,27 +124,27 @@ def PopDenScan(context: AppContext) -> None:
     DoSmooth2(context)  # T2 -> T1
     DoSmooth(context)  # T1 -> T2
 
-    for x in range(HWLDX):
-        for y in range(HWLDY):
-            context.pop_density[x][y] = context.tem2[x][y] << 1
+    # PopDensity is a Byte map in C, so the doubled value wraps.
+    store_grid_array(
+        context.pop_density, (grid_array(context.tem2) << 1) & 0xFF
+    )
 
     DistIntMarket(context)  # set ComRate w/ (/ComMap)
 
     # Find Center of Mass for City
-    # global CCx, CCy, CCx2, CCy2
     if Ztot:
-        context.CCx = Xtot // Ztot
-        context.CCy = Ytot // Ztot
+        context.cc_x = Xtot // Ztot
+        context.cc_y = Ytot // Ztot
     else:
-        context.CCx = HWLDX  # if pop=0 center of Map is CC
-        context.CCy = HWLDY
+        context.cc_x = HWLDX  # if pop=0 center of Map is CC
+        context.cc_y = HWLDY
 
-    context.CCx2 = context.CCx >> 1
-    context.CCy2 = context.CCy >> 1
+    context.cc_x2 = context.cc_x >> 1
+    context.cc_y2 = context.cc_y >> 1
 
-    NewMapFlags[DYMAP] = 1
-    NewMapFlags[PDMAP] = 1
-    NewMapFlags[RGMAP] = 1
+    context.new_map_flags[DYMAP] = 1
+    context.new_map_flags[PDMAP] = 1
+    context.new_map_flags[RGMAP] = 1
 
 
 def GetPDen(context: AppContext, Ch9: int) -> int:
@@ -133,19 +164,7 @@ def GetPDen(context: AppContext, Ch9: int) -> int:
         pop = DoFreePop(context)
         return pop
 
-    if Ch9 < COMBASE:
-        pop = RZPop(Ch9)
-        return pop
-
-    if Ch9 < INDBASE:
-        pop = CZPop(Ch9) << 3
-        return pop
-
-    if Ch9 < PORTBASE:
-        pop = IZPop(Ch9) << 3
-        return pop
-
-    return 0
+    return POP_DENSITY[Ch9]
 
 
 # ============================================================================
@@ -166,9 +185,7 @@ def PTLScan(context: AppContext) -> None:
     LVnum = 0
 
     # Initialize Qtem array
-    for x in range(QWX):
-        for y in range(QWY):
-            context.Qtem[x][y] = 0
+    fill_grid(context.Qtem, 0)
 
     for x in range(HWLDX):
         for y in range(HWLDY):
@@ -184,7 +201,7 @@ def PTLScan(context: AppContext) -> None:
                         if loc < RUBBLE:
                             context.Qtem[x >> 1][y >> 1] += 15  # inc terrainMem
                             continue
-                        Plevel += GetPValue(loc)
+                        Plevel += POLLUTION[loc]
                         if loc >= ROADBASE:
                             LVflag += 1
 
@@ -195,7 +212,7 @@ def PTLScan(context: AppContext) -> None:
             context.tem[x][y] = Plevel
 
             if LVflag:  # LandValue Equation
-                dis = 34 - GetDisCC(x, y)
+                dis = 34 - GetDisCC(context, x, y)
                 dis = dis << 2
                 dis += context.terrain_mem[x >> 1][y >> 1]
                 dis -= context.pollution_mem[x][y]
@@ -221,7 +238,6 @@ def PTLScan(context: AppContext) -> None:
     DoSmooth2(context)
 
     # Process pollution data
-    # global PolMaxX, PolMaxY
     pmax = 0
     pnum = 0
     ptot = 0
@@ -234,10 +250,10 @@ def PTLScan(context: AppContext) -> None:
                 pnum += 1
                 ptot += z
                 # find max pol for monster
-                if (z > pmax) or ((z == pmax) and ((rand16() & 3) == 0)):
+                if (z > pmax) or ((z == pmax) and ((rand16(context) & 3) == 0)):
                     pmax = z
-                    context.PolMaxX = x << 1
-                    context.PolMaxY = y << 1
+                    context.pol_max_x = x << 1
+                    context.pol_max_y = y << 1
 
     # Calculate pollution average
     if pnum:
@@ -247,9 +263,9 @@ def PTLScan(context: AppContext) -> None:
 
     SmoothTerrain(context)
 
-    NewMapFlags[DYMAP] = 1
-    NewMapFlags[PLMAP] = 1
-    NewMapFlags[LVMAP] = 1
+    context.new_map_flags[DYMAP] = 1
+    context.new_map_flags[PLMAP] = 1
+    context.new_map_flags[LVMAP] = 1
 
 
 def GetPValue(loc: int) -> int:
@@ -264,49 +280,32 @@ def GetPValue(loc: int) -> int:
     Returns:
         Pollution contribution value
     """
-    if loc < POWERBASE:
-        if loc >= HTRFBASE:
-            return 75  # heavy traf
-        if loc >= LTRFBASE:
-            return 50  # light traf
-        if loc < ROADBASE:
-            if loc > FIREBASE:
-                return 90
-            if loc >= RADTILE:
-                return 255  # radioactivity
-    else:
-        if loc <= LASTIND:
-            return 0
-        if loc < PORTBASE:
-            return 50  # Ind
-        if loc <= LASTPOWERPLANT:
-            return 100  # prt, aprt, cpp
-
-    return 0
+    return POLLUTION[loc & LOMASK]
 
 
-def GetDisCC(x: int, y: int) -> int:
+def GetDisCC(context: AppContext, x: int, y: int) -> int:
     """
     Get distance from city center.
 
     Ported from GetDisCC() in s_scan.c.
 
     Args:
+        context: Application context
         x: X coordinate
         y: Y coordinate
 
     Returns:
         Distance from city center (capped at 32)
     """
-    if x > CCx2:
-        xdis = x - CCx2
+    if x > context.cc_x2:
+        xdis = x - context.cc_x2
     else:
-        xdis = CCx2 - x
+        xdis = context.cc_x2 - x
 
-    if y > CCy2:
-        ydis = y - CCy2
+    if y > context.cc_y2:
+        ydis = y - context.cc_y2
     else:
-        ydis = CCy2 - y
+        ydis = context.cc_y2 - y
 
     z = xdis + ydis
     if z > 32:
@@ -336,8 +335,6 @@ def CrimeScan(context: AppContext) -> None:
     numz = 0
     cmax = 0
 
-    # global CrimeMaxX, CrimeMaxY
-
     for x in range(HWLDX):
         for y in range(HWLDY):
             z = context.land_value_mem[x][y]
@@ -356,10 +353,10 @@ def CrimeScan(context: AppContext) -> None:
                 totz += z
 
                 # Find max crime for monster
-                if (z > cmax) or ((z == cmax) and ((rand16() & 3) == 0)):
+                if (z > cmax) or ((z == cmax) and ((rand16(context) & 3) == 0)):
                     cmax = z
-                    context.CrimeMaxX = x << 1
-                    context.CrimeMaxY = y << 1
+                    context.crime_max_x = x << 1
+                    context.crime_max_y = y << 1
             else:
                 context.crime_mem[x][y] = 0
 
@@ -370,13 +367,11 @@ def CrimeScan(context: AppContext) -> None:
         context.crime_average = 0
 
     # Copy police map to effect map
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            context.police_map_effect[x][y] = context.police_map[x][y]
+    store_grid_array(context.police_map_effect, grid_array(context.police_map))
 
-    NewMapFlags[DYMAP] = 1
-    NewMapFlags[CRMAP] = 1
-    NewMapFlags[POMAP] = 1
+    context.new_map_flags[DYMAP] = 1
+    context.new_map_flags[CRMAP] = 1
+    context.new_map_flags[POMAP] = 1
 
 
 # ============================================================================
@@ -391,39 +386,10 @@ def SmoothTerrain(context: AppContext) -> None:
     Ported from SmoothTerrain() in s_scan.c.
     :param context:
     """
-    if DonDither & 1:
-        x = 0
-        y = 0
-        z = 0
-        direction = 1
-
-        while x < QWX:
-            while (y != QWY) and (y != -1):
-                z += context.Qtem[x if x == 0 else x - 1][y]
-                z += context.Qtem[x if x == (QWX - 1) else x + 1][y]
-                z += context.Qtem[x][y if y == 0 else y - 1]
-                z += context.Qtem[x][y if y == (QWY - 1) else y + 1]
-                z += context.Qtem[x][y] << 2
-                context.terrain_mem[x][y] = (z >> 3) & 0xFF
-                z &= 0x7
-                y += direction
-
-            direction = -direction
-            y += direction
-            x += 1
+    if context.don_dither & 1:
+        smooth_into(context.Qtem, context.terrain_mem, serpentine_dither, 2, 3)
     else:
-        for x in range(QWX):
-            for y in range(QWY):
-                z = 0
-                if x > 0:
-                    z += context.Qtem[x - 1][y]
-                if x < (QWX - 1):
-                    z += context.Qtem[x + 1][y]
-                if y > 0:
-                    z += context.Qtem[x][y - 1]
-                if y < (QWY - 1):
-                    z += context.Qtem[x][y + 1]
-                context.terrain_mem[x][y] = ((z >> 2) + context.Qtem[x][y]) >> 1
+        smooth_into(context.Qtem, context.terrain_mem, smooth_half)
 
 
 def DoSmooth(context: AppContext) -> None:
@@ -433,42 +399,10 @@ def DoSmooth(context: AppContext) -> None:
     Ported from DoSmooth() in s_scan.c.
     :param context:
     """
-    if DonDither & 2:
-        x = 0
-        y = 0
-        z = 0
-        direction = 1
-
-        while x < HWLDX:
-            while (y != HWLDY) and (y != -1):
-                z += context.tem[x if x == 0 else x - 1][y]
-                z += context.tem[x if x == (HWLDX - 1) else x + 1][y]
-                z += context.tem[x][y if y == 0 else y - 1]
-                z += context.tem[x][y if y == (HWLDY - 1) else y + 1]
-                z += context.tem[x][y]
-                context.tem2[x][y] = (z >> 2) & 0xFF
-                z &= 3
-                y += direction
-
-            direction = -direction
-            y += direction
-            x += 1
+    if context.don_dither & 2:
+        smooth_into(context.tem, context.tem2, serpentine_dither, 0, 2)
     else:
-        for x in range(HWLDX):
-            for y in range(HWLDY):
-                z = 0
-                if x > 0:
-                    z += context.tem[x - 1][y]
-                if x < (HWLDX - 1):
-                    z += context.tem[x + 1][y]
-                if y > 0:
-                    z += context.tem[x][y - 1]
-                if y < (HWLDY - 1):
-                    z += context.tem[x][y + 1]
-                z = (z + context.tem[x][y]) >> 2
-                if z > 255:
-                    z = 255
-                context.tem2[x][y] = z
+        smooth_into(context.tem, context.tem2, smooth_average)
 
 
 def DoSmooth2(context: AppContext) -> None:
@@ -478,46 +412,10 @@ def DoSmooth2(context: AppContext) -> None:
     Ported from DoSmooth2() in s_scan.c.
     :param context:
     """
-    if DonDither & 4:
-        x = 0
-        y = 0
-        z = 0
-        direction = 1
-
-        while x < HWLDX:
-            while (y != HWLDY) and (y != -1):
-                z += context.tem2[x if x == 0 else x - 1][y]
-                z += context.tem2[x if x == (HWLDX - 1) else x + 1][
-                    y
-                ]
-                z += context.tem2[x][y if y == 0 else y - 1]
-                z += context.tem2[x][
-                    y if y == (HWLDY - 1) else y + 1
-                ]
-                z += context.tem2[x][y]
-                context.tem[x][y] = (z >> 2) & 0xFF
-                z &= 3
-                y += direction
-
-            direction = -direction
-            y += direction
-            x += 1
+    if context.don_dither & 4:
+        smooth_into(context.tem2, context.tem, serpentine_dither, 0, 2)
     else:
-        for x in range(HWLDX):
-            for y in range(HWLDY):
-                z = 0
-                if x > 0:
-                    z += context.tem2[x - 1][y]
-                if x < (HWLDX - 1):
-                    z += context.tem2[x + 1][y]
-                if y > 0:
-                    z += context.tem2[x][y - 1]
-                if y < (HWLDY - 1):
-                    z += context.tem2[x][y + 1]
-                z = (z + context.tem2[x][y]) >> 2
-                if z > 255:
-                    z = 255
-                context.tem[x][y] = z
+        smooth_into(context.tem2, context.tem, smooth_average)
 
 
 def ClrTemArray(context: AppContext) -> None:
@@ -527,10 +425,7 @@ def ClrTemArray(context: AppContext) -> None:
     Ported from ClrTemArray() in s_scan.c.
     :param context:
     """
-    z = 0
-    for x in range(HWLDX):
-        for y in range(HWLDY):
-            context.tem[x][y] = z
+    fill_grid(context.tem, 0)
 
 
 def SmoothFSMap(context: AppContext) -> None:
@@ -540,23 +435,8 @@ def SmoothFSMap(context: AppContext) -> None:
     Ported from SmoothFSMap() in s_scan.c.
     :param context:
     """
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            edge = 0
-            if x > 0:
-                edge += context.fire_st_map[x - 1][y]
-            if x < (SM_X - 1):
-                edge += context.fire_st_map[x + 1][y]
-            if y > 0:
-                edge += context.fire_st_map[x][y - 1]
-            if y < (SM_Y - 1):
-                edge += context.fire_st_map[x][y + 1]
-            edge = (edge >> 2) + context.fire_st_map[x][y]
-            context.stem[x][y] = edge >> 1
-
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            context.fire_st_map[x][y] = context.stem[x][y]
+    smooth_into(context.fire_st_map, context.stem, smooth_half)
+    store_grid_array(context.fire_st_map, grid_array(context.stem))
 
 
 def SmoothPSMap(context: AppContext) -> None:
@@ -565,23 +445,8 @@ def SmoothPSMap(context: AppContext) -> None:
 
     Ported from SmoothPSMap() in s_scan.c.
     """
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            edge = 0
-            if x > 0:
-                edge += context.police_map[x - 1][y]
-            if x < (SM_X - 1):
-                edge += context.police_map[x + 1][y]
-            if y > 0:
-                edge += context.police_map[x][y - 1]
-            if y < (SM_Y - 1):
-                edge += context.police_map[x][y + 1]
-            edge = (edge >> 2) + context.police_map[x][y]
-            context.stem[x][y] = edge >> 1
-
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            context.police_map[x][y] = context.stem[x][y]
+    smooth_into(context.police_map, context.stem, smooth_half)
+    store_grid_array(context.police_map, grid_array(context.stem))
 
 
 def DistIntMarket(context: AppContext) -> None:
@@ -593,7 +458,10 @@ def DistIntMarket(context: AppContext) -> None:
     """
     for x in range(SM_X):
         for y in range(SM_Y):
-            z = GetDisCC(x << 2, y << 2)
+            z = GetDisCC(context, x << 2, y << 2)
             z = z << 2
             z = 64 - z
             context.com_rate[x][y] = z
+
+
+compat_shims.install_context_shims(sys.modules[__name__], _CONTEXT_SHIMS)
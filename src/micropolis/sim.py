@@ -60,4 +60,7 @@ def MakeNewSim(context: "AppContext") -> Sim:  # noqa: N802 - legacy name
     sim.date = MakeNewSimDate()
     sim.dates = 1
 
+    # The new sim starts with no sprites
+    context.sprite_index.clear()
+
     return sim
@@ -1183,6 +1183,92 @@ def get_performance_timing(context: AppContext) -> bool:
     return _legacy_bool("performance_timing", bool(context.performance_timing))
 
 
+def start_sim_profiling(context: AppContext, capacity: int | None = None) -> None:
+    """Start recording per-phase simulate() timings
+    :param context:
+    :param capacity: Ticks kept in the ring buffer (unchanged if None)
+    """
+    context.sim_profiler.enable(capacity)
+
+
+def stop_sim_profiling(context: AppContext) -> None:
+    """Stop recording simulate() timings, keeping collected samples
+    :param context:
+    """
+    context.sim_profiler.disable()
+
+
+def is_sim_profiling(context: AppContext) -> bool:
+    """Get simulate() profiling enabled state
+    :param context:
+    """
+    return context.sim_profiler.enabled
+
+
+def reset_sim_profile(context: AppContext) -> None:
+    """Discard collected simulate() timings
+    :param context:
+    """
+    context.sim_profiler.reset()
+
+
+def get_sim_profile(context: AppContext) -> dict[str, dict[str, float]]:
+    """Get total seconds and calls per simulate() phase and handler
+    :param context:
+    """
+    return context.sim_profiler.summary()
+
+
+def dump_sim_profile(
+    context: AppContext, path: str, fmt: str | None = None
+) -> str:
+    """Write collected simulate() timings as JSON or folded flamegraph stacks
+    :param context:
+    :param path: Output file
+    :param fmt: "json" or "folded" (chosen from the file suffix if None)
+    """
+    return str(context.sim_profiler.write(path, fmt))
+
+
+def set_state_contract_batching(context: AppContext, enabled: bool) -> None:
+    """Batch legacy global updates until the next flush point
+    :param context:
+    :param enabled: Record only the latest value per field; pushes happen at
+        the end of simulate(), the end of sim_update() and before each frame
+    """
+    state_contract.set_batched(enabled)
+    context.flush_state_contract()
+
+
+def get_state_contract_stats(context: AppContext) -> dict[str, int]:
+    """Get notification, coalesced, pushed and flush counts for the contract
+    :param context:
+    """
+    return state_contract.stats.as_dict()
+
+
+def set_traffic_route_cache(
+    context: AppContext, enabled: bool, sample_every: int | None = None
+) -> None:
+    """Answer zone traffic from cached road reachability instead of walks
+    :param context:
+    :param enabled: Use the cache in traffic.MakeTraf
+    :param sample_every: Take a real walk once per this many calls
+        (unchanged if None)
+    """
+    if enabled:
+        context.traffic_cache.enable(sample_every)
+    else:
+        context.traffic_cache.disable()
+
+
+def get_traffic_route_cache_stats(context: AppContext) -> dict[str, int]:
+    """Get search, failure, walk, replay and invalidation counts for the cache
+    :param context:
+    """
+    return context.traffic_cache.stats.as_dict()
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -0,0 +1,217 @@
+"""
+sim_profiler.py - Opt-in per-phase profiling for the simulation step
+
+``simulation.simulate`` runs one of sixteen phases per tick. When a
+``SimProfiler`` is enabled, every tick is timed and recorded as a
+``TickProfile`` in a fixed-size ring buffer, together with the wall time and
+call count of each tile handler (``do_road``, ``do_fire`` and so on) that ran
+during the tick. Handlers opt in with the ``profiled`` decorator, which costs
+a single context-variable lookup per call while no profiler is active.
+
+The buffer can be summarised per phase and handler, exported as JSON, or
+rendered in the folded-stack format read by flamegraph.pl and speedscope.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CAPACITY = 4096  # ticks kept in the ring buffer (64 simulated months)
+ROOT_FRAME = "simulate"
+
+
+# Profiler recording the tick in progress on this thread, if any. Kept per
+# thread so cities ticking concurrently do not record into each other.
+_active: ContextVar[SimProfiler | None] = ContextVar("sim_profiler", default=None)
+
+
+@dataclass(slots=True)
+class TickProfile:
+    """Timing of one ``simulate`` call.
+
+    ``handlers`` maps a ``;``-separated call path (``do_zone;do_sp_zone``)
+    to its inclusive ``[seconds, calls]`` within the tick.
+    """
+
+    index: int
+    mod16: int
+    phase: str
+    seconds: float = 0.0
+    handlers: dict[str, list[float]] = field(default_factory=dict)
+
+
+class SimProfiler:
+    """Ring buffer of per-tick simulation timings."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.enabled = False
+        self.samples: deque[TickProfile] = deque(maxlen=capacity)
+        self.ticks = 0
+        self._current: TickProfile | None = None
+        self._stack: list[str] = []
+        self._started = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.samples.maxlen or 0
+
+    def enable(self, capacity: int | None = None) -> None:
+        """Start recording, optionally resizing (and clearing) the buffer."""
+        if capacity is not None and capacity != self.capacity:
+            if capacity <= 0:
+                raise ValueError("capacity must be positive")
+            self.samples = deque(maxlen=capacity)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording; collected samples are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Drop all collected samples."""
+        self.samples.clear()
+        self.ticks = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def begin_tick(self, mod16: int, phase: str) -> None:
+        self._current = TickProfile(self.ticks, mod16, phase)
+        self._stack.clear()
+        _active.set(self)
+        self._started = time.perf_counter()
+
+    def end_tick(self) -> None:
+        elapsed = time.perf_counter() - self._started
+        _active.set(None)
+        sample = self._current
+        if sample is None:
+            return
+        sample.seconds = elapsed
+        self.samples.append(sample)
+        self.ticks += 1
+        self._current = None
+
+    def call(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Run ``func`` and charge its wall time to ``name``."""
+        stack = self._stack
+        stack.append(name)
+        key = ";".join(stack)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            if self._current is not None:
+                entry = self._current.handlers.get(key)
+                if entry is None:
+                    self._current.handlers[key] = [elapsed, 1]
+                else:
+                    entry[0] += elapsed
+                    entry[1] += 1
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Total seconds and calls per phase and handler path in the buffer.
+
+        Keys are phase names (``map_scan``) and ``phase;handler`` paths
+        (``map_scan;do_road``).
+        """
+        totals: dict[str, list[float]] = {}
+        for sample in self.samples:
+            _add(totals, sample.phase, sample.seconds, 1)
+            for path, (seconds, calls) in sample.handlers.items():
+                _add(totals, f"{sample.phase};{path}", seconds, calls)
+        return {
+            key: {"seconds": seconds, "calls": int(calls)}
+            for key, (seconds, calls) in totals.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "ticks": self.ticks,
+            "summary": self.summary(),
+            "samples": [asdict(sample) for sample in self.samples],
+        }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def folded_stacks(self) -> list[str]:
+        """Self time per call path in microseconds, as folded stack lines."""
+        inclusive = {
+            key: totals["seconds"] for key, totals in self.summary().items()
+        }
+        self_time = dict(inclusive)
+        for key, seconds in inclusive.items():
+            parent, sep, _ = key.rpartition(";")
+            if sep and parent in self_time:
+                self_time[parent] -= seconds
+        return [
+            f"{ROOT_FRAME};{key} {max(round(seconds * 1e6), 0)}"
+            for key, seconds in sorted(self_time.items())
+        ]
+
+    def write(self, path: str | Path, fmt: str | None = None) -> Path:
+        """Write the buffer to ``path`` as ``"json"`` or ``"folded"`` stacks.
+
+        The format defaults to folded stacks for ``.folded``/``.txt`` files
+        and JSON otherwise.
+        """
+        path = Path(path)
+        if fmt is None:
+            fmt = "folded" if path.suffix in (".folded", ".txt") else "json"
+        if fmt == "json":
+            text = self.to_json()
+        elif fmt == "folded":
+            text = "\n".join(self.folded_stacks()) + "\n"
+        else:
+            raise ValueError(f"Unknown profile format: {fmt}")
+        path.write_text(text, encoding="utf-8")
+        return path
+
+
+def _add(
+    totals: dict[str, list[float]], key: str, seconds: float, calls: int
+) -> None:
+    entry = totals.get(key)
+    if entry is None:
+        totals[key] = [seconds, calls]
+    else:
+        entry[0] += seconds
+        entry[1] += calls
+
+
+def profiled[F: Callable[..., Any]](func: F) -> F:
+    """Time calls to ``func`` while a profiled tick is in progress."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiler = _active.get()
+        if profiler is None:
+            return func(*args, **kwargs)
+        return profiler.call(name, func, args, kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
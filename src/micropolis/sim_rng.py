@@ -0,0 +1,78 @@
+"""
+sim_rng.py - Fixed-width state for the simulation's linear congruential RNG
+
+``random.sim_rand`` is the LCG from rand.c::
+
+    next = next * 1103515245 + 12345
+    return (next % ((SIM_RAND_MAX + 1) << 8)) >> 8
+
+The output depends only on the low 24 bits of ``next``, so ``SimRng`` keeps
+the state masked to 32 bits (an unsigned C ``long`` on the original targets)
+and produces exactly the same sequence without the integer growing on every
+draw. ``draw_n`` returns the next ``k`` outputs at once as a NumPy array,
+computed from precomputed jump-ahead coefficients rather than a Python loop.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+MULTIPLIER = 1103515245
+INCREMENT = 12345
+STATE_MASK = 0xFFFFFFFF
+OUTPUT_MASK = 0xFFFFFF  # (SIM_RAND_MAX + 1) << 8) - 1
+
+
+@lru_cache(maxsize=16)
+def _jump_table(k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Coefficients with ``state_i = mul[i] * state + add[i]`` (mod 2**32)."""
+    mul = np.empty(k, dtype=np.uint32)
+    add = np.empty(k, dtype=np.uint32)
+    m, a = 1, 0
+    for i in range(k):
+        m = (m * MULTIPLIER) & STATE_MASK
+        a = (a * MULTIPLIER + INCREMENT) & STATE_MASK
+        mul[i] = m
+        add[i] = a
+    mul.flags.writeable = False
+    add.flags.writeable = False
+    return mul, add
+
+
+class SimRng:
+    """The rand.c generator with 32-bit state.
+
+    Attributes:
+        state: Current value of ``next``, always in ``[0, 2**32)``
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self, seed: int = 0) -> None:
+        self.state = seed & STATE_MASK
+
+    def seed(self, seed: int) -> None:
+        self.state = seed & STATE_MASK
+
+    def rand(self) -> int:
+        """Return the next value in ``[0, SIM_RAND_MAX]``."""
+        self.state = state = (self.state * MULTIPLIER + INCREMENT) & STATE_MASK
+        return (state & OUTPUT_MASK) >> 8
+
+    def draw_n(self, k: int) -> np.ndarray:
+        """Return the next ``k`` values of ``rand()`` as a uint16 array.
+
+        The generator advances by ``k`` steps, so interleaving ``draw_n`` and
+        ``rand`` yields the same sequence as calling ``rand`` alone.
+        """
+        if k <= 0:
+            return np.empty(0, dtype=np.uint16)
+        mul, add = _jump_table(k)
+        states = mul * np.uint32(self.state) + add
+        self.state = int(states[-1])
+        return ((states & OUTPUT_MASK) >> 8).astype(np.uint16)
+
+    def __repr__(self) -> str:
+        return f"SimRng(state={self.state:#010x})"
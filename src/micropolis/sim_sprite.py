@@ -3,35 +3,76 @@
 # ============================================================================
 
 
-from pydantic import BaseModel
-
-
-class SimSprite(BaseModel):
-    """Moving sprite object (cars, disasters, etc.)"""
-
-    name: str = ""
-    type: int = 0
-    frame: int = 0
-    x: int = 0
-    y: int = 0
-    width: int = 0
-    height: int = 0
-    x_offset: int = 0
-    y_offset: int = 0
-    x_hot: int = 0
-    y_hot: int = 0
-    orig_x: int = 0
-    orig_y: int = 0
-    dest_x: int = 0
-    dest_y: int = 0
-    count: int = 0
-    sound_count: int = 0
-    dir: int = 0
-    new_dir: int = 0
-    step: int = 0
-    flag: int = 0
-    control: int = 0
-    turn: int = 0
-    accel: int = 0
-    speed: int = 0
-    next: "SimSprite | None" = None
+from typing import Any
+
+from pydantic_core import core_schema
+
+_INT_FIELDS = (
+    "type",
+    "frame",
+    "x",
+    "y",
+    "width",
+    "height",
+    "x_offset",
+    "y_offset",
+    "x_hot",
+    "y_hot",
+    "orig_x",
+    "orig_y",
+    "dest_x",
+    "dest_y",
+    "count",
+    "sound_count",
+    "dir",
+    "new_dir",
+    "step",
+    "flag",
+    "control",
+    "turn",
+    "accel",
+    "speed",
+)
+
+
+class SimSprite:
+    """Moving sprite object (cars, disasters, etc.)
+
+    A plain slotted record: sprite handlers update positions and counters
+    every frame, so attribute writes are ordinary slot stores rather than
+    validated model assignments. Sprites compare by identity. Released
+    sprites are chained through ``next`` on ``context.free_sprites`` and
+    reused by ``sprite_manager.new_sprite``.
+    """
+
+    __slots__ = ("name", *_INT_FIELDS, "next")
+
+    def __init__(self, name: str = "", next: "SimSprite | None" = None, **fields: int):
+        self.name = name
+        for field in _INT_FIELDS:
+            setattr(self, field, 0)
+        for field, value in fields.items():
+            if field not in _INT_FIELDS:
+                raise TypeError(f"SimSprite has no field {field!r}")
+            setattr(self, field, value)
+        self.next = next
+
+    def reset(self) -> None:
+        """Restore every field to its default, ready for reuse."""
+        self.name = ""
+        for field in _INT_FIELDS:
+            setattr(self, field, 0)
+        self.next = None
+
+    def __repr__(self) -> str:
+        return (
+            f"SimSprite(name={self.name!r}, type={self.type}, frame={self.frame}, "
+            f"x={self.x}, y={self.y})"
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: Any
+    ) -> core_schema.CoreSchema:
+        # Lets pydantic models (Sim, SimView, AppContext) hold sprites as-is.
+        return core_schema.is_instance_schema(cls)
@@ -7,6 +7,7 @@ from . import view_types
 from .constants import ALMAP, EDITOR_H, EDITOR_W, MAP_H, MAP_W, DOZE_STATE
 from .context import AppContext
 from .sim_sprite import SimSprite
+from .tile_map import ArrayGrid
 from .terrain import WORLD_X, WORLD_Y
 
 if TYPE_CHECKING:
@@ -93,7 +94,7 @@ class SimView(BaseModel):
     flags: int = 0
 
     # Tile cache for rendering optimization (short **tiles in C)
-    tiles: list[list[int]] = []
+    tiles: ArrayGrid | list[list[int]] | None = []
 
     # X11 display (adapted for pygame)
     x: Any | None = None
@@ -127,6 +128,8 @@ class SimView(BaseModel):
 
     surface: pygame.Surface | None = None  # Pygame surface for rendering
     overlay_surface: pygame.Surface | None = None  # Overlay (alpha) surface
+    minimap_surface: pygame.Surface | None = None  # Scaled copy for the minimap
+    minimap_updates: int = -1  # view.updates when minimap_surface was scaled
 
     sim: "Sim | None" = None
     next: "SimView|None" = None
@@ -193,6 +196,7 @@ def populate_common_view_fields(
     view.invalid = True
     view.x = display
     view.surface = None
+    view.minimap_surface = None
     view.width = width
     view.height = height
     view.m_width = width
@@ -8,12 +8,88 @@ ported from s_sim.c, implementing the city simulation mechanics.
 import sys
 import time
 
-from .constants import WORLD_X, CENSUSRATE, TAXFREQ, TDMAP, RDMAP, ALMAP, REMAP, COMAP, INMAP, DYMAP, HWLDX, HWLDY, \
-    SM_X, SM_Y, WORLD_Y
+import numpy as np
+
+from .constants import (
+    AIRPORT,
+    ALLBITS,
+    ALMAP,
+    ANIMBIT,
+    BNCNBIT,
+    BRWH,
+    BRWV,
+    BULLBIT,
+    BURNBIT,
+    CENSUSRATE,
+    CHANNEL,
+    COALSMOKE1,
+    COALSMOKE2,
+    COALSMOKE3,
+    COALSMOKE4,
+    COMAP,
+    CONDBIT,
+    DYMAP,
+    FIRE,
+    FIRESTATION,
+    FLOOD,
+    FOOTBALLGAME1,
+    FOOTBALLGAME2,
+    FULLSTADIUM,
+    HBRDG0,
+    HBRDG1,
+    HBRDG2,
+    HBRDG3,
+    HBRIDGE,
+    HTRFBASE,
+    INMAP,
+    IZB,
+    LASTTINYEXP,
+    LOMASK,
+    LTRFBASE,
+    NUCLEAR,
+    POLICESTATION,
+    PORT,
+    PORTBASE,
+    POWERPLANT,
+    PWRBIT,
+    RADAR,
+    RADTILE,
+    RAILBASE,
+    RDMAP,
+    REMAP,
+    RIVER,
+    ROADBASE,
+    RUBBLE,
+    SHI,
+    SOMETINYEXP,
+    STADIUM,
+    TAXFREQ,
+    TDMAP,
+    VBRDG0,
+    VBRDG1,
+    VBRDG2,
+    VBRDG3,
+    VBRIDGE,
+    WORLD_X,
+    WORLD_Y,
+    ZONEBIT,
+)
 from .context import AppContext
 from .macros import TestBounds
 from .messages import clear_mes, send_mes_at
-from .power import DoPowerScan, PushPowerStack
+from .power import DoPowerScan, PushPowerStack, fill_power_map
+from .sim_profiler import profiled
+from .tile_classes import (
+    TF_RAIL,
+    TF_ROAD,
+    TF_SCAN,
+    TILE_CLASS,
+    TILE_FLAGS,
+    TILE_FLAGS_ARRAY,
+    TRAFFIC_LEVEL,
+    TileClass,
+)
+from .tile_map import fill_grid, grid_array, store_grid_array, tile_array
 from importlib import import_module
 
 import sys
@@ -76,9 +152,12 @@ from . import compat_shims
 # scycle: int = 0
 # fcycle: int = 0
 # spdcycle: int = 0
-scycle: int = 0
-fcycle: int = 0
-spdcycle: int = 0
+# The cycle counters live on AppContext; these names are read-only views.
+_CONTEXT_SHIMS: dict[str, str] = {
+    "scycle": "scycle",
+    "fcycle": "fcycle",
+    "spdcycle": "spdcycle",
+}
 
 # Initial evaluation flag
 # do_initial_eval: int = 0
@@ -87,6 +166,23 @@ spdcycle: int = 0
 # melt_x: int = 0
 # melt_y: int = 0
 
+# Name of the work simulate() does for each value of mod16. The map scan is
+# spread over phases 1-8, one eighth of the map columns each.
+PHASE_NAMES: tuple[str, ...] = (
+    "cycle",
+    *(["map_scan"] * 8),
+    "census",
+    "decay",
+    "power",
+    "pollution",
+    "crime",
+    "pop_density",
+    "fire",
+)
+
+# Ticks of simulate() per simulated month (CityTime advances every 16 ticks).
+TICKS_PER_MONTH = 16 * CENSUSRATE
+
 
 # ============================================================================
 # Simulation Control Variables (from s_sim.c globals)
@@ -112,13 +208,10 @@ def sim_frame(context: AppContext) -> None:
     Called each frame to advance the simulation based on speed settings.
     Ported from SimFrame() in s_sim.c.
     """
-    global spdcycle, fcycle
-
     if context.sim_speed == 0:
         return
 
     context.spdcycle = (context.spdcycle + 1) % 1024
-    spdcycle = context.spdcycle
 
     if context.sim_speed == 1 and (context.spdcycle % 5) != 0:
         return
@@ -127,7 +220,6 @@ def sim_frame(context: AppContext) -> None:
         return
 
     context.fcycle = (context.fcycle + 1) % 1024
-    fcycle = context.fcycle
     # if InitSimLoad: Fcycle = 0;  # XXX: commented out in original
 
     simulate(context, context.fcycle & 15)
@@ -146,8 +238,23 @@ def simulate(context: AppContext, mod16: int) -> None:
         :param mod16:
         :param context:
     """
-    global scycle
-
+    profiler = context.sim_profiler
+    try:
+        with context.sim_session():
+            if not profiler.enabled:
+                _simulate_phase(context, mod16)
+                return
+            profiler.begin_tick(mod16, PHASE_NAMES[mod16 & 15])
+            try:
+                _simulate_phase(context, mod16)
+            finally:
+                profiler.end_tick()
+    finally:
+        context.flush_state_contract()
+
+
+def _simulate_phase(context: AppContext, mod16: int) -> None:
+    """Run the work for one ``mod16`` phase of simulate()."""
     # Speed control tables (from original C code)
     spd_pwr = [1, 2, 4, 5]
     spd_ptl = [1, 2, 7, 17]
@@ -161,7 +268,6 @@ def simulate(context: AppContext, mod16: int) -> None:
 
     if mod16 == 0:
         context.scycle = (context.scycle + 1) % 1024  # This is cosmic
-        scycle = context.scycle
         if context.do_initial_eval:
             context.do_initial_eval = 0
             city_evaluation()
@@ -246,12 +352,8 @@ def do_sim_init(context: AppContext) -> None:
     Ported from DoSimInit() in s_sim.c.
     :param context:
     """
-    global fcycle, scycle
-
     context.fcycle = 0
-    fcycle = context.fcycle
     context.scycle = 0
-    scycle = context.scycle
 
     if context.init_sim_load == 2:  # if new city
         init_sim_memory(context)
@@ -288,17 +390,10 @@ def dec_traffic_mem(context: AppContext) -> None:
     Ported from DecTrafficMem() in s_sim.c.
     :param context:
     """
-    for x in range(HWLDX):
-        for y in range(HWLDY):
-            z = context.trf_density[x][y]
-            if z > 0:
-                if z > 24:
-                    if z > 200:
-                        context.trf_density[x][y] = z - 34
-                    else:
-                        context.trf_density[x][y] = z - 24
-                else:
-                    context.trf_density[x][y] = 0
+    z = grid_array(context.trf_density)
+    decayed = np.where(z > 200, z - 34, np.where(z > 24, z - 24, 0))
+    z[...] = decayed
+    store_grid_array(context.trf_density, z)
 
 
 def dec_rog_mem(context: AppContext) -> None:
@@ -309,20 +404,12 @@ def dec_rog_mem(context: AppContext) -> None:
     Ported from DecROGMem() in s_sim.c.
     :param context:
     """
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            z = context.rate_og_mem[x][y]
-            if z == 0:
-                continue
-            if z > 0:
-                context.rate_og_mem[x][y] -= 1
-                if z > 200:
-                    context.rate_og_mem[x][y] = 200  # prevent overflow
-                continue
-            if z < 0:
-                context.rate_og_mem[x][y] += 1
-                if z < -200:
-                    context.rate_og_mem[x][y] = -200
+    # Step every cell one towards zero, clamped to +/-200.
+    z = grid_array(context.rate_og_mem)
+    z[...] = np.clip(z - np.sign(z), -200, 200)
+    store_grid_array(context.rate_og_mem, z)
+
+
 def init_sim_memory(context: AppContext) -> None:
     """
     ported from InitSimMemory
@@ -335,20 +422,15 @@ def init_sim_memory(context: AppContext) -> None:
 
     z = 0
     # SetCommonInits() - placeholder
-    for x in range(240):
-        context.res_his[x] = z
-        context.com_his[x] = z
-        context.ind_his[x] = z
-        context.money_his[x] = 128
-        context.crime_his[x] = z
-        context.pollution_his[x] = z
+    context.census_history.fill(z)
+    context.money_his.fill(128)
 
     context.crime_ramp = z
     context.pollute_ramp = z
     context.total_pop = z
     context.r_value = z
     context.c_value = z
-    context.i_val = z
+    context.i_valve = z
     context.res_cap = z
     context.com_cap = z
     context.ind_cap = z
@@ -358,8 +440,7 @@ def init_sim_memory(context: AppContext) -> None:
     context.score_type = 0
 
     # Clear power map
-    for z in range(context.PWRMAPSIZE):
-        context.power_map[z] = ~0  # set power Map
+    fill_power_map(context, ~0)  # set power Map
     DoPowerScan(context)
     context.new_power = 1  # post rel
 
@@ -390,7 +471,6 @@ def sim_load_init(context: AppContext) -> None:
 
     # global e_market, r_valve, c_valve, i_valve, crime_ramp, pollute_ramp
 
-    z = 0
     context.e_market = float(context.misc_his[1])
     context.res_pop = context.misc_his[2]
     context.com_pop = context.misc_his[3]
@@ -429,8 +509,7 @@ def sim_load_init(context: AppContext) -> None:
 
     context.av_city_tax = (context.city_time % 48) * 7  # post
 
-    for z in range(context.PWRMAPSIZE):
-        context.power_map[z] = 0xFFFF  # set power Map
+    fill_power_map(context, 0xFFFF)  # set power Map
     do_nil_power(context)
 
     if context.scenario_id > 8:
@@ -459,14 +538,13 @@ def do_nil_power(context: AppContext) -> None:
     Ported from DoNilPower() in s_sim.c.
     :param context:
     """
-    for x in range(WORLD_X):
-        for y in range(WORLD_Y):
-            z = context.map_data[x][y]
-            if z & context.ZONEBIT:
-                context.s_map_x = x
-                context.s_map_y = y
-                context.cchr = z
-                SetZPower(context)
+    tiles = tile_array(context.map_data)
+    zone_xs, zone_ys = np.nonzero(tiles & ZONEBIT)
+    for x, y in zip(zone_xs.tolist(), zone_ys.tolist()):
+        context.s_map_x = x
+        context.s_map_y = y
+        context.cchr = context.map_data[x][y]
+        SetZPower(context)
 
 
 # ============================================================================
@@ -680,10 +758,8 @@ def clear_census(context: AppContext) -> None:
     context.airport_pop = z
     context.power_stack_num = z  # Reset before Mapscan
 
-    for x in range(SM_X):
-        for y in range(SM_Y):
-            context.fire_st_map[x][y] = z
-            context.police_map[x][y] = z
+    fill_grid(context.fire_st_map, z)
+    fill_grid(context.police_map, z)
 
 
 def take_census(context: AppContext) -> None:
@@ -696,32 +772,15 @@ def take_census(context: AppContext) -> None:
     """
     # global crime_ramp, pollute_ramp
 
-    # Scroll data
-    for x in range(118, -1, -1):
-        context.res_his[x + 1] = context.res_his[x]
-        context.com_his[x + 1] = context.com_his[x]
-        context.ind_his[x + 1] = context.ind_his[x]
-        context.crime_his[x + 1] = context.crime_his[x]
-        context.pollution_his[x + 1] = context.pollution_his[x]
-        context.money_his[x + 1] = context.money_his[x]
+    # Scroll data (a ring-buffer head move per series)
+    context.census_history.roll_months()
 
     # Update max values
-    res_his_max = 0
-    com_his_max = 0
-    ind_his_max = 0
-    for x in range(119):
-        if context.res_his[x] > res_his_max:
-            res_his_max = context.res_his[x]
-        if context.com_his[x] > com_his_max:
-            com_his_max = context.com_his[x]
-        if context.ind_his[x] > ind_his_max:
-            ind_his_max = context.ind_his[x]
-
-    context.graph_10_max = res_his_max
-    if com_his_max > context.graph_10_max:
-        context.graph_10_max = com_his_max
-    if ind_his_max > context.graph_10_max:
-        context.graph_10_max = ind_his_max
+    context.graph_10_max = max(
+        context.res_his.max(0, 119),
+        context.com_his.max(0, 119),
+        context.ind_his.max(0, 119),
+    )
 
     # Set current values
     context.res_his[0] = context.res_pop // 8
@@ -775,31 +834,14 @@ def take2_census(context: AppContext) -> None:
     :param context:
     """
     # Scroll 120-year data
-    for x in range(238, 119, -1):
-        context.res_his[x + 1] = context.res_his[x]
-        context.com_his[x + 1] = context.com_his[x]
-        context.ind_his[x + 1] = context.ind_his[x]
-        context.crime_his[x + 1] = context.crime_his[x]
-        context.pollution_his[x + 1] = context.pollution_his[x]
-        context.money_his[x + 1] = context.money_his[x]
+    context.census_history.roll_years()
 
     # Update max values
-    res2_his_max = 0
-    com2_his_max = 0
-    ind2_his_max = 0
-    for x in range(120, 239):
-        if context.res_his[x] > res2_his_max:
-            res2_his_max = context.res_his[x]
-        if context.com_his[x] > com2_his_max:
-            com2_his_max = context.com_his[x]
-        if context.ind_his[x] > ind2_his_max:
-            ind2_his_max = context.ind_his[x]
-
-    context.graph_12_max = res2_his_max
-    if com2_his_max > context.graph_12_max:
-        context.graph_12_max = com2_his_max
-    if ind2_his_max > context.graph_12_max:
-        context.graph_12_max = ind2_his_max
+    context.graph_12_max = max(
+        context.res_his.max(120, 239),
+        context.com_his.max(120, 239),
+        context.ind_his.max(120, 239),
+    )
 
     # Set 120-year values
     context.res_his[120] = context.res_pop // 8
@@ -890,12 +932,47 @@ def update_fund_effects(context: AppContext) -> None:
 # ============================================================================
 
 
+def active_scan_rows(column, new_power: int, start: int = 0) -> list[int]:
+    """
+    Rows of a map column that map_scan has work to do for.
+
+    A tile is active when it burns, floods or is radioactive, is a road,
+    rail or zone centre, is a tiny explosion awaiting clean-up, or (while
+    ``new_power`` is set) conducts power. Everything else - dirt, water,
+    trees, rubble and the non-centre tiles of buildings - falls through
+    every branch of MapScan without side effects.
+
+    Args:
+        column: One ``map_data[x]`` column (memoryview or list)
+        new_power: Current ``context.new_power`` flag
+        start: First row to consider
+
+    Returns:
+        Active row indices at or after ``start`` in increasing order
+    """
+    tiles = np.asarray(column)[start:]
+    low = tiles & LOMASK
+    active = (TILE_FLAGS_ARRAY[low] & TF_SCAN) != 0
+    status = ZONEBIT | CONDBIT if new_power else ZONEBIT
+    active |= ((tiles & status) != 0) & (low >= FLOOD)
+    return (np.flatnonzero(active) + start).tolist()
+
+
+def _column_state(column) -> bytes | list[int]:
+    """Cheap snapshot of a map column used to detect writes during a scan."""
+    return column.tobytes() if isinstance(column, memoryview) else column[:]
+
+
 def map_scan(context: AppContext, x1: int, x2: int) -> None:
     """
     ported from MapScan
     Scan and process tiles in the specified range.
 
-    Ported from MapScan() in s_sim.c.
+    Ported from MapScan() in s_sim.c. Only active tiles (see
+    ``active_scan_rows``) are visited. Handlers may rewrite tiles further
+    down the current column, so the remaining rows are re-derived whenever
+    the column changes; visit order and RNG draws match the cell-by-cell
+    loop exactly.
 
     Args:
         x1: Starting x coordinate
@@ -903,52 +980,69 @@ def map_scan(context: AppContext, x1: int, x2: int) -> None:
         :param context:
     """
     for x in range(x1, x2):
-        for y in range(WORLD_Y):
-            context.cchr = context.map_data[x][y]
-            if context.cchr:
-                context.cchr9 = context.cchr & context.LOMASK  # Mask off status bits
-                if context.cchr9 >= context.FLOOD:
-                    context.s_map_x = x
-                    context.s_map_y = y
-                    if context.cchr9 < context.ROADBASE:
-                        if context.cchr9 >= context.FIREBASE:
-                            context.fire_pop += 1
-                            if (rand16() & 3) == 0:  # 1 in 4 times
-                                do_fire(context)
-                            continue
-                        if context.cchr9 < context.RADTILE:
-                            do_flood()
-                        else:
-                            do_rad_tile(context)
-                        continue
-
-                    if context.new_power and (context.cchr & context.CONDBIT):
-                        SetZPower(context)
-
-                    if (context.cchr9 >= context.ROADBASE) and (
-                        context.cchr9 < context.POWERBASE
-                    ):
-                        do_road(context)
-                        continue
+        column = context.map_data[x]
+        rows = active_scan_rows(column, context.new_power)
+        index = 0
+        while index < len(rows):
+            y = rows[index]
+            index += 1
+            before = _column_state(column)
+            scan_tile(context, x, y)
+            if _column_state(column) != before:
+                rows = active_scan_rows(column, context.new_power, y + 1)
+                index = 0
 
-                    if context.cchr & context.ZONEBIT:  # process Zones
-                        do_zone()
-                        continue
 
-                    if (context.cchr9 >= context.RAILBASE) and (
-                        context.cchr9 < context.RESBASE
-                    ):
-                        do_rail(context)
-                        continue
-                    if (context.cchr9 >= context.SOMETINYEXP) and (
-                        context.cchr9 <= context.LASTTINYEXP
-                    ):
-                        # clear AniRubble
-                        context.map_data[x][y] = (
-                            context.RUBBLE
-                            + (rand16() & 3)
-                            + context.BULLBIT
-                        )
+def scan_tile(context: AppContext, x: int, y: int) -> None:
+    """
+    Process a single map tile as one step of MapScan.
+
+    Args:
+        x: Tile x coordinate
+        y: Tile y coordinate
+        :param context:
+    """
+    cchr = context.map_data[x][y]
+    context.cchr = cchr
+    if not cchr:
+        return
+    cchr9 = cchr & LOMASK  # Mask off status bits
+    context.cchr9 = cchr9
+    if cchr9 < FLOOD:
+        return
+    context.s_map_x = x
+    context.s_map_y = y
+    tile_class = TILE_CLASS[cchr9]
+    if tile_class == TileClass.FIRE:
+        context.fire_pop += 1
+        if (rand16(context) & 3) == 0:  # 1 in 4 times
+            do_fire(context)
+        return
+    if tile_class == TileClass.FLOOD:
+        do_flood()
+        return
+    if tile_class == TileClass.RADIATION:
+        do_rad_tile(context)
+        return
+
+    if context.new_power and (cchr & CONDBIT):
+        SetZPower(context)
+
+    flags = TILE_FLAGS[cchr9]
+    if flags & TF_ROAD:
+        do_road(context)
+        return
+
+    if cchr & ZONEBIT:  # process Zones
+        do_zone()
+        return
+
+    if flags & TF_RAIL:
+        do_rail(context)
+        return
+    if SOMETINYEXP <= cchr9 <= LASTTINYEXP:
+        # clear AniRubble
+        context.map_data[x][y] = RUBBLE + (rand16(context) & 3) + BULLBIT
 
 
 # ============================================================================
@@ -956,6 +1050,7 @@ def map_scan(context: AppContext, x1: int, x2: int) -> None:
 # ============================================================================
 
 
+@profiled
 def do_rail(context: AppContext) -> None:
     """
     ported from DoRail
@@ -967,19 +1062,20 @@ def do_rail(context: AppContext) -> None:
     context.rail_total += 1
     GenerateTrain(context, context.s_map_x, context.s_map_y)
     if context.road_effect < 30:  # Deteriorating Rail
-        if (rand16() & 511) == 0:
-            if (context.cchr & context.CONDBIT) == 0:
-                if context.road_effect < (rand16() & 31):
-                    if context.cchr9 < (context.RAILBASE + 2):
-                        context.map_data[context.s_map_x][context.s_map_y] = context.RIVER
+        if (rand16(context) & 511) == 0:
+            if (context.cchr & CONDBIT) == 0:
+                if context.road_effect < (rand16(context) & 31):
+                    if context.cchr9 < (RAILBASE + 2):
+                        context.map_data[context.s_map_x][context.s_map_y] = RIVER
                     else:
                         context.map_data[context.s_map_x][context.s_map_y] = (
-                            context.RUBBLE
-                            + (rand16() & 3)
-                            + context.BULLBIT
+                            RUBBLE
+                            + (rand16(context) & 3)
+                            + BULLBIT
                         )
 
 
+@profiled
 def do_rad_tile(context: AppContext) -> None:
     """
     ported from DoRadTile
@@ -988,10 +1084,11 @@ def do_rad_tile(context: AppContext) -> None:
     Ported from DoRadTile() in s_sim.c.
     :param context:
     """
-    if (rand16() & 4095) == 0:
+    if (rand16(context) & 4095) == 0:
         context.map_data[context.s_map_x][context.s_map_y] = 0  # Radioactive decay
 
 
+@profiled
 def do_road(context: AppContext) -> None:
     """
     ported from DoRoad
@@ -1001,48 +1098,43 @@ def do_road(context: AppContext) -> None:
     """
     # global types
 
-    den_tab = [context.ROADBASE, context.LTRFBASE, context.HTRFBASE]
+    den_tab = [ROADBASE, LTRFBASE, HTRFBASE]
 
     context.road_total += 1
     GenerateBus(context, context.s_map_x, context.s_map_y)
 
     if context.road_effect < 30:  # Deteriorating Roads
-        if (rand16() & 511) == 0:
-            if (context.cchr & context.CONDBIT) == 0:
-                if context.road_effect < (rand16() & 31):
+        if (rand16(context) & 511) == 0:
+            if (context.cchr & CONDBIT) == 0:
+                if context.road_effect < (rand16(context) & 31):
                     if ((context.cchr9 & 15) < 2) or ((context.cchr9 & 15) == 15):
-                        context.map_data[context.s_map_x][context.s_map_y] = context.RIVER
+                        context.map_data[context.s_map_x][context.s_map_y] = RIVER
                     else:
                         context.map_data[context.s_map_x][context.s_map_y] = (
-                            context.RUBBLE
-                            + (rand16() & 3)
-                            + context.BULLBIT
+                            RUBBLE
+                            + (rand16(context) & 3)
+                            + BULLBIT
                         )
                     return
 
-    if context.cchr & context.BURNBIT:  # If Bridge
+    if context.cchr & BURNBIT:  # If Bridge
         context.road_total += 4
         if do_bridge(context):
             return
 
-    if context.cchr9 < context.LTRFBASE:
-        tden = 0
-    else:
-        if context.cchr9 < context.HTRFBASE:
-            tden = 1
-        else:
-            context.road_total += 1
-            tden = 2
+    tden = TRAFFIC_LEVEL[context.cchr9]
+    if tden == 2:
+        context.road_total += 1
 
     # Set Traf Density
     density = (context.trf_density[context.s_map_x >> 1][context.s_map_y >> 1]) >> 6
     if density > 1:
         density -= 1
     if tden != density:  # tden 0..2
-        z = ((context.cchr9 - context.ROADBASE) & 15) + den_tab[density]
-        z += context.cchr & (context.ALLBITS - context.ANIMBIT)
+        z = ((context.cchr9 - ROADBASE) & 15) + den_tab[density]
+        z += context.cchr & (ALLBITS - ANIMBIT)
         if density:
-            z += context.ANIMBIT
+            z += ANIMBIT
         context.map_data[context.s_map_x][context.s_map_y] = z
 
 
@@ -1061,78 +1153,78 @@ def do_bridge(context: AppContext) -> bool:
     h_dx = [-2, 2, -2, -1, 0, 1, 2]
     h_dy = [-1, -1, 0, 0, 0, 0, 0]
     hbrtab = [
-        context.HBRDG1 | context.BULLBIT,
-        context.HBRDG3 | context.BULLBIT,
-        context.HBRDG0 | context.BULLBIT,
-        context.RIVER,
-        context.BRWH | context.BULLBIT,
-        context.RIVER,
-        context.HBRDG2 | context.BULLBIT,
+        HBRDG1 | BULLBIT,
+        HBRDG3 | BULLBIT,
+        HBRDG0 | BULLBIT,
+        RIVER,
+        BRWH | BULLBIT,
+        RIVER,
+        HBRDG2 | BULLBIT,
     ]
     hbrtab2 = [
-        context.RIVER,
-        context.RIVER,
-        context.HBRIDGE | context.BULLBIT,
-        context.HBRIDGE | context.BULLBIT,
-        context.HBRIDGE | context.BULLBIT,
-        context.HBRIDGE | context.BULLBIT,
-        context.HBRIDGE | context.BULLBIT,
+        RIVER,
+        RIVER,
+        HBRIDGE | BULLBIT,
+        HBRIDGE | BULLBIT,
+        HBRIDGE | BULLBIT,
+        HBRIDGE | BULLBIT,
+        HBRIDGE | BULLBIT,
     ]
     v_dx = [0, 1, 0, 0, 0, 0, 1]
     v_dy = [-2, -2, -1, 0, 1, 2, 2]
     vbrtab = [
-        context.VBRDG0 | context.BULLBIT,
-        context.VBRDG1 | context.BULLBIT,
-        context.RIVER,
-        context.BRWV | context.BULLBIT,
-        context.RIVER,
-        context.VBRDG2 | context.BULLBIT,
-        context.VBRDG3 | context.BULLBIT,
+        VBRDG0 | BULLBIT,
+        VBRDG1 | BULLBIT,
+        RIVER,
+        BRWV | BULLBIT,
+        RIVER,
+        VBRDG2 | BULLBIT,
+        VBRDG3 | BULLBIT,
     ]
     vbrtab2 = [
-        context.VBRIDGE | context.BULLBIT,
-        context.RIVER,
-        context.VBRIDGE | context.BULLBIT,
-        context.VBRIDGE | context.BULLBIT,
-        context.VBRIDGE | context.BULLBIT,
-        context.VBRIDGE | context.BULLBIT,
-        context.RIVER,
+        VBRIDGE | BULLBIT,
+        RIVER,
+        VBRIDGE | BULLBIT,
+        VBRIDGE | BULLBIT,
+        VBRIDGE | BULLBIT,
+        VBRIDGE | BULLBIT,
+        RIVER,
     ]
 
-    if context.cchr9 == context.BRWV:  # Vertical bridge close
-        if ((rand16() & 3) == 0) and (get_boat_dis(context) > 340):
+    if context.cchr9 == BRWV:  # Vertical bridge close
+        if ((rand16(context) & 3) == 0) and (get_boat_dis(context) > 340):
             for z in range(7):  # Close
                 x = context.s_map_x + v_dx[z]
                 y = context.s_map_y + v_dy[z]
                 if TestBounds(x, y):
-                    if (context.map_data[x][y] & context.LOMASK) == (
-                        vbrtab[z] & context.LOMASK
+                    if (context.map_data[x][y] & LOMASK) == (
+                        vbrtab[z] & LOMASK
                     ):
                         context.map_data[x][y] = vbrtab2[z]
         return True
 
-    if context.cchr9 == context.BRWH:  # Horizontal bridge close
-        if ((rand16() & 3) == 0) and (get_boat_dis(context) > 340):
+    if context.cchr9 == BRWH:  # Horizontal bridge close
+        if ((rand16(context) & 3) == 0) and (get_boat_dis(context) > 340):
             for z in range(7):  # Close
                 x = context.s_map_x + h_dx[z]
                 y = context.s_map_y + h_dy[z]
                 if TestBounds(x, y):
-                    if (context.map_data[x][y] & context.LOMASK) == (
-                        hbrtab[z] & context.LOMASK
+                    if (context.map_data[x][y] & LOMASK) == (
+                        hbrtab[z] & LOMASK
                     ):
                         context.map_data[x][y] = hbrtab2[z]
         return True
 
-    if (get_boat_dis(context) < 300) or ((rand16() & 7) == 0):
+    if (get_boat_dis(context) < 300) or ((rand16(context) & 7) == 0):
         if context.cchr9 & 1:  # Vertical open
             if context.s_map_x < (WORLD_X - 1):
-                if context.map_data[context.s_map_x + 1][context.s_map_y] == context.CHANNEL:
+                if context.map_data[context.s_map_x + 1][context.s_map_y] == CHANNEL:
                     for z in range(7):
                         x = context.s_map_x + v_dx[z]
                         y = context.s_map_y + v_dy[z]
                         if TestBounds(x, y):
                             m_ptem = context.map_data[x][y]
-                            if (m_ptem == context.CHANNEL) or (
+                            if (m_ptem == CHANNEL) or (
                                 (m_ptem & 15) == (vbrtab2[z] & 15)
                             ):
                                 context.map_data[x][y] = vbrtab[z]
@@ -1140,14 +1232,14 @@ def do_bridge(context: AppContext) -> bool:
             return False
         else:  # Horizontal open
             if context.s_map_y > 0:
-                if context.map_data[context.s_map_x][context.s_map_y - 1] == context.CHANNEL:
+                if context.map_data[context.s_map_x][context.s_map_y - 1] == CHANNEL:
                     for z in range(7):
                         x = context.s_map_x + h_dx[z]
                         y = context.s_map_y + h_dy[z]
                         if TestBounds(x, y):
                             m_ptem = context.map_data[x][y]
                             if ((m_ptem & 15) == (hbrtab2[z] & 15)) or (
-                                m_ptem == context.CHANNEL
+                                m_ptem == CHANNEL
                             ):
                                 context.map_data[x][y] = hbrtab[z]
                     return True
@@ -1170,9 +1262,8 @@ def get_boat_dis(context: AppContext) -> int:
     mx = (context.s_map_x << 4) + 8
     my = (context.s_map_y << 4) + 8
 
-    sprite = context.sim.sprite
-    while sprite is not None:
-        if (sprite.type == context.SHI) and (sprite.frame != 0):
+    for sprite in context.sprite_index.of_type(SHI):
+        if sprite.frame != 0:
             dx = sprite.x + sprite.x_hot - mx
             dy = sprite.y + sprite.y_hot - my
             if dx < 0:
@@ -1182,11 +1273,11 @@ def get_boat_dis(context: AppContext) -> int:
             dx += dy
             if dx < dist:
                 dist = dx
-        sprite = sprite.next
 
     return dist
 
 
+@profiled
 def do_fire(context: AppContext) -> None:
     """
     ported from DoFire
@@ -1199,18 +1290,18 @@ def do_fire(context: AppContext) -> None:
     dy = [0, -1, 0, 1]
 
     for z in range(4):
-        if (rand16() & 7) == 0:
+        if (rand16(context) & 7) == 0:
             xtem = context.s_map_x + dx[z]
             ytem = context.s_map_y + dy[z]
             if TestBounds(xtem, ytem):
                 c = context.map_data[xtem][ytem]
-                if c & context.BURNBIT:
-                    if c & context.ZONEBIT:
+                if c & BURNBIT:
+                    if c & ZONEBIT:
                         fire_zone(context, xtem, ytem, c)
-                        if (c & context.LOMASK) > context.IZB:  # Explode
+                        if (c & LOMASK) > IZB:  # Explode
                             MakeExplosionAt((xtem << 4) + 8, (ytem << 4) + 8)
                     context.map_data[xtem][ytem] = (
-                            context.FIRE + (rand16() & 3) + context.ANIMBIT
+                            FIRE + (rand16(context) & 3) + ANIMBIT
                     )
 
     z = context.fire_rate[context.s_map_x >> 3][context.s_map_y >> 3]
@@ -1223,7 +1314,7 @@ def do_fire(context: AppContext) -> None:
             rate = 1
     if rand(context, rate) == 0:
         context.map_data[context.s_map_x][context.s_map_y] = (
-                context.RUBBLE + (rand16() & 3) + context.BULLBIT
+                RUBBLE + (rand16(context) & 3) + BULLBIT
         )
 
 
@@ -1242,11 +1333,11 @@ def fire_zone(context: AppContext, xloc: int, yloc: int, ch: int) -> None:
     """
     context.rate_og_mem[xloc >> 3][yloc >> 3] -= 20
 
-    ch = ch & context.LOMASK
-    if ch < context.PORTBASE:
+    ch = ch & LOMASK
+    if ch < PORTBASE:
         x_ymax = 2
     else:
-        if ch == context.AIRPORT:
+        if ch == AIRPORT:
             x_ymax = 5
         else:
             x_ymax = 4
@@ -1263,9 +1354,9 @@ def fire_zone(context: AppContext, xloc: int, yloc: int, ch: int) -> None:
             ):
                 continue
             if (
-                context.map_data[xtem][ytem] & context.LOMASK
-            ) >= context.ROADBASE:  # post release
-                context.map_data[xtem][ytem] |= context.BULLBIT
+                context.map_data[xtem][ytem] & LOMASK
+            ) >= ROADBASE:  # post release
+                context.map_data[xtem][ytem] |= BULLBIT
 
 
 def repair_zone(context: AppContext, z_cent: int, zsize: int) -> None:
@@ -1289,17 +1380,18 @@ def repair_zone(context: AppContext, z_cent: int, zsize: int) -> None:
             cnt += 1
             if TestBounds(xx, yy):
                 th_ch = context.map_data[xx][yy]
-                if th_ch & context.ZONEBIT:
+                if th_ch & ZONEBIT:
                     continue
-                if th_ch & context.ANIMBIT:
+                if th_ch & ANIMBIT:
                     continue
-                th_ch = th_ch & context.LOMASK
-                if (th_ch < context.RUBBLE) or (th_ch >= context.ROADBASE):
+                th_ch = th_ch & LOMASK
+                if (th_ch < RUBBLE) or (th_ch >= ROADBASE):
                     context.map_data[xx][yy] = (
-                            z_cent - 3 - zsize + cnt + context.CONDBIT + context.BURNBIT
+                            z_cent - 3 - zsize + cnt + CONDBIT + BURNBIT
                     )
 
 
+@profiled
 def do_sp_zone(context: AppContext, pwr_on: int) -> None:
     """
     ported from DoSPZone
@@ -1311,15 +1403,15 @@ def do_sp_zone(context: AppContext, pwr_on: int) -> None:
         PwrOn: Whether zone is powered
         :param context:
     """
-    if context.cchr9 == context.POWERPLANT:
+    if context.cchr9 == POWERPLANT:
         context.coal_pop += 1
         if (context.city_time & 7) == 0:
-            repair_zone(context, context.POWERPLANT, 4)  # post
+            repair_zone(context, POWERPLANT, 4)  # post
         PushPowerStack(context)
         coal_smoke(context, context.s_map_x, context.s_map_y)
         return
 
-    if context.cchr9 == context.NUCLEAR:
+    if context.cchr9 == NUCLEAR:
         if (not context.no_disasters) and (
                 rand(context, context.MltdwnTab[context.game_level]) == 0
         ):
@@ -1327,14 +1419,14 @@ def do_sp_zone(context: AppContext, pwr_on: int) -> None:
             return
         context.nuclear_pop += 1
         if (context.city_time & 7) == 0:
-            repair_zone(context, context.NUCLEAR, 4)  # post
+            repair_zone(context, NUCLEAR, 4)  # post
         PushPowerStack(context)
         return
 
-    if context.cchr9 == context.FIRESTATION:
+    if context.cchr9 == FIRESTATION:
         context.fire_st_pop += 1
         if (context.city_time & 7) == 0:
-            repair_zone(context, context.FIRESTATION, 3)  # post
+            repair_zone(context, FIRESTATION, 3)  # post
 
         if pwr_on:
             z = context.fire_effect  # if powered get effect
@@ -1347,10 +1439,10 @@ def do_sp_zone(context: AppContext, pwr_on: int) -> None:
         context.fire_st_map[context.s_map_x >> 3][context.s_map_y >> 3] += z
         return
 
-    if context.cchr9 == context.POLICESTATION:
+    if context.cchr9 == POLICESTATION:
         context.police_pop += 1
         if (context.city_time & 7) == 0:
-            repair_zone(context, context.POLICESTATION, 3)  # post
+            repair_zone(context, POLICESTATION, 3)  # post
 
         if pwr_on:
             z = context.police_effect
@@ -1363,55 +1455,55 @@ def do_sp_zone(context: AppContext, pwr_on: int) -> None:
         context.police_map[context.s_map_x >> 3][context.s_map_y >> 3] += z
         return
 
-    if context.cchr9 == context.STADIUM:
+    if context.cchr9 == STADIUM:
         context.stadium_pop += 1
         if (context.city_time & 15) == 0:
-            repair_zone(context, context.STADIUM, 4)
+            repair_zone(context, STADIUM, 4)
         if pwr_on:
             if (
                 (context.city_time + context.s_map_x + context.s_map_y) & 31
             ) == 0:  # post release
-                draw_stadium(context, context.FULLSTADIUM)
+                draw_stadium(context, FULLSTADIUM)
                 context.map_data[context.s_map_x + 1][context.s_map_y] = (
-                    context.FOOTBALLGAME1 + context.ANIMBIT
+                    FOOTBALLGAME1 + ANIMBIT
                 )
                 context.map_data[context.s_map_x + 1][context.s_map_y + 1] = (
-                    context.FOOTBALLGAME2 + context.ANIMBIT
+                    FOOTBALLGAME2 + ANIMBIT
                 )
         return
 
-    if context.cchr9 == context.FULLSTADIUM:
+    if context.cchr9 == FULLSTADIUM:
         context.stadium_pop += 1
         if ((context.city_time + context.s_map_x + context.s_map_y) & 7) == 0:  # post release
-            draw_stadium(context, context.STADIUM)
+            draw_stadium(context, STADIUM)
         return
 
-    if context.cchr9 == context.AIRPORT:
+    if context.cchr9 == AIRPORT:
         context.airport_pop += 1
         if (context.city_time & 7) == 0:
-            repair_zone(context, context.AIRPORT, 6)
+            repair_zone(context, AIRPORT, 6)
 
         if pwr_on:  # post
             if (
-                context.map_data[context.s_map_x + 1][context.s_map_y - 1] & context.LOMASK
-            ) == context.RADAR:
+                context.map_data[context.s_map_x + 1][context.s_map_y - 1] & LOMASK
+            ) == RADAR:
                 context.map_data[context.s_map_x + 1][context.s_map_y - 1] = (
-                    context.RADAR + context.ANIMBIT + context.CONDBIT + context.BURNBIT
+                    RADAR + ANIMBIT + CONDBIT + BURNBIT
                 )
         else:
             context.map_data[context.s_map_x + 1][context.s_map_y - 1] = (
-                context.RADAR + context.CONDBIT + context.BURNBIT
+                RADAR + CONDBIT + BURNBIT
             )
 
         if pwr_on:
             do_airport(context)
         return
 
-    if context.cchr9 == context.PORT:
+    if context.cchr9 == PORT:
         context.port_pop += 1
         if (context.city_time & 15) == 0:
-            repair_zone(context, context.PORT, 4)
-        if pwr_on and (GetSprite(context, context.SHI) is None):
+            repair_zone(context, PORT, 4)
+        if pwr_on and (GetSprite(context, SHI) is None):
             GenerateShip(context)
         return
 
@@ -1430,8 +1522,8 @@ def draw_stadium(context: AppContext, z: int) -> None:
     z = z - 5
     for y in range(context.s_map_y - 1, context.s_map_y + 3):
         for x in range(context.s_map_x - 1, context.s_map_x + 3):
-            context.map_data[x][y] = z | context.BNCNBIT
-    context.map_data[context.s_map_x][context.s_map_y] |= context.ZONEBIT | context.PWRBIT
+            context.map_data[x][y] = z | BNCNBIT
+    context.map_data[context.s_map_x][context.s_map_y] |= ZONEBIT | PWRBIT
 
 
 def do_airport(context: AppContext) -> None:
@@ -1461,13 +1553,13 @@ def coal_smoke(context: AppContext, mx: int, my: int) -> None:
         my: Y coordinate
         :param context:
     """
-    sm_tb = [context.COALSMOKE1, context.COALSMOKE2, context.COALSMOKE3, context.COALSMOKE4]
+    sm_tb = [COALSMOKE1, COALSMOKE2, COALSMOKE3, COALSMOKE4]
     dx = [1, 2, 1, 2]
     dy = [-1, -1, 0, 0]
 
     for x in range(4):
         context.map_data[mx + dx[x]][my + dy[x]] = (
-            sm_tb[x] | context.ANIMBIT | context.CONDBIT | context.PWRBIT | context.BURNBIT
+            sm_tb[x] | ANIMBIT | CONDBIT | PWRBIT | BURNBIT
         )
 
 
@@ -1496,7 +1588,7 @@ def do_meltdown(context: AppContext, sx: int, sy: int) -> None:
     for x in range(sx - 1, sx + 3):
         for y in range(sy - 1, sy + 3):
             context.map_data[x][y] = (
-                    context.FIRE + (rand16() & 3) + context.ANIMBIT
+                    FIRE + (rand16(context) & 3) + ANIMBIT
             )
 
     for z in range(200):
@@ -1510,10 +1602,10 @@ def do_meltdown(context: AppContext, sx: int, sy: int) -> None:
         ):
             continue
         t = context.map_data[x][y]
-        if t & context.ZONEBIT:
+        if t & ZONEBIT:
             continue
-        if (t & context.BURNBIT) or (t == 0):
-            context.map_data[x][y] = context.RADTILE
+        if (t & BURNBIT) or (t == 0):
+            context.map_data[x][y] = RADTILE
 
     clear_mes(context)
     send_mes_at(context, -43, sx, sy)
@@ -1658,11 +1750,13 @@ def do_disasters() -> None:
     pass
 
 
+@profiled
 def do_flood() -> None:
     """ported from DoFlood Handle flood tiles - placeholder"""
     pass
 
 
+@profiled
 def do_zone() -> None:
     """ported from DoZone Process zone tiles - placeholder for zones.py"""
     pass
@@ -1700,3 +1794,5 @@ try:
     )
 except Exception:
     pass
+
+compat_shims.install_context_shims(sys.modules[__name__], _CONTEXT_SHIMS)
@@ -0,0 +1,132 @@
+"""
+smoothing.py - Vectorized five-point smoothing kernels for the map scanners
+
+The scanners in s_scan.c blur their analysis maps with a handful of
+five-point (centre plus von Neumann neighbours) passes. This module provides
+array implementations of those kernels that reproduce the C integer
+arithmetic exactly, so scanner.py can run each pass as a few NumPy
+operations instead of a per-cell Python loop.
+
+Two families of kernels exist in the original code:
+
+* The plain passes, where neighbours beyond the map edge count as zero.
+* The ``DonDither`` passes, which walk the map in a serpentine order (down
+  even columns, up odd ones), clamp neighbour lookups to the edge cell and
+  carry the remainder of each division into the next cell. The carry is
+  the running sum modulo the divisor, so every output equals the difference
+  of two consecutive floored prefix sums and the walk becomes a cumulative
+  sum over the serpentine-ordered cell totals.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .tile_map import grid_array, store_grid_array
+
+# Wide enough for prefix sums over a whole serpentine walk.
+_ACC_DTYPE = np.int64
+
+
+def _as_int(grid: Any) -> np.ndarray:
+    """Return a widened copy of a grid's values for kernel arithmetic."""
+    return grid_array(grid).astype(_ACC_DTYPE)
+
+
+def neighbour_sum(values: np.ndarray) -> np.ndarray:
+    """Sum the four neighbours of every cell, treating off-map cells as 0.
+
+    Args:
+        values: ``(width, height)`` array
+
+    Returns:
+        Array of neighbour totals with the same shape
+    """
+    total = np.zeros(values.shape, dtype=_ACC_DTYPE)
+    total[1:, :] += values[:-1, :]
+    total[:-1, :] += values[1:, :]
+    total[:, 1:] += values[:, :-1]
+    total[:, :-1] += values[:, 1:]
+    return total
+
+
+def clamped_neighbour_sum(values: np.ndarray) -> np.ndarray:
+    """Sum the four neighbours of every cell, clamping lookups to the edge.
+
+    This is the neighbourhood used by the ``DonDither`` passes, where
+    ``x == 0 ? x : x - 1`` style indexing reuses the cell itself at the map
+    border.
+    """
+    padded = np.pad(values.astype(_ACC_DTYPE, copy=False), 1, mode="edge")
+    return (
+        padded[:-2, 1:-1]
+        + padded[2:, 1:-1]
+        + padded[1:-1, :-2]
+        + padded[1:-1, 2:]
+    )
+
+
+def smooth_average(values: np.ndarray) -> np.ndarray:
+    """``(neighbours + centre) >> 2`` capped at 255 (DoSmooth/DoSmooth2)."""
+    values = values.astype(_ACC_DTYPE, copy=False)
+    return np.minimum((neighbour_sum(values) + values) >> 2, 255)
+
+
+def smooth_half(values: np.ndarray) -> np.ndarray:
+    """``((neighbours >> 2) + centre) >> 1`` (SmoothTerrain/FSMap/PSMap)."""
+    values = values.astype(_ACC_DTYPE, copy=False)
+    return ((neighbour_sum(values) >> 2) + values) >> 1
+
+
+def serpentine_order(width: int, height: int) -> np.ndarray:
+    """Flat indices of a ``(width, height)`` grid in serpentine walk order.
+
+    Even columns are visited with increasing ``y`` and odd columns with
+    decreasing ``y``, matching the ``direction`` flip in the C loops.
+    """
+    order = np.arange(width * height).reshape(width, height)
+    order[1::2] = order[1::2, ::-1]
+    return order.ravel()
+
+
+def serpentine_dither(
+    values: np.ndarray, centre_shift: int, shift: int
+) -> np.ndarray:
+    """Run the ``DonDither`` error-carry smoothing walk over ``values``.
+
+    For each cell in serpentine order the C code adds
+    ``clamped_neighbours + (centre << centre_shift)`` to a running ``z``,
+    stores ``(z >> shift) & 0xFF`` and keeps ``z & ((1 << shift) - 1)``.
+
+    Args:
+        values: ``(width, height)`` source array
+        centre_shift: Left shift applied to the centre cell's weight
+        shift: Right shift applied to the running total for each output
+
+    Returns:
+        Smoothed array with the same shape
+    """
+    values = values.astype(_ACC_DTYPE, copy=False)
+    totals = clamped_neighbour_sum(values) + (values << centre_shift)
+    order = serpentine_order(*values.shape)
+    prefix = np.cumsum(totals.ravel()[order])
+    steps = np.diff(prefix >> shift, prepend=0) & 0xFF
+    result = np.empty(values.size, dtype=_ACC_DTYPE)
+    result[order] = steps
+    return result.reshape(values.shape)
+
+
+def smooth_into(
+    source: Any, dest: Any, kernel: Any, *args: int
+) -> None:
+    """Apply ``kernel`` to ``source`` and store the result in ``dest``.
+
+    Args:
+        source: ArrayGrid or nested list read by the kernel
+        dest: ArrayGrid or nested list updated in place
+        kernel: One of the kernels in this module
+        *args: Extra arguments forwarded to ``kernel``
+    """
+    store_grid_array(dest, kernel(_as_int(source), *args))
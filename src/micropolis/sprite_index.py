@@ -0,0 +1,128 @@
+"""
+sprite_index.py - Uniform-grid spatial index over live sprites
+
+Sprite collision in sp.c walks the whole sprite list for every moving
+disaster, plane and bus, comparing hot-spot distances. ``SpriteIndex``
+buckets each sprite by its hot spot (``x + x_hot``, ``y + y_hot``) in
+``CELL_SIZE`` pixel cells and keeps a per-type set, so callers can ask for
+the sprites near a point or of a given type instead.
+
+Results come back in sprite-list order (newest first, as ``new_sprite``
+prepends), so code that explodes or counts candidates in turn behaves exactly
+as the list walk did. Positions are only re-read when ``update`` or
+``refresh`` is called; ``sprite_manager.move_objects`` does so for each
+sprite after it moves.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .sim_sprite import SimSprite
+
+CELL_SHIFT = 5
+CELL_SIZE = 1 << CELL_SHIFT  # pixels; covers get_dis() < 30 with one ring
+
+
+class SpriteIndex:
+    """Grid buckets and type sets for the sprites of one simulation."""
+
+    def __init__(self) -> None:
+        self._cells: dict[tuple[int, int], set[SimSprite]] = {}
+        self._cell_of: dict[SimSprite, tuple[int, int]] = {}
+        self._by_type: dict[int, set[SimSprite]] = {}
+        self._type_of: dict[SimSprite, int] = {}
+        self._serial: dict[SimSprite, int] = {}
+        self._next_serial = 0
+
+    def __len__(self) -> int:
+        return len(self._serial)
+
+    def __contains__(self, sprite: object) -> bool:
+        return sprite in self._serial
+
+    @staticmethod
+    def _cell(sprite: SimSprite) -> tuple[int, int]:
+        return (
+            (sprite.x + sprite.x_hot) >> CELL_SHIFT,
+            (sprite.y + sprite.y_hot) >> CELL_SHIFT,
+        )
+
+    def add(self, sprite: SimSprite) -> None:
+        """Index ``sprite``; re-adding an indexed sprite just updates it."""
+        if sprite in self._serial:
+            self.update(sprite)
+            return
+        self._next_serial += 1
+        self._serial[sprite] = self._next_serial
+        cell = self._cell(sprite)
+        self._cell_of[sprite] = cell
+        self._cells.setdefault(cell, set()).add(sprite)
+        self._type_of[sprite] = sprite.type
+        self._by_type.setdefault(sprite.type, set()).add(sprite)
+
+    def remove(self, sprite: SimSprite) -> None:
+        if self._serial.pop(sprite, None) is None:
+            return
+        cell = self._cell_of.pop(sprite)
+        bucket = self._cells[cell]
+        bucket.discard(sprite)
+        if not bucket:
+            del self._cells[cell]
+        self._by_type[self._type_of.pop(sprite)].discard(sprite)
+
+    def update(self, sprite: SimSprite) -> None:
+        """Re-read the position and type of an indexed sprite."""
+        old_cell = self._cell_of.get(sprite)
+        if old_cell is None:
+            return
+        cell = self._cell(sprite)
+        if cell != old_cell:
+            bucket = self._cells[old_cell]
+            bucket.discard(sprite)
+            if not bucket:
+                del self._cells[old_cell]
+            self._cells.setdefault(cell, set()).add(sprite)
+            self._cell_of[sprite] = cell
+        old_type = self._type_of[sprite]
+        if sprite.type != old_type:
+            self._by_type[old_type].discard(sprite)
+            self._by_type.setdefault(sprite.type, set()).add(sprite)
+            self._type_of[sprite] = sprite.type
+
+    def refresh(self, sprites: Iterable[SimSprite] | None = None) -> None:
+        """Update every indexed sprite, or just ``sprites``."""
+        for sprite in list(self._serial) if sprites is None else sprites:
+            self.update(sprite)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._cell_of.clear()
+        self._by_type.clear()
+        self._type_of.clear()
+        self._serial.clear()
+
+    def _ordered(self, found: Iterable[SimSprite]) -> list[SimSprite]:
+        serial = self._serial
+        return sorted(found, key=serial.__getitem__, reverse=True)
+
+    def near(self, x: int, y: int) -> list[SimSprite]:
+        """Sprites whose hot spot lies within ``CELL_SIZE`` pixels of (x, y).
+
+        The result may include sprites slightly further away; callers still
+        apply their exact distance test.
+        """
+        cx = x >> CELL_SHIFT
+        cy = y >> CELL_SHIFT
+        cells = self._cells
+        found: list[SimSprite] = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                bucket = cells.get((gx, gy))
+                if bucket:
+                    found.extend(bucket)
+        return self._ordered(found)
+
+    def of_type(self, sprite_type: int) -> list[SimSprite]:
+        """Indexed sprites of ``sprite_type``, in sprite-list order."""
+        return self._ordered(self._by_type.get(sprite_type, ()))
@@ -30,9 +30,6 @@ from micropolis.constants import (
     LOMASK,
     ROADBASE,
     LASTROAD,
-    HRAILROAD,
-    VRAILROAD,
-    DIRT,
     TRA_GROOVE_X,
     TRA_GROOVE_Y,
     BUS_GROOVE_X,
@@ -51,6 +48,7 @@ from micropolis.random import Rand, Rand16
 import micropolis.random as random
 from micropolis.sim_sprite import SimSprite
 from micropolis.sim_view import SimView
+from micropolis.tile_classes import DRIVE_RESULT
 
 
 # ============================================================================
@@ -86,6 +84,7 @@ def new_sprite(
     if context.free_sprites:
         sprite = context.free_sprites
         context.free_sprites = sprite.next
+        sprite.reset()
     else:
         sprite = SimSprite()
 
@@ -99,6 +98,7 @@ def new_sprite(
         context.sim.sprites += 1
         sprite.next = context.sim.sprite
         context.sim.sprite = sprite
+        context.sprite_index.add(sprite)
 
     return sprite
 
@@ -249,6 +249,9 @@ def init_sprite(context: AppContext, sprite: SimSprite, x: int, y: int) -> None:
         sprite.frame = 1
         sprite.dir = 1
 
+    # Re-bucket a reinitialised sprite that is already indexed
+    context.sprite_index.update(sprite)
+
 
 def destroy_sprite(context: AppContext, sprite: SimSprite) -> None:
     """
@@ -260,29 +263,42 @@ def destroy_sprite(context: AppContext, sprite: SimSprite) -> None:
     """
     # global free_sprites
 
-    # Remove from global sprites if it's the global instance
-    if context.global_sprites[sprite.type] == sprite:
-        context.global_sprites[sprite.type] = None
-
-    # Clear name
-    if sprite.name:
-        sprite.name = ""
-
     # Remove from simulation sprite list
     if context.sim:
         current = context.sim.sprite
         prev: SimSprite | None = None
         while current:
-            if current == sprite:
-                if prev:
-                    prev.next = current.next
-                else:
-                    context.sim.sprite = current.next
-                context.sim.sprites -= 1
+            if current is sprite:
+                _unlink_sprite(context, prev, sprite)
                 break
             prev = current
             current = current.next
 
+    _release_sprite(context, sprite)
+
+
+def _unlink_sprite(
+    context: AppContext, prev: SimSprite | None, sprite: SimSprite
+) -> None:
+    """Remove ``sprite`` from the simulation list given its predecessor."""
+    if prev is not None:
+        prev.next = sprite.next
+    else:
+        context.sim.sprite = sprite.next
+    context.sim.sprites -= 1
+
+
+def _release_sprite(context: AppContext, sprite: SimSprite) -> None:
+    """Return an unlinked sprite to the free pool."""
+    context.sprite_index.remove(sprite)
+
+    # Remove from global sprites if it's the global instance
+    if context.global_sprites[sprite.type] is sprite:
+        context.global_sprites[sprite.type] = None
+
+    # Clear name
+    sprite.name = ""
+
     # Add to free pool
     sprite.next = context.free_sprites
     context.free_sprites = sprite
@@ -375,36 +391,34 @@ def move_objects(context: AppContext) -> None:
     if not context.sim:
         return
 
-    sprite = context.sim.sprite
+    sim = context.sim
+    index = context.sprite_index
+    # Pick up positions changed outside the movers (tools, SpriteCommand).
+    index.refresh()
+    prev: SimSprite | None = None
+    sprite = sim.sprite
     while sprite:
         if sprite.frame:
             # Call appropriate movement function based on sprite type
-            if sprite.type == TRA:
-                do_train_sprite(context, sprite)
-            elif sprite.type == COP:
-                do_copter_sprite(context, sprite)
-            elif sprite.type == AIR:
-                do_airplane_sprite(context, sprite)
-            elif sprite.type == SHI:
-                do_ship_sprite(context, sprite)
-            elif sprite.type == GOD:
-                do_monster_sprite(context, sprite)
-            elif sprite.type == TOR:
-                do_tornado_sprite(context, sprite)
-            elif sprite.type == EXP:
-                do_explosion_sprite(context, sprite)
-            elif sprite.type == BUS:
-                do_bus_sprite(context, sprite)
-
+            handler = _SPRITE_HANDLERS.get(sprite.type)
+            if handler is not None:
+                handler(context, sprite)
+                index.update(sprite)
+            prev = sprite
             sprite = sprite.next
-        else:
-            # Remove inactive sprites
-            if not sprite.name:  # Unnamed sprites get destroyed
-                temp = sprite
-                sprite = sprite.next
-                destroy_sprite(context, temp)
+        elif not sprite.name:  # Unnamed inactive sprites get destroyed
+            temp = sprite
+            sprite = sprite.next
+            # Handlers only prepend sprites, so prev is normally still
+            # linked to temp; fall back to a search if not.
+            if (prev.next if prev is not None else sim.sprite) is temp:
+                _unlink_sprite(context, prev, temp)
+                _release_sprite(context, temp)
             else:
-                sprite = sprite.next
+                destroy_sprite(context, temp)
+        else:
+            prev = sprite
+            sprite = sprite.next
 
 
 # ============================================================================
@@ -556,17 +570,15 @@ def do_airplane_sprite(context: AppContext, sprite: SimSprite) -> None:
 
     # Check for disasters
     if not context.no_disasters:
-        s = context.sim.sprite if context.sim else None
         explode = False
-        while s:
+        for s in _nearby_sprites(context, sprite):
             if (
                 s.frame != 0
-                and ((s.type == COP) or (sprite != s and s.type == AIR))
+                and ((s.type == COP) or (sprite is not s and s.type == AIR))
                 and check_sprite_collision(sprite, s)
             ):
                 explode_sprite(context, s)
                 explode = True
-            s = s.next
         if explode:
             explode_sprite(context, sprite)
 
@@ -794,8 +806,7 @@ def do_monster_sprite(context: AppContext, sprite: SimSprite) -> None:
         sprite.frame = 0  # kill zilla
 
     # Check collisions with other sprites
-    s = context.sim.sprite if context.sim else None
-    while s:
+    for s in _nearby_sprites(context, sprite):
         if (
             s.frame != 0
             and (
@@ -804,7 +815,6 @@ def do_monster_sprite(context: AppContext, sprite: SimSprite) -> None:
             and check_sprite_collision(sprite, s)
         ):
             explode_sprite(context, s)
-        s = s.next
 
     destroy(context, sprite.x + 48, sprite.y + 16)
 
@@ -840,8 +850,7 @@ def do_tornado_sprite(context: AppContext, sprite: SimSprite) -> None:
     sprite.frame = z
 
     # Check collisions with other sprites
-    s = context.sim.sprite if context.sim else None
-    while s:
+    for s in _nearby_sprites(context, sprite):
         if (
             s.frame != 0
             and (
@@ -850,7 +859,6 @@ def do_tornado_sprite(context: AppContext, sprite: SimSprite) -> None:
             and check_sprite_collision(sprite, s)
         ):
             explode_sprite(context, s)
-        s = s.next
 
     z = Rand(context, 5)
     sprite.x += CDx[z]
@@ -1046,22 +1054,33 @@ def do_bus_sprite(context: AppContext, sprite: SimSprite) -> None:
     sprite.y += dy
 
     if not context.no_disasters:
-        s = context.sim.sprite if context.sim else None
         explode = False
-        while s:
+        for s in _nearby_sprites(context, sprite):
             if (
-                sprite != s
+                sprite is not s
                 and s.frame != 0
                 and ((s.type == BUS) or ((s.type == TRA) and (s.frame != 5)))
                 and check_sprite_collision(sprite, s)
             ):
                 explode_sprite(context, s)
                 explode = True
-            s = s.next
         if explode:
             explode_sprite(context, sprite)
 
 
+# Movement handler per sprite type, dispatched by move_objects
+_SPRITE_HANDLERS = {
+    TRA: do_train_sprite,
+    COP: do_copter_sprite,
+    AIR: do_airplane_sprite,
+    SHI: do_ship_sprite,
+    GOD: do_monster_sprite,
+    TOR: do_tornado_sprite,
+    EXP: do_explosion_sprite,
+    BUS: do_bus_sprite,
+}
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -1231,6 +1250,17 @@ def get_dis(x1: int, y1: int, x2: int, y2: int) -> int:
     return disp_x + disp_y
 
 
+def _nearby_sprites(context: AppContext, sprite: SimSprite) -> list[SimSprite]:
+    """
+    Collision candidates for a sprite, in sprite-list order.
+
+    Every sprite that check_sprite_collision() could accept is included.
+    """
+    if not context.sim:
+        return []
+    return context.sprite_index.near(sprite.x + sprite.x_hot, sprite.y + sprite.y_hot)
+
+
 def check_sprite_collision(s1: SimSprite, s2: SimSprite) -> int:
     """
     Check if two sprites are colliding.
@@ -1267,24 +1297,7 @@ def can_drive_on(context: AppContext, x: int, y: int) -> int:
     if not test_bounds(x, y):
         return 0
 
-    tile = context.map_data[x][y] & LOMASK
-
-    if (
-        (
-            (tile >= ROADBASE)
-            and (tile <= LASTROAD)
-            and (tile != BRWH)
-            and (tile != BRWV)
-        )
-        or (tile == HRAILROAD)
-        or (tile == VRAILROAD)
-    ):
-        return 1
-
-    if (tile == DIRT) or tally(tile):  # tally function not implemented yet
-        return -1
-
-    return 0
+    return DRIVE_RESULT[context.map_data[x][y] & LOMASK]
 
 
 def test_bounds(x: int, y: int) -> bool:
@@ -1301,20 +1314,6 @@ def test_bounds(x: int, y: int) -> bool:
     return 0 <= x < WORLD_X and 0 <= y < WORLD_Y
 
 
-def tally(tile: int) -> bool:
-    """
-    Check if tile is a tally-able building (placeholder).
-
-    Args:
-        tile: Tile ID
-
-    Returns:
-        True if tally-able, False otherwise
-    """
-    # Placeholder - would need implementation from original C code
-    return False
-
-
 # ============================================================================
 # Sprite Generation Functions
 # ============================================================================
@@ -1820,6 +1819,7 @@ def initialize_sprite_system(context: AppContext) -> None:
 
     # Clear free sprite pool
     context.free_sprites = None
+    context.sprite_index.clear()
 
     # Reset cycle counter
     context.cycle = 0
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from typing import Any
 from types import SimpleNamespace
 
@@ -30,6 +31,24 @@ class Binding:
     from_legacy: Callable[[Any], Any]
 
 
+@dataclass
+class ContractStats:
+    """Counters for context notifications seen by a LegacyStateContract.
+
+    ``coalesced`` counts batched notifications superseded by a later write
+    to the same field before a flush; ``pushed`` counts bindings actually
+    converted and written to the legacy namespace.
+    """
+
+    notifications: int = 0
+    coalesced: int = 0
+    pushed: int = 0
+    flushes: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
 class LegacyTypes(SimpleNamespace):
     """SimpleNamespace variant that supports change watchers."""
 
@@ -104,6 +123,9 @@ class LegacyStateContract:
         }
         self._legacy_watch_handles: list[Callable[[], None]] = []
         self._ignore_legacy: set[str] = set()
+        self._batched = False
+        self._pending: dict[str, Any] = {}
+        self.stats = ContractStats()
 
     def bind(self, context: AppContext, types: LegacyTypes) -> None:
         """Attach the contract to a context/types pair."""
@@ -119,7 +141,59 @@ class LegacyStateContract:
         binding = self._bindings_by_field.get(field)
         if binding is None or self._types is None:
             return
-        self._update_legacy(binding, value)
+        self.stats.notifications += 1
+        if self._batched:
+            if field in self._pending:
+                self.stats.coalesced += 1
+            self._pending[field] = value
+            return
+        self._push(binding, value)
+
+    @property
+    def batched(self) -> bool:
+        return self._batched
+
+    def set_batched(self, enabled: bool) -> None:
+        """Switch between per-write and batched legacy updates.
+
+        While batched, context writes only record the field's latest value;
+        ``flush`` converts and pushes each recorded field once. Leaving
+        batched mode flushes anything still pending.
+        """
+
+        self._batched = enabled
+        if not enabled:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[LegacyStateContract]:
+        """Batch legacy updates for the duration of the block."""
+
+        previous = self._batched
+        self._batched = True
+        try:
+            yield self
+        finally:
+            self.set_batched(previous)
+
+    def flush(self) -> int:
+        """Push pending context writes to the legacy namespace.
+
+        Returns:
+            Number of bindings pushed
+        """
+
+        if not self._pending:
+            return 0
+        pending = self._pending
+        self._pending = {}
+        self.stats.flushes += 1
+        for field, value in pending.items():
+            self._push(self._bindings_by_field[field], value)
+        return len(pending)
+
+    def reset_stats(self) -> None:
+        self.stats = ContractStats()
 
     # Internal helpers -------------------------------------------------
     def _register_watchers(self) -> None:
@@ -155,6 +229,10 @@ class LegacyStateContract:
                     getattr(self._context, binding.field),
                 )
 
+    def _push(self, binding: Binding, value: Any) -> None:
+        self.stats.pushed += 1
+        self._update_legacy(binding, value)
+
     def _update_legacy(self, binding: Binding, value: Any) -> None:
         types = self._types
         if types is None:
@@ -171,6 +249,8 @@ class LegacyStateContract:
     def _handle_legacy_update(self, binding: Binding, value: Any) -> None:
         if binding.legacy in self._ignore_legacy:
             return
+        # The legacy write is newer than any batched context value.
+        self._pending.pop(binding.field, None)
         self._set_context(binding, value)
 
     def _set_context(self, binding: Binding, legacy_value: Any) -> None:
@@ -0,0 +1,319 @@
+"""
+tile_classes.py - Per-tile-id property tables
+
+The C simulation classifies tiles with chains of range comparisons
+(``>= FIREBASE``, ``< ROADBASE``, ``< POWERBASE`` ...) wherever it needs to
+know what a tile is. This module evaluates those rules once, at import, for
+every tile id ``0..LOMASK`` and stores the answers in lookup tables indexed by
+``tile & LOMASK``.
+
+Each table comes in two forms:
+
+* a tuple (``TILE_CLASS``, ``TILE_FLAGS`` ...) for scalar lookups in
+  per-tile code, where tuple indexing is cheaper than a NumPy scalar;
+* a read-only NumPy array (``TILE_CLASS_ARRAY`` ...) for whole-map passes,
+  e.g. ``TILE_FLAGS_ARRAY[tiles & LOMASK] & TF_SCAN``.
+
+Properties carried in the status bits of the tile value itself (``CONDBIT``,
+``BURNBIT``, ``ZONEBIT`` ...) are not duplicated here; the tables only
+describe what follows from the tile id.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+import numpy as np
+
+from .constants import (
+    AIRPORT,
+    AIRPORTBASE,
+    BRWH,
+    BRWV,
+    COMBASE,
+    COMCLR,
+    CZB,
+    DIRT,
+    FIREBASE,
+    FIRESTATION,
+    FIRESTBASE,
+    FIRSTRIVEDGE,
+    FLOOD,
+    FREEZ,
+    FULLSTADIUM,
+    HRAILROAD,
+    HTRFBASE,
+    INDBASE,
+    INDCLR,
+    IZB,
+    LASTFIRE,
+    LASTFLOOD,
+    LASTIND,
+    LASTPOWERPLANT,
+    LASTRAIL,
+    LASTRIVEDGE,
+    LASTROAD,
+    LASTRUBBLE,
+    LASTTINYEXP,
+    LASTTREE,
+    LASTZONE,
+    LOMASK,
+    LTRFBASE,
+    NUCLEAR,
+    POLICESTATION,
+    POLICESTBASE,
+    PORT,
+    PORTBASE,
+    POWERBASE,
+    POWERPLANT,
+    RADTILE,
+    RAILBASE,
+    RAILHPOWERV,
+    RESBASE,
+    ROADBASE,
+    RUBBLE,
+    RZB,
+    SOMETINYEXP,
+    STADIUM,
+    STADIUMBASE,
+    TINYEXP,
+    TREEBASE,
+    VRAILROAD,
+)
+
+TILE_IDS = LOMASK + 1
+
+
+class TileClass(IntEnum):
+    """Coarse kind of a tile id, in tile-id order."""
+
+    CLEAR = 0  # dirt and unused ids
+    WATER = 1
+    TREE = 2
+    RUBBLE = 3
+    FLOOD = 4
+    RADIATION = 5
+    FIRE = 6
+    ROAD = 7
+    POWERLINE = 8
+    RAIL = 9
+    RESIDENTIAL = 10
+    COMMERCIAL = 11
+    INDUSTRIAL = 12
+    SEAPORT = 13
+    AIRPORT = 14
+    POWERPLANT = 15
+    FIRESTATION = 16
+    POLICESTATION = 17
+    STADIUM = 18
+    NUCLEAR = 19
+    EXPLOSION = 20
+    OTHER = 21  # lightning, drawbridge pieces, animation frames
+
+
+# Flag bits in TILE_FLAGS.
+TF_ROAD = 0x001  # ROADBASE..POWERBASE-1, roads and bridges
+TF_RAIL = 0x002  # RAILBASE..RESBASE-1
+TF_POWERLINE = 0x004  # POWERBASE..RAILBASE-1, including road/rail crossings
+TF_TRANSIT = 0x008  # traffic can route over it (traffic.RoadTest)
+TF_ZONE_CENTER = 0x010  # centre tile of a zone or special building
+TF_BULLDOZABLE = 0x020  # cleared automatically by auto-bulldoze (tools.tally)
+TF_ON_FIRE = 0x040  # FIREBASE..LASTFIRE
+TF_SCAN = 0x080  # map_scan handles it regardless of status bits
+
+# Centres of the 3x3 residential, commercial and industrial zones are nine
+# ids apart, starting at RZB, CZB and IZB; FREEZ, COMCLR and INDCLR are the
+# empty zones. Larger buildings have a single centre id each.
+_SPECIAL_CENTERS = (
+    PORT,
+    AIRPORT,
+    POWERPLANT,
+    FIRESTATION,
+    POLICESTATION,
+    STADIUM,
+    FULLSTADIUM,
+    NUCLEAR,
+)
+
+
+def _tile_class(tile: int) -> TileClass:
+    if tile == DIRT:
+        return TileClass.CLEAR
+    if tile < TREEBASE:
+        return TileClass.WATER
+    if tile < RUBBLE:
+        return TileClass.TREE
+    if tile < FLOOD:
+        return TileClass.RUBBLE
+    if tile < RADTILE:
+        return TileClass.FLOOD
+    if tile < FIREBASE:
+        return TileClass.RADIATION
+    if tile < ROADBASE:
+        return TileClass.FIRE
+    if tile < POWERBASE:
+        return TileClass.ROAD
+    if tile < RAILBASE:
+        return TileClass.POWERLINE
+    if tile < RESBASE:
+        return TileClass.RAIL
+    if tile < COMBASE:
+        return TileClass.RESIDENTIAL
+    if tile < INDBASE:
+        return TileClass.COMMERCIAL
+    if tile < PORTBASE:
+        return TileClass.INDUSTRIAL
+    if tile < AIRPORTBASE:
+        return TileClass.SEAPORT
+    if tile < POWERPLANT - 4:
+        return TileClass.AIRPORT
+    if tile < FIRESTBASE:
+        return TileClass.POWERPLANT
+    if tile < POLICESTBASE:
+        return TileClass.FIRESTATION
+    if tile < STADIUMBASE:
+        return TileClass.POLICESTATION
+    if tile < NUCLEAR - 4:
+        return TileClass.STADIUM
+    if tile <= LASTZONE:
+        return TileClass.NUCLEAR
+    if TINYEXP <= tile <= LASTTINYEXP:
+        return TileClass.EXPLOSION
+    return TileClass.OTHER
+
+
+def _is_zone_center(tile: int) -> bool:
+    if tile in (FREEZ, COMCLR, INDCLR) or tile in _SPECIAL_CENTERS:
+        return True
+    for first, end in ((RZB, COMBASE), (CZB, INDBASE), (IZB, PORTBASE)):
+        if first <= tile < end and (tile - first) % 9 == 0:
+            return True
+    return False
+
+
+def _is_transit(tile: int) -> bool:
+    # RoadTest in s_traf.c: roads and rail, excluding plain power lines.
+    if tile < ROADBASE or tile > LASTRAIL:
+        return False
+    return not (POWERBASE <= tile < RAILHPOWERV)
+
+
+def _is_bulldozable(tile: int) -> bool:
+    # tally in w_tool.c.
+    if POWERBASE + 2 <= tile <= POWERBASE + 12:
+        return True
+    if TINYEXP <= tile <= LASTTINYEXP + 2:
+        return True
+    return any(
+        start <= tile <= end
+        for start, end in (
+            (FIRSTRIVEDGE, LASTRIVEDGE),
+            (TREEBASE, LASTTREE),
+            (RUBBLE, LASTRUBBLE),
+            (FLOOD, LASTFLOOD),
+            (RADTILE, RADTILE),
+            (FIREBASE, LASTFIRE),
+            (ROADBASE, LASTROAD),
+        )
+    )
+
+
+def _tile_flags(tile: int) -> int:
+    flags = 0
+    if ROADBASE <= tile < POWERBASE:
+        flags |= TF_ROAD
+    if RAILBASE <= tile < RESBASE:
+        flags |= TF_RAIL
+    if POWERBASE <= tile < RAILBASE:
+        flags |= TF_POWERLINE
+    if _is_transit(tile):
+        flags |= TF_TRANSIT
+    if _is_zone_center(tile):
+        flags |= TF_ZONE_CENTER
+    if _is_bulldozable(tile):
+        flags |= TF_BULLDOZABLE
+    if FIREBASE <= tile <= LASTFIRE:
+        flags |= TF_ON_FIRE
+    if tile >= FLOOD and (
+        tile < POWERBASE
+        or RAILBASE <= tile < RESBASE
+        or SOMETINYEXP <= tile <= LASTTINYEXP
+    ):
+        flags |= TF_SCAN
+    return flags
+
+
+def _pop_density(tile: int) -> int:
+    # GetPDen in s_scan.c for every id but FREEZ, whose population is
+    # counted from the map (DoFreePop).
+    if tile == FREEZ:
+        return 0
+    if tile < COMBASE:
+        return ((tile - RZB) // 9) % 4 * 8 + 16
+    if tile < INDBASE:
+        if tile == COMCLR:
+            return 0
+        return ((((tile - CZB) // 9) % 5) + 1) << 3
+    if tile < PORTBASE:
+        if tile == INDCLR:
+            return 0
+        return ((((tile - IZB) // 9) % 4) + 1) << 3
+    return 0
+
+
+def _pollution(tile: int) -> int:
+    # GetPValue in s_scan.c.
+    if tile < POWERBASE:
+        if tile >= HTRFBASE:
+            return 75
+        if tile >= LTRFBASE:
+            return 50
+        if tile < ROADBASE:
+            if tile > FIREBASE:
+                return 90
+            if tile >= RADTILE:
+                return 255
+        return 0
+    if tile <= LASTIND:
+        return 0
+    if tile < PORTBASE:
+        return 50
+    if tile <= LASTPOWERPLANT:
+        return 100
+    return 0
+
+
+def _traffic_level(tile: int) -> int:
+    # Density step of a road tile in DoRoad: 0 clear, 1 light, 2 heavy.
+    if tile < LTRFBASE:
+        return 0
+    if tile < HTRFBASE:
+        return 1
+    return 2
+
+
+def _drive_result(tile: int) -> int:
+    # can_drive_on in sprite_manager: 1 drivable, -1 bumpy, 0 blocked.
+    if (ROADBASE <= tile <= LASTROAD and tile not in (BRWH, BRWV)) or tile in (
+        HRAILROAD,
+        VRAILROAD,
+    ):
+        return 1
+    if tile == DIRT:
+        return -1
+    return 0
+
+
+def _build(rule, dtype) -> tuple[tuple[int, ...], np.ndarray]:
+    values = tuple(int(rule(tile)) for tile in range(TILE_IDS))
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return values, array
+
+
+TILE_CLASS, TILE_CLASS_ARRAY = _build(_tile_class, np.uint8)
+TILE_FLAGS, TILE_FLAGS_ARRAY = _build(_tile_flags, np.uint16)
+POP_DENSITY, POP_DENSITY_ARRAY = _build(_pop_density, np.int16)
+POLLUTION, POLLUTION_ARRAY = _build(_pollution, np.int16)
+TRAFFIC_LEVEL, TRAFFIC_LEVEL_ARRAY = _build(_traffic_level, np.uint8)
+DRIVE_RESULT, DRIVE_RESULT_ARRAY = _build(_drive_result, np.int8)
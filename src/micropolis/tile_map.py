@@ -0,0 +1,277 @@
+"""
+tile_map.py - Contiguous array-backed storage for the tile map and overlays
+
+The original engine keeps the city in one ``short Map[WORLD_X][WORLD_Y]``
+block, and its half-, quarter- and eighth-resolution overlays in ``Byte`` and
+``short`` blocks of their own (s_alloc.c). ``ArrayGrid`` restores that layout
+with a single typed NumPy array per grid while still behaving like the nested
+``list[list[int]]`` the rest of the port indexes as ``grid[x][y]``. Each
+column is a ``memoryview`` onto the shared buffer, so scalar reads return
+plain ``int`` values and scalar writes land in the same array that whole-map
+passes operate on with vectorized expressions.
+
+Legacy code and tests may still assign plain nested lists to the context
+fields. The ``grid_array``/``store_grid_array`` helpers (and their
+``tile_array``/``store_tile_array`` specialisations for the main map) accept
+either representation so vectorized passes keep working on both.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .constants import HWLDX, HWLDY, QWX, QWY, SM_X, SM_Y, WORLD_X, WORLD_Y
+
+TILE_DTYPE = np.uint16
+BYTE_DTYPE = np.uint8  # C ``Byte`` overlays
+SHORT_DTYPE = np.int16  # C ``short`` overlays
+
+MapData = list[list[int]]
+
+# Overlay grids owned by AppContext, with the dimensions and element type of
+# the matching s_alloc.c buffers.
+OVERLAY_GRIDS: dict[str, tuple[int, int, type[np.integer]]] = {
+    "pop_density": (HWLDX, HWLDY, BYTE_DTYPE),
+    "trf_density": (HWLDX, HWLDY, BYTE_DTYPE),
+    "pollution_mem": (HWLDX, HWLDY, BYTE_DTYPE),
+    "land_value_mem": (HWLDX, HWLDY, BYTE_DTYPE),
+    "crime_mem": (HWLDX, HWLDY, BYTE_DTYPE),
+    "tem": (HWLDX, HWLDY, BYTE_DTYPE),
+    "tem2": (HWLDX, HWLDY, BYTE_DTYPE),
+    "terrain_mem": (QWX, QWY, BYTE_DTYPE),
+    "Qtem": (QWX, QWY, BYTE_DTYPE),
+    "rate_og_mem": (SM_X, SM_Y, SHORT_DTYPE),
+    "fire_st_map": (SM_X, SM_Y, SHORT_DTYPE),
+    "police_map": (SM_X, SM_Y, SHORT_DTYPE),
+    "police_map_effect": (SM_X, SM_Y, SHORT_DTYPE),
+    "com_rate": (SM_X, SM_Y, SHORT_DTYPE),
+    "fire_rate": (SM_X, SM_Y, SHORT_DTYPE),
+    "stem": (SM_X, SM_Y, SHORT_DTYPE),
+}
+
+
+class ArrayGrid(list):
+    """Column-major typed 2-D grid exposing ``grid[x][y]`` access.
+
+    The list entries are ``memoryview`` columns over ``array[x]``. Column
+    slices (``grid[x][:]``) therefore alias the grid; use ``copy()`` or
+    ``tolist()`` to take a snapshot. Scalar writes must fit the element type;
+    bulk writes through ``array`` wrap like the original C stores.
+    """
+
+    __slots__ = ("_array",)
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        dtype: type[np.integer] = BYTE_DTYPE,
+        *,
+        values: np.ndarray | None = None,
+    ) -> None:
+        if values is None:
+            values = np.zeros((width, height), dtype=dtype)
+        elif values.ndim != 2:
+            raise ValueError(f"{type(self).__name__} requires a 2-D array")
+        values = np.ascontiguousarray(values)
+        self._array = values
+        super().__init__(memoryview(column) for column in values)
+
+    @classmethod
+    def from_columns(
+        cls, columns: Any, dtype: type[np.integer] = BYTE_DTYPE
+    ) -> ArrayGrid:
+        """Build a grid by copying a nested ``[x][y]`` sequence.
+
+        Args:
+            columns: Nested list (or grid/ndarray) indexed as ``[x][y]``
+            dtype: Element type of the new grid
+
+        Returns:
+            New grid holding a copy of the values, wrapped to ``dtype``
+        """
+        values = np.array(columns, dtype=np.int64).astype(dtype)
+        return cls(*values.shape, dtype, values=values)
+
+    @property
+    def array(self) -> np.ndarray:
+        """The backing ``(width, height)`` array."""
+        return self._array
+
+    @property
+    def width(self) -> int:
+        return self._array.shape[0]
+
+    @property
+    def height(self) -> int:
+        return self._array.shape[1]
+
+    def fill(self, value: int) -> None:
+        """Set every cell to ``value``."""
+        self._array.fill(value)
+
+    def copy(self) -> ArrayGrid:  # type: ignore[override]
+        """Return an independent grid with the same values."""
+        return type(self)(*self._array.shape, values=self._array.copy())
+
+    def tolist(self) -> MapData:
+        """Return the values as a nested ``list[list[int]]`` snapshot."""
+        return self._array.tolist()
+
+    def __setitem__(self, index: Any, value: Any) -> None:  # type: ignore[override]
+        # Replacing a column copies values into the shared buffer instead of
+        # swapping out the memoryview, which would detach it from the array.
+        self._array[index] = np.asarray(value, dtype=np.int64)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ArrayGrid):
+            return bool(np.array_equal(self._array, other._array))
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> ArrayGrid:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> ArrayGrid:
+        return self.copy()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_rebuild_grid, (type(self), self._array.copy()))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.width}x{self.height}, "
+            f"{self._array.dtype.name})"
+        )
+
+
+class TileMap(ArrayGrid):
+    """The ``uint16`` main tile map, indexed as ``map_data[x][y]``."""
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        width: int = WORLD_X,
+        height: int = WORLD_Y,
+        dtype: type[np.integer] = TILE_DTYPE,
+        *,
+        tiles: np.ndarray | None = None,
+        values: np.ndarray | None = None,
+    ) -> None:
+        values = tiles if tiles is not None else values
+        if values is not None and values.dtype != TILE_DTYPE:
+            raise ValueError("TileMap requires a uint16 array")
+        super().__init__(width, height, TILE_DTYPE, values=values)
+
+    @classmethod
+    def from_columns(
+        cls, columns: Any, dtype: type[np.integer] = TILE_DTYPE
+    ) -> TileMap:
+        if isinstance(columns, TileMap):
+            return columns.copy()
+        return super().from_columns(columns, TILE_DTYPE)  # type: ignore[return-value]
+
+
+def _rebuild_grid(grid_type: type[ArrayGrid], values: np.ndarray) -> ArrayGrid:
+    return grid_type(*values.shape, values=values)
+
+
+def new_overlay_grid(name: str) -> ArrayGrid:
+    """Create the zeroed grid for the AppContext overlay field ``name``."""
+    width, height, dtype = OVERLAY_GRIDS[name]
+    return ArrayGrid(width, height, dtype)
+
+
+def ensure_overlay_grid(grid: Any, name: str) -> ArrayGrid:
+    """Return ``grid`` as a correctly sized overlay ArrayGrid.
+
+    Grids of the wrong size are replaced with zeroed ones; correctly sized
+    nested lists are copied into a new grid.
+    """
+    width, height, dtype = OVERLAY_GRIDS[name]
+    if len(grid) != width or len(grid[0]) != height:
+        return ArrayGrid(width, height, dtype)
+    if isinstance(grid, ArrayGrid) and grid.array.dtype == dtype:
+        return grid
+    return ArrayGrid.from_columns(grid, dtype)
+
+
+def grid_array(grid: Any, dtype: type[np.integer] | None = None) -> np.ndarray:
+    """Return a grid's values as a 2-D array.
+
+    For an ``ArrayGrid`` this is the live backing array, so in-place edits are
+    visible through ``grid[x][y]``. Plain nested lists are copied (to
+    ``dtype`` if given); pair edits with ``store_grid_array`` to write them
+    back.
+
+    Args:
+        grid: ArrayGrid or nested ``[x][y]`` list
+        dtype: Element type for copies of nested lists
+
+    Returns:
+        ``(width, height)`` array
+    """
+    if isinstance(grid, ArrayGrid):
+        return grid.array
+    if isinstance(grid, np.ndarray):
+        return grid
+    values = np.array(grid, dtype=np.int64)
+    return values if dtype is None else values.astype(dtype)
+
+
+def store_grid_array(grid: Any, values: np.ndarray) -> None:
+    """Write ``values`` back into ``grid`` if it is not the backing array.
+
+    Args:
+        grid: ArrayGrid or nested ``[x][y]`` list to update in place
+        values: Array previously obtained from ``grid_array`` (or any array
+            of the same shape)
+    """
+    if isinstance(grid, ArrayGrid):
+        if grid.array is not values:
+            grid.array[...] = values
+        return
+    if grid is values:
+        return
+    for x, column in enumerate(values.tolist()):
+        grid[x][:] = column
+
+
+def fill_grid(grid: Any, value: int) -> None:
+    """Set every cell of an ArrayGrid or nested list to ``value``."""
+    if isinstance(grid, ArrayGrid):
+        grid.fill(value)
+        return
+    for column in grid:
+        column[:] = [value] * len(column)
+
+
+def tile_array(map_data: Any) -> np.ndarray:
+    """Return the main tile map as a ``uint16`` array (see ``grid_array``)."""
+    if isinstance(map_data, np.ndarray) and map_data.dtype != TILE_DTYPE:
+        return map_data.astype(TILE_DTYPE)
+    return grid_array(map_data, TILE_DTYPE)
+
+
+def store_tile_array(map_data: Any, tiles: np.ndarray) -> None:
+    """Write ``tiles`` back into ``map_data`` (see ``store_grid_array``)."""
+    store_grid_array(map_data, tiles)
+
+
+def ensure_tile_map(map_data: Any) -> TileMap:
+    """Return ``map_data`` as a TileMap, copying nested lists if needed."""
+    if isinstance(map_data, TileMap):
+        return map_data
+    return TileMap.from_columns(map_data)
@@ -29,20 +29,12 @@ from micropolis.constants import (
     RAILBASE,
     POWERBASE,
     CONDBIT,
-    FIRSTRIVEDGE,
-    LASTRIVEDGE,
     TREEBASE,
-    LASTTREE,
     RUBBLE,
-    LASTRUBBLE,
     FLOOD,
-    LASTFLOOD,
     RADTILE,
     FIRE,
-    LASTFIRE,
-    LASTROAD,
     TINYEXP,
-    LASTTINYEXP,
     RESBASE,
     PORTBASE,
     LASTPOWERPLANT,
@@ -86,7 +78,9 @@ from micropolis.constants import (
 )
 from micropolis.context import AppContext
 from micropolis.macros import TestBounds
+from micropolis.power import note_conductor_change
 from micropolis.random import Rand
+from micropolis.tile_classes import TF_BULLDOZABLE, TILE_FLAGS
 import sys
 from micropolis import compat_shims
 
@@ -244,6 +238,7 @@ def ConnecTile(
     elif command == 4:  # Wire
         if current_tile == 0:  # Empty tile
             context.map_data[x][y] = POWERBASE | BNCNBIT | CONDBIT
+            note_conductor_change(context, x, y)
             Spend(context, CostOf[context.wire_state])
             return 1
 
@@ -263,31 +258,7 @@ def tally(tileValue: int) -> int:
     Returns:
         1 if tile can be auto-bulldozed, 0 otherwise
     """
-    tile_base = tileValue & LOMASK
-
-    # Can bulldoze: rivers, trees, rubble, flood, radioactive waste, fire, roads
-    bulldozable_ranges = [
-        (FIRSTRIVEDGE, LASTRIVEDGE),  # Rivers and edges
-        (TREEBASE, LASTTREE),  # Trees
-        (RUBBLE, LASTRUBBLE),  # Rubble
-        (FLOOD, LASTFLOOD),  # Flood water
-        (RADTILE, RADTILE),  # Radioactive waste
-        (FIRE, LASTFIRE),  # Fire
-        (ROADBASE, LASTROAD),  # Roads
-    ]
-
-    # Check power lines (specific ranges)
-    if ((POWERBASE + 2) <= tile_base <= (POWERBASE + 12)) or (
-        TINYEXP <= tile_base <= (LASTTINYEXP + 2)
-    ):
-        return 1
-
-    # Check bulldozable ranges
-    for start, end in bulldozable_ranges:
-        if start <= tile_base <= end:
-            return 1
-
-    return 0
+    return 1 if TILE_FLAGS[tileValue & LOMASK] & TF_BULLDOZABLE else 0
 
 
 def checkSize(temp: int) -> int:
@@ -606,6 +577,7 @@ def check3x3(
             mapH += 1
         mapV += 1
 
+    note_conductor_change(context, xPos, yPos, 3, 3)
     check3x3border(context, xPos, yPos)
     return 1
 
@@ -748,6 +720,7 @@ def check4x4(
             mapH += 1
         mapV += 1
 
+    note_conductor_change(context, h, v, 4, 4)
     check4x4border(context, xMap, yMap)
     return 1
 
@@ -881,6 +854,7 @@ def check6x6(
             mapH += 1
         mapV += 1
 
+    note_conductor_change(context, h, v, 6, 6)
     check6x6border(context, xMap, yMap)
     return 1
 
@@ -1519,6 +1493,7 @@ def put3x3Rubble(context_or_x, x_or_y=None, y=None) -> None:
                         | ANIMBIT
                         | BULLBIT
                     )
+    note_conductor_change(ctx, x - 1, y - 1, 3, 3)
 
 
 def put4x4Rubble(context_or_x, x_or_y=None, y=None) -> None:
@@ -1557,6 +1532,7 @@ def put4x4Rubble(context_or_x, x_or_y=None, y=None) -> None:
                         | ANIMBIT
                         | BULLBIT
                     )
+    note_conductor_change(ctx, x - 1, y - 1, 4, 4)
 
 
 def put6x6Rubble(context_or_x, x_or_y=None, y=None) -> None:
@@ -1595,6 +1571,7 @@ def put6x6Rubble(context_or_x, x_or_y=None, y=None) -> None:
                         | ANIMBIT
                         | BULLBIT
                     )
+    note_conductor_change(ctx, x - 1, y - 1, 6, 6)
 
 
 # ============================================================================
@@ -6,13 +6,18 @@
 #
 # Original C file: s_traf.c
 # Ported to maintain algorithmic fidelity with the original Micropolis simulation
+import numpy as np
+
 from micropolis.constants import MAXDIS, LOMASK, ROADBASE, POWERBASE, TELEBASE, TELELAST, WORLD_X, WORLD_Y, COMBASE, \
-    LHTHR, NUCLEAR, PORT, LASTRAIL, RAILHPOWERV
+    LHTHR, NUCLEAR, PORT
 from micropolis.context import AppContext
 from micropolis.macros import TestBounds
+from micropolis.pos_stack import PosStack
 from micropolis.random import sim_rand
 from micropolis.simulation import rand
 from micropolis.sprite_manager import GetSprite
+from micropolis.tile_classes import TF_ROAD, TF_TRANSIT, TILE_FLAGS, TILE_FLAGS_ARRAY
+from micropolis.tile_map import ArrayGrid
 
 
 # ============================================================================
@@ -47,7 +52,7 @@ def MakeTraf(context: AppContext, Zt: int) -> int:
 
     # Set zone source type
     context.z_source = Zt
-    context.pos_stack_num = 0
+    context.pos_stack.clear()
 
     # Check for telecommuting (currently disabled in original)
     # if (not random.Rand(2)) and FindPTele():
@@ -56,7 +61,11 @@ def MakeTraf(context: AppContext, Zt: int) -> int:
     # Look for road on zone perimeter
     if FindPRoad(context):
         # Attempt to drive somewhere
-        if TryDrive(context):
+        if context.traffic_cache.enabled:
+            passed = _cached_drive(context)
+        else:
+            passed = TryDrive(context)
+        if passed:
             # If successful, increment traffic density
             SetTrafMem(context)
             context.s_map_x = xtem
@@ -70,17 +79,57 @@ def MakeTraf(context: AppContext, Zt: int) -> int:
         return -1  # no road found
 
 
+def _cached_drive(context: AppContext) -> bool:
+    """
+    TryDrive answered from context.traffic_cache.
+
+    Fails at once when no destination is within MAXDIS of the start tile.
+    Otherwise either takes a real TryDrive walk and returns its result, or
+    passes by replaying the route remembered from the last successful walk
+    onto the position stack for SetTrafMem.
+    :param context:
+    """
+    cache = context.traffic_cache
+    cache.sync(context.map_data, (context.city_time, context.fcycle))
+    x = context.s_map_x
+    y = context.s_map_y
+    zone_type = context.z_source
+    if not cache.reachable(x, y, zone_type):
+        cache.stats.failed += 1
+        return False
+    if cache.should_walk(x, y, zone_type):
+        cache.stats.walks += 1
+        if TryDrive(context):
+            cache.remember(x, y, zone_type, list(context.pos_stack))
+            return True
+        context.pos_stack.clear()
+        return False
+    cache.stats.replays += 1
+    context.pos_stack.extend(cache.route(x, y, zone_type))
+    return True
+
+
 def SetTrafMem(context: AppContext) -> None:
     """
     Update traffic density memory along the driven path.
 
     Increments traffic density for road tiles along the path taken.
     Occasionally spawns police cars for high traffic areas.
+
+    When no cell on the path would pass 240 the whole path is applied as one
+    scatter-add; otherwise the positions are popped one at a time so rand()
+    is drawn exactly where the C loop draws it.
     :param context: 
     """
-
-    for x in range(context.pos_stack_num, 0, -1):
-        PullPos(context)
+    stack = context.pos_stack
+    if stack.count and _scatter_traf_mem(context, stack):
+        context.s_map_x = stack.xs[1]
+        context.s_map_y = stack.ys[1]
+        stack.clear()
+        return
+
+    while stack.count:
+        context.s_map_x, context.s_map_y = stack.pop()
         if TestBounds(context.s_map_x, context.s_map_y):
             z = context.map_data[context.s_map_x][context.s_map_y] & LOMASK
             if (z >= ROADBASE) and (z < POWERBASE):
@@ -99,7 +148,40 @@ def SetTrafMem(context: AppContext) -> None:
                     if sprite and (sprite.control == -1):
                         sprite.dest_x = context.traf_max_x
                         sprite.dest_y = context.traf_max_y
-                context.trf_density[density_x][density_y] = z
+                # TrfDensity is a Byte map in C; the store truncates
+                context.trf_density[density_x][density_y] = z & 0xFF
+
+
+def _scatter_traf_mem(context: AppContext, stack: PosStack) -> bool:
+    """
+    Add 50 to trf_density for every road tile on the path in one pass.
+
+    Returns False, leaving the overlay untouched, when the grids are plain
+    lists or when some cell would exceed 240 and so needs the sequential
+    loop in SetTrafMem.
+    :param context:
+    """
+    density = context.trf_density
+    map_data = context.map_data
+    if not (isinstance(density, ArrayGrid) and isinstance(map_data, ArrayGrid)):
+        return False
+    n = stack.count + 1
+    xs = np.frombuffer(stack.xs, dtype=np.int16, count=n)[1:]
+    ys = np.frombuffer(stack.ys, dtype=np.int16, count=n)[1:]
+    inside = (xs >= 0) & (xs < WORLD_X) & (ys >= 0) & (ys < WORLD_Y)
+    xs = xs[inside]
+    ys = ys[inside]
+    road = (TILE_FLAGS_ARRAY[map_data.array[xs, ys] & LOMASK] & TF_ROAD) != 0
+    cells, hits = np.unique(
+        (xs[road] >> 1).astype(np.intp) * density.height + (ys[road] >> 1),
+        return_counts=True,
+    )
+    flat = density.array.reshape(-1)
+    values = flat[cells] + 50 * hits
+    if values.size and values.max() > 240:
+        return False
+    flat[cells] = values
+    return True
 
 
 def PushPos(context: AppContext) -> None:
@@ -107,14 +189,7 @@ def PushPos(context: AppContext) -> None:
     Push current position onto the position stack.
     :param context:
     """
-    context.pos_stack_num += 1
-    # Ensure stacks are large enough
-    while len(context.s_map_x_stack) <= context.pos_stack_num:
-        context.s_map_x_stack.append(0)
-    while len(context.s_map_y_stack) <= context.pos_stack_num:
-        context.s_map_y_stack.append(0)
-    context.s_map_x_stack[context.pos_stack_num] = context.s_map_x
-    context.s_map_y_stack[context.pos_stack_num] = context.s_map_y
+    context.pos_stack.push(context.s_map_x, context.s_map_y)
 
 
 def PullPos(context: AppContext) -> None:
@@ -122,9 +197,7 @@ def PullPos(context: AppContext) -> None:
     Pull position from the position stack.
     :param context:
     """
-    context.s_map_x = context.s_map_x_stack[context.pos_stack_num]
-    context.s_map_y = context.s_map_y_stack[context.pos_stack_num]
-    context.pos_stack_num -= 1
+    context.s_map_x, context.s_map_y = context.pos_stack.pop()
 
 
 def FindPRoad(context: AppContext) -> bool:
@@ -187,14 +260,15 @@ def TryDrive(context: AppContext) -> bool:
         :param context:
     """
     context.l_dir = 5  # Reset last direction
+    stack = context.pos_stack
 
     for z in range(MAXDIS):
         if TryGo(context, z):
             if DriveDone(context):
                 return True  # Destination reached
         else:
-            if context.pos_stack_num:  # Dead end, backup
-                context.pos_stack_num -= 1
+            if stack.count:  # Dead end, backup
+                stack.count -= 1
                 z += 3  # Skip ahead
             else:
                 return False  # Give up at start
@@ -225,7 +299,7 @@ def TryGo(context: AppContext, z: int) -> bool:
             MoveMapSim(context, realdir)
             context.l_dir = (realdir + 2) & 3  # Set new last direction
             if z & 1:  # Save position every other move
-                PushPos(context)
+                context.pos_stack.push(context.s_map_x, context.s_map_y)
             return True
     return False
 
@@ -323,14 +397,7 @@ def RoadTest(x: int) -> bool:
     Returns:
         True if tile is road/rail, False otherwise
     """
-    x = x & LOMASK
-    if x < ROADBASE:
-        return False
-    if x > LASTRAIL:
-        return False
-    if (x >= POWERBASE) and (x < RAILHPOWERV):
-        return False
-    return True
+    return bool(TILE_FLAGS[x & LOMASK] & TF_TRANSIT)
 
 
 def AverageTrf(context: AppContext) -> int:
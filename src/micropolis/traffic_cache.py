@@ -0,0 +1,168 @@
+"""
+traffic_cache.py - Optional reachability cache for zone traffic
+
+``traffic.MakeTraf`` decides whether a zone's traffic "passes" by taking a
+random walk of up to ``MAXDIS`` steps along roads and rail (``TryDrive``)
+until it sits next to a destination tile for the zone type. When a
+``TrafficRouteCache`` is enabled, the answer is looked up instead:
+
+* For each road tile a zone starts from, a breadth-first search over transit
+  tiles records which destination kinds lie within ``MAXDIS`` steps. The
+  result is kept until the map changes.
+* A start tile with no reachable destination fails at once.
+* A reachable one passes. One call in ``sample_every`` still takes the real
+  walk and, if it arrives, remembers the route; the other calls replay the
+  remembered route so ``trf_density`` keeps being deposited along real
+  paths.
+
+The map is compared against the cached route map at most once per simulation
+tick. Any change to a transit or destination tile drops the cached results.
+Because the search finds every destination within reach, cached traffic
+passes at least as often as the random walk.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from .constants import COMBASE, LHTHR, LOMASK, MAXDIS, NUCLEAR, PORT, WORLD_X, WORLD_Y
+from .tile_classes import TF_TRANSIT, TILE_FLAGS
+from .tile_map import tile_array
+
+# Destination ranges per zone type, as in DriveDone (res, com, ind).
+TARGET_LOW = (COMBASE, LHTHR, LHTHR)
+TARGET_HIGH = (NUCLEAR, PORT, COMBASE)
+
+ROUTE_TRANSIT = 0x01
+
+
+def _route_bits(tile: int) -> int:
+    bits = ROUTE_TRANSIT if TILE_FLAGS[tile] & TF_TRANSIT else 0
+    for zone_type in range(3):
+        if TARGET_LOW[zone_type] <= tile <= TARGET_HIGH[zone_type]:
+            bits |= 2 << zone_type
+    return bits
+
+
+# Transit and destination bits for every tile id.
+ROUTE_BITS = np.array([_route_bits(tile) for tile in range(LOMASK + 1)], dtype=np.uint8)
+ROUTE_BITS.flags.writeable = False
+
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+@dataclass
+class RouteCacheStats:
+    """Counters for cached traffic decisions."""
+
+    searches: int = 0  # reachability searches run
+    failed: int = 0  # calls answered "no destination" without a walk
+    walks: int = 0  # real walks sampled
+    replays: int = 0  # remembered routes replayed
+    invalidations: int = 0  # times a map change dropped the cache
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class TrafficRouteCache:
+    """Per-start-tile reachability of traffic destinations."""
+
+    def __init__(self, sample_every: int = 4) -> None:
+        self.enabled = False
+        self.sample_every = sample_every
+        self.stats = RouteCacheStats()
+        self._stamp: tuple[int, int] | None = None
+        self._route: np.ndarray | None = None
+        self._cells: list[list[int]] = []
+        self._reach: dict[tuple[int, int], int] = {}
+        self._paths: dict[tuple[int, int, int], list[tuple[int, int]]] = {}
+        self._calls = 0
+
+    def enable(self, sample_every: int | None = None) -> None:
+        if sample_every is not None:
+            self.sample_every = max(1, sample_every)
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def invalidate(self) -> None:
+        """Forget every cached search and route."""
+        self._route = None
+        self._stamp = None
+        self._reach.clear()
+        self._paths.clear()
+
+    def sync(self, map_data, stamp: tuple[int, int] | None = None) -> None:
+        """Drop cached results if transit or destination tiles changed.
+
+        ``stamp`` identifies the current simulation tick; a repeated stamp
+        skips the comparison.
+        """
+        if stamp is not None and stamp == self._stamp:
+            return
+        self._stamp = stamp
+        route = ROUTE_BITS[tile_array(map_data) & LOMASK]
+        if self._route is not None and np.array_equal(route, self._route):
+            return
+        if self._route is not None:
+            self.stats.invalidations += 1
+        self._route = route
+        self._cells = route.tolist()
+        self._reach.clear()
+        self._paths.clear()
+
+    def reachable(self, x: int, y: int, zone_type: int) -> bool:
+        """Whether a destination for ``zone_type`` is within MAXDIS of (x, y)."""
+        key = (x, y)
+        mask = self._reach.get(key)
+        if mask is None:
+            mask = self._search(x, y)
+            self._reach[key] = mask
+        return bool(mask & (2 << zone_type))
+
+    def _search(self, x: int, y: int) -> int:
+        self.stats.searches += 1
+        cells = self._cells
+        seen = {(x, y)}
+        frontier = deque([(x, y, 0)])
+        found = 0
+        while frontier:
+            cx, cy, depth = frontier.popleft()
+            if depth == MAXDIS:
+                continue
+            for dx, dy in _STEPS:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < WORLD_X and 0 <= ny < WORLD_Y):
+                    continue
+                if not cells[nx][ny] & ROUTE_TRANSIT or (nx, ny) in seen:
+                    continue
+                seen.add((nx, ny))
+                # DriveDone looks at the four neighbours after each move.
+                for ex, ey in _STEPS:
+                    tx = nx + ex
+                    ty = ny + ey
+                    if 0 <= tx < WORLD_X and 0 <= ty < WORLD_Y:
+                        found |= cells[tx][ty]
+                frontier.append((nx, ny, depth + 1))
+        return found & ~ROUTE_TRANSIT
+
+    def should_walk(self, x: int, y: int, zone_type: int) -> bool:
+        """Whether this call should take a real walk rather than a replay."""
+        self._calls += 1
+        if (x, y, zone_type) not in self._paths:
+            return True
+        return self._calls % self.sample_every == 0
+
+    def remember(
+        self, x: int, y: int, zone_type: int, path: list[tuple[int, int]]
+    ) -> None:
+        self._paths[(x, y, zone_type)] = path
+
+    def route(self, x: int, y: int, zone_type: int) -> list[tuple[int, int]] | None:
+        return self._paths.get((x, y, zone_type))
@@ -168,7 +168,10 @@ class _MinimapWidget(UIWidget):
             return
 
         try:
-            mmr = get_or_create_minimap_renderer(self.context)
+            # Render at the zoomed tile size so the result is blitted unscaled.
+            mmr = get_or_create_minimap_renderer(
+                self.context, tile_size=4 * self._zoom_level
+            )
             mmr.set_overlay_mode(self._overlay_mode)
 
             # Calculate scaled dimensions based on zoom level
@@ -216,7 +219,9 @@ class _MinimapWidget(UIWidget):
 
         if 0 <= rel_x < scaled_width and 0 <= rel_y < scaled_height:
             try:
-                mmr = get_or_create_minimap_renderer(self.context)
+                mmr = get_or_create_minimap_renderer(
+                    self.context, tile_size=4 * self._zoom_level
+                )
                 dest_rect = pygame.Rect(dest_x, dest_y, scaled_width, scaled_height)
                 mmr.quick_jump_to(position, dest_rect=dest_rect)
                 return True
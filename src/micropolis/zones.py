@@ -53,7 +53,8 @@ from collections.abc import Callable
 
 from micropolis.context import AppContext
 from micropolis.macros import TestBounds
-from micropolis.power import powerword
+from micropolis.power import TestPowerBit, powerword
+from micropolis.sim_profiler import profiled
 
 import sys
 
@@ -191,6 +192,7 @@ def _rand16_signed(context: AppContext) -> int:
 # ============================================================================
 
 
+@profiled
 def DoZone(context: AppContext | None = None) -> None:
     """
     Main zone processing function.
@@ -317,7 +319,7 @@ def DoIndustrial(
     context.ind_pop += tpop
 
     if tpop > _rand(context, 5):
-        TrfGood = MakeTraf(2)
+        TrfGood = MakeTraf(context, 2)
     else:
         TrfGood = True
 
@@ -362,7 +364,7 @@ def DoCommercial(
     context.com_pop += tpop
 
     if tpop > _rand(context, 5):
-        TrfGood = MakeTraf(1)
+        TrfGood = MakeTraf(context, 1)
     else:
         TrfGood = True
 
@@ -422,7 +424,7 @@ def DoResidential(
     context.res_pop += tpop
 
     if tpop > _rand(context, 35):
-        TrfGood = MakeTraf(0)
+        TrfGood = MakeTraf(context, 0)
     else:
         TrfGood = True
 
@@ -1086,10 +1088,7 @@ def SetZPower(context: AppContext | None = None) -> int:
         or (context.cchr9 == POWERPLANT)
         or (
             (powerword(context.s_map_x, context.s_map_y) < PWRMAPSIZE)
-            and (
-                context.power_map[powerword(context.s_map_x, context.s_map_y)]
-                & (1 << (context.s_map_x & 15))
-            )
+            and TestPowerBit(context, context.s_map_x, context.s_map_y)
         )
     ):
         context.map_data[context.s_map_x][context.s_map_y] = context.cchr | PWRBIT
@@ -1100,21 +1099,26 @@ def SetZPower(context: AppContext | None = None) -> int:
 
 
 # ============================================================================
-# Traffic Functions (placeholders - will be implemented in traffic.py)
+# Traffic Functions
 # ============================================================================
 
 
-def MakeTraf(kind: int) -> int:
+def MakeTraf(context: AppContext, kind: int) -> int:
     """
     Make traffic for zone.
 
-    Placeholder for traffic simulation - will be implemented in traffic.py.
+    With the traffic route cache enabled this is traffic.MakeTraf, which
+    consults the cache; otherwise traffic always passes, as before.
 
     Args:
         kind: Traffic type (0=res, 1=com, 2=ind)
 
     Returns:
-        Traffic rating
+        Traffic rating: 1 passed, 0 failed, -1 no road
+        :param context:
     """
-    # Placeholder - return good traffic for now
+    if context.traffic_cache.enabled:
+        from micropolis import traffic
+
+        return traffic.MakeTraf(context, kind)
     return 1
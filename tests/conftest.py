@@ -59,8 +59,9 @@ def test_context(request):
     ctx.punish_cnt = 0
     ctx.dozing = 0
     from micropolis.constants import WORLD_X, WORLD_Y
+    from micropolis.tile_map import TileMap
 
-    ctx.map_data = [[0 for _ in range(WORLD_Y)] for _ in range(WORLD_X)]
+    ctx.map_data = TileMap(WORLD_X, WORLD_Y)
 
     # Initialize engine
     try:
@@ -0,0 +1,61 @@
+"""
+Tests for the ring-buffered census histories.
+"""
+
+import random
+
+import micropolis.graphs as graphs
+from micropolis.census_history import MONTHS, SERIES_LEN, YEARS, HistorySeries
+
+
+def _scroll(values, first, last):
+    # The element-by-element scroll from TakeCensus / Take2Census.
+    for x in range(last - 1, first - 1, -1):
+        values[x + 1] = values[x]
+
+
+def test_roll_matches_list_scroll():
+    rng = random.Random(7)
+    expected = [rng.randrange(1000) for _ in range(SERIES_LEN)]
+    series = HistorySeries(expected)
+    for step in range(300):
+        if step % 12:
+            _scroll(expected, 0, 119)
+            series.roll(MONTHS)
+            expected[0] = series[0] = step
+        else:
+            _scroll(expected, 120, 239)
+            series.roll(YEARS)
+            expected[120] = series[120] = -step
+        assert series == expected
+    assert series[-1] == expected[-1]
+    assert series[118:122] == expected[118:122]
+
+
+def test_max_is_cached_until_written():
+    series = HistorySeries([5, 9, -3] + [0] * (SERIES_LEN - 3))
+    assert series.max(0, 119) == 9
+    series[119] = 50  # outside [0, 119)
+    assert series.max(0, 119) == 9
+    series[2] = 40
+    assert series.max(0, 119) == 40
+    assert HistorySeries([-5] * SERIES_LEN).max(120, 239) == 0
+
+
+def test_scaled_matches_draw_month():
+    rng = random.Random(3)
+    series = HistorySeries(rng.randrange(-50, 2000) for _ in range(SERIES_LEN))
+    for half, start in ((MONTHS, 0), (YEARS, 120)):
+        for scale in (1.0, 128.0 / 1999, 0.3):
+            dest = [0] * 120
+            graphs.draw_month(series[start : start + 120], dest, scale)
+            assert series.scaled(half, scale) == dest
+
+
+def test_context_assignment_copies_into_series():
+    series = context.res_his
+    context.res_his = [1, 2, 3]
+    assert context.res_his is series
+    assert context.res_his[:4] == [1, 2, 3, 0]
+    assert len(context.res_his) == SERIES_LEN
+    assert context.census_history[0] is series
@@ -0,0 +1,77 @@
+"""
+Tests for the multi-city process pool runner.
+"""
+
+import sys
+
+import pytest
+
+from micropolis import city_pool, headless
+from micropolis.tile_map import tile_array
+
+
+def test_city_state_round_trips():
+    context = headless.create_headless_context()
+    headless.load_city(context, "haight")
+    data = city_pool.dump_city_state(context)
+    assert len(data) == 27120
+
+    restored = headless.create_headless_context()
+    city_pool.load_city_state(restored, data)
+    assert (tile_array(restored.map_data) == tile_array(context.map_data)).all()
+    assert restored.total_funds == context.total_funds
+
+    with pytest.raises(ValueError):
+        city_pool.load_city_state(restored, b"not a city")
+
+
+def test_city_state_round_trips_funds_tax_and_time(monkeypatch):
+    # Without a test context the legacy wrappers stop mirroring state
+    # through micropolis.types, as in production.
+    for name in ("micropolis", "src.micropolis"):
+        if name in sys.modules:
+            monkeypatch.delattr(sys.modules[name], "_AUTO_TEST_CONTEXT", raising=False)
+
+    context = headless.create_headless_context()
+    headless.load_city(context, "haight")
+    context.total_funds = 123456
+    context.city_tax = 11
+    context.city_time = 4
+    context.road_percent = 0.5
+
+    restored = headless.create_headless_context()
+    city_pool.load_city_state(restored, city_pool.dump_city_state(context))
+    assert restored.total_funds == 123456
+    assert restored.city_tax == 11
+    assert restored.city_time == 4
+    assert restored.road_percent == 0.5
+
+
+def test_run_city_job_in_process_applies_settings():
+    job = city_pool.CityJob("taxed", seed=3, months=1, settings={"city_tax": 12})
+    result = city_pool.run_city_job(job)
+    assert result.ok
+    assert result.report.months == 1
+
+    with pytest.raises(ValueError):
+        city_pool.run_city_job(
+            city_pool.CityJob("bad", seed=3, months=1, settings={"nope": 1})
+        )
+
+
+def test_run_cities_streams_metrics_and_returns_in_order():
+    jobs = [
+        city_pool.CityJob("a", seed=11, months=2),
+        city_pool.CityJob("b", seed=12, months=1, return_state=True),
+        city_pool.CityJob("missing", city="no-such-city", months=1),
+    ]
+    seen = []
+
+    results = city_pool.run_cities(jobs, max_workers=2, on_month=seen.append)
+
+    assert [result.job for result in results] == ["a", "b", "missing"]
+    assert results[0].ok and results[0].report.months == 2
+    assert results[1].state is not None and len(results[1].state) == 27120
+    assert not results[2].ok
+    assert "no-such-city" in results[2].error
+    assert sorted((m.job, m.month) for m in seen) == [("a", 1), ("a", 2), ("b", 1)]
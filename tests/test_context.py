@@ -0,0 +1,115 @@
+"""
+Tests for AppContext write batching (sim_session).
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from micropolis import constants as _constants
+from micropolis import types as legacy_types
+from micropolis.app_config import AppConfig
+from micropolis.context import AppContext
+
+_PACKAGE_DIR = Path(_constants.__file__).parent
+
+
+class _RecordingContract:
+    def __init__(self):
+        self.updates = []
+
+    def on_context_update(self, context, field, value):
+        self.updates.append((field, value))
+
+
+@pytest.fixture
+def session_context():
+    ctx = AppContext(config=AppConfig())
+    contract = _RecordingContract()
+    ctx.attach_state_contract(contract)
+    return ctx, contract
+
+
+def test_writes_outside_session_publish_immediately(session_context):
+    ctx, contract = session_context
+    ctx.fire_pop = 4
+    assert contract.updates == [("fire_pop", 4)]
+    assert legacy_types.fire_pop == 4
+
+
+def test_session_publishes_final_values_once(session_context):
+    ctx, contract = session_context
+    ctx.fire_pop = 0
+    contract.updates.clear()
+
+    with ctx.sim_session():
+        for _ in range(5):
+            ctx.fire_pop += 1
+        ctx.cchr = 7
+        assert ctx.fire_pop == 5
+        assert contract.updates == []
+        assert legacy_types.fire_pop == 0
+
+    assert contract.updates == [("fire_pop", 5), ("cchr", 7)]
+    assert legacy_types.fire_pop == 5
+    assert {"fire_pop", "cchr"} <= ctx.model_fields_set
+
+
+def test_nested_sessions_flush_at_outermost_exit(session_context):
+    ctx, contract = session_context
+    with ctx.sim_session():
+        with ctx.sim_session():
+            ctx.res_pop = 3
+        assert contract.updates == []
+    assert contract.updates == [("res_pop", 3)]
+
+
+def test_session_still_rejects_unknown_fields(session_context):
+    ctx, _ = session_context
+    with ctx.sim_session():
+        with pytest.raises(ValueError):
+            ctx.not_a_field = 1
+
+
+def test_session_flushes_when_tick_raises(session_context):
+    ctx, contract = session_context
+    with pytest.raises(RuntimeError):
+        with ctx.sim_session():
+            ctx.road_total = 9
+            raise RuntimeError("boom")
+    assert contract.updates == [("road_total", 9)]
+    ctx.road_total = 10
+    assert contract.updates[-1] == ("road_total", 10)
+
+
+def test_constants_resolve_without_getattr_fallback():
+    ctx = AppContext(config=AppConfig())
+    assert "LOMASK" in vars(AppContext)
+    assert ctx.LOMASK == _constants.LOMASK
+    assert ctx.MESSAGE_STRINGS == []
+
+
+def test_package_reads_constants_from_module_bindings():
+    # context.LOMASK and friends are resolved per access; hot code should
+    # import the constant instead.
+    names = {
+        name
+        for name in vars(_constants)
+        if name.isupper()
+        and name not in AppContext.model_fields
+        and name not in AppContext.__class_vars__
+    }
+    offenders = []
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Attribute)
+                and isinstance(node.value, ast.Name)
+                and node.value.id in ("context", "ctx")
+                and node.attr in names
+            ):
+                rel = path.relative_to(_PACKAGE_DIR)
+                offenders.append(f"{rel}:{node.lineno}: {node.value.id}.{node.attr}")
+    assert offenders == []
@@ -0,0 +1,30 @@
+"""
+Tests for the headless editor rendering benchmark.
+"""
+
+import json
+
+from micropolis import editor_bench
+
+
+def test_editor_bench_reports_idle_frames(capsys):
+    assert (
+        editor_bench.main(
+            [
+                "--seed",
+                "7",
+                "--width",
+                "320",
+                "--height",
+                "240",
+                "--frames",
+                "2",
+                "--json",
+            ]
+        )
+        == 0
+    )
+    data = json.loads(capsys.readouterr().out)
+    assert data["viewport"] == [320, 240]
+    assert data["frames"]["cold"]["mean_tiles"] == 20 * 15
+    assert data["frames"]["idle"]["mean_tiles"] == 0
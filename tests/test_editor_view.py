@@ -179,3 +179,47 @@ class TestEditorView(Assertions):
 
         # Just test that the function doesn't crash
         editor_view.mem_draw_beeg_map_rect(context, self.view, 10, 10, 1, 1)
+
+
+def test_resolve_tiles_for_render_matches_scalar():
+    """Vectorized tile resolution agrees with resolve_tile_for_render."""
+    import numpy as np
+
+    from micropolis.graphics_setup import (
+        resolve_tile_for_render,
+        resolve_tiles_for_render,
+    )
+
+    values = np.arange(0, 1 << 16, 7, dtype=np.uint16)
+    for blink in (False, True):
+        expected = [
+            resolve_tile_for_render(context, value, blink=blink)
+            for value in values.tolist()
+        ]
+        assert resolve_tiles_for_render(values, blink).tolist() == expected
+
+
+def test_changed_tiles_only_redraw():
+    """Unchanged frames redraw nothing; edits and blinking redraw tiles."""
+    view = create_map_view(context)
+    editor_view.initialize_editor_tiles(view)
+    for x in range(const.WORLD_X):
+        for y in range(const.WORLD_Y):
+            context.map_data[x][y] = 0
+    context.flag_blink = 1
+
+    first = editor_view.mem_draw_beeg_map_rect(context, view, 0, 0, 20, 10)
+    assert first == 200
+    assert editor_view.mem_draw_beeg_map_rect(context, view, 0, 0, 20, 10) == 0
+
+    context.map_data[3][4] = macros.RESBASE
+    context.map_data[5][5] = macros.RESBASE | macros.ZONEBIT  # unpowered
+    assert editor_view.mem_draw_beeg_map_rect(context, view, 0, 0, 20, 10) == 2
+    assert view.tiles[3][4] == macros.RESBASE
+
+    context.flag_blink = -1
+    assert editor_view.mem_draw_beeg_map_rect(context, view, 0, 0, 20, 10) == 1
+    assert view.tiles[5][5] == const.LIGHTNINGBOLT
+
+    editor_view.invalidate_editor_view(view)
+    assert editor_view.mem_draw_beeg_map_rect(context, view, 0, 0, 20, 10) == 200
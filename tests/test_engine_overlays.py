@@ -9,6 +9,7 @@ from unittest import mock
 from src.micropolis import engine
 from micropolis.context import AppContext
 from micropolis.app_config import AppConfig
+from micropolis.sim_view import SimView
 
 # Create a test context
 context = AppContext(config=AppConfig())
@@ -87,3 +88,24 @@ def test_scoredoer_triggers_evaluation(monkeypatch):
 
     assert calls["score"]
     assert calls["update"]
+
+
+def test_scaled_minimap_reused_until_map_view_redraws():
+    import pygame
+
+    view = SimView()
+    view.visible = True
+    view.surface = pygame.Surface((120, 100))
+    view.surface.fill((10, 80, 20))
+
+    first = engine._scaled_minimap(view, (60, 50))
+    assert engine._scaled_minimap(view, (60, 50)) is first
+    resized = engine._scaled_minimap(view, (30, 25))
+    assert resized is not first
+    assert engine._scaled_minimap(view, (30, 25)) is resized
+
+    engine.DoUpdateMap(context, view)
+    rescaled = engine._scaled_minimap(view, (30, 25))
+    assert rescaled is not resized
+    assert engine._scaled_minimap(view, (30, 25)) is rescaled
+    assert rescaled.get_size() == (30, 25)
@@ -0,0 +1,111 @@
+"""
+Tests for the headless simulation runner.
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from micropolis import headless, simulation
+from micropolis.tile_map import tile_array
+
+
+def test_phase_names_cover_every_tick():
+    assert len(simulation.PHASE_NAMES) == 16
+    assert simulation.PHASE_NAMES.count("map_scan") == 8
+    assert simulation.TICKS_PER_MONTH == 64
+
+
+def test_resolve_city_path_by_name():
+    path = headless.resolve_city_path("haight")
+    assert path == headless.CITIES_DIR / "haight.cty"
+    with pytest.raises(FileNotFoundError):
+        headless.resolve_city_path("no-such-city")
+
+
+def test_run_generated_city_reports_phases():
+    context = headless.create_headless_context()
+    headless.generate_city(context, seed=1234)
+    start_time = context.city_time
+    months = []
+    scan_times = []
+
+    def on_month(ctx, month):
+        months.append(month)
+        scan_times.append(ctx.city_time)
+
+    report = headless.run_months(context, 2, on_month=on_month)
+
+    assert months == [1, 2]
+    assert report.ticks == 2 * simulation.TICKS_PER_MONTH
+    assert context.city_time == start_time + 2 * simulation.CENSUSRATE
+    assert report.phase_calls["map_scan"] == 2 * 4 * 8
+    assert sum(report.phase_calls.values()) == report.ticks
+    assert report.ticks_per_second > 0
+    assert report.years_per_second == pytest.approx(report.months_per_second / 12)
+    assert report.census["city_time"] == scan_times[-1]
+
+
+def test_run_months_reports_census_from_the_last_full_scan():
+    context = headless.create_headless_context()
+    headless.load_city(context, "haight")
+    road_totals = []
+
+    report = headless.run_months(
+        context, 1, on_month=lambda ctx, month: road_totals.append(ctx.road_total)
+    )
+
+    # Phase 0 has cleared the counters again by the end of the month.
+    assert context.road_total == 0
+    assert report.census["road_total"] > 0
+    assert road_totals == [report.census["road_total"]]
+
+
+def test_load_city_runs():
+    report = headless.run(headless.HeadlessConfig(city="haight", months=1))
+    assert report.census["total_funds"] > 0
+    assert report.phase_seconds["map_scan"] > 0
+
+
+def test_main_prints_json(capsys):
+    assert headless.main(["--seed", "7", "--months", "1", "--json"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["months"] == 1
+    assert set(data["phase_seconds"]) == set(simulation.PHASE_NAMES)
+    assert "years_per_second" in data
+
+
+def test_main_reports_missing_city():
+    assert headless.main(["--city", "no-such-city", "--months", "1"]) == 1
+
+
+def _run_ticks(context, ticks):
+    for _ in range(ticks):
+        headless.step(context)
+    return tile_array(context.map_data).copy(), headless.collect_census(context)
+
+
+def test_cities_tick_concurrently_without_cross_talk(monkeypatch):
+    # Without a test context the legacy wrappers stop mirroring state
+    # through micropolis.types, as in production.
+    for name in ("micropolis", "src.micropolis"):
+        if name in sys.modules:
+            monkeypatch.delattr(sys.modules[name], "_AUTO_TEST_CONTEXT", raising=False)
+
+    def fresh(city):
+        context = headless.create_headless_context()
+        headless.load_city(context, city)
+        return context
+
+    expected = [_run_ticks(fresh(city), 32) for city in ("haight", "bluebird")]
+
+    contexts = [fresh("haight"), fresh("bluebird")]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        actual = list(pool.map(_run_ticks, contexts, [32, 32]))
+
+    for (want_tiles, want_census), (tiles, census) in zip(expected, actual):
+        assert (tiles == want_tiles).all()
+        assert census == want_census
+    assert [ctx.scycle for ctx in contexts] == [2, 2]
@@ -0,0 +1,50 @@
+"""
+Tests for the NumPy tile and overlay rasterizer.
+"""
+
+import numpy as np
+import pygame
+
+from micropolis.constants import LOMASK, TILE_COUNT
+from micropolis.map_raster import (
+    NON_RES_TILES,
+    cell_image,
+    map_tile_ids,
+    solid_blocks,
+    tile_filter_lut,
+    tile_image,
+    write_pixels,
+)
+
+
+def test_tile_filter_lut_maps_hidden_tiles_to_zero():
+    lut = tile_filter_lut(NON_RES_TILES)
+    assert lut.shape == (LOMASK + 1,)
+    assert lut[422] == 422
+    assert lut[0] == 0 and lut[423] == 0
+
+
+def test_map_tile_ids_wraps_past_tile_count():
+    ids = map_tile_ids([[TILE_COUNT + 5, 7 | 0x8000]])
+    assert ids.tolist() == [[5, 7]]
+
+
+def test_tile_image_lays_blocks_out_by_tile():
+    blocks = solid_blocks([(1, 1, 1), (2, 2, 2), (3, 3, 3)], 2)
+    image = tile_image(np.array([[0, 1], [2, 0]]), blocks)
+    assert image.shape == (4, 4, 3)
+    assert image[0:2, 2:4, 0].tolist() == [[2, 2], [2, 2]]  # tile (0, 1)
+    assert image[2:4, 0:2, 0].tolist() == [[3, 3], [3, 3]]  # tile (1, 0)
+
+
+def test_cell_image_and_masked_write_pixels():
+    surface = pygame.Surface((5, 5))
+    surface.fill((9, 9, 9))
+    values = np.array([[True, False], [False, True]])
+    colors = np.where(values[..., None], 200, 0).astype(np.uint8).repeat(3, axis=2)
+
+    write_pixels(surface, cell_image(colors, 3), mask=cell_image(values, 3))
+
+    assert surface.get_at((0, 0))[:3] == (200, 200, 200)
+    assert surface.get_at((4, 4))[:3] == (200, 200, 200)  # clipped cell
+    assert surface.get_at((4, 0))[:3] == (9, 9, 9)  # masked out
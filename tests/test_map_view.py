@@ -169,6 +169,27 @@ class TestMapView(Assertions):
         # Check that surface exists
         self.assertIsInstance(self.mock_view.surface, pygame.Surface)
 
+    def test_drawAll_matches_per_tile_rects(self):
+        """Test the array raster against one rect per tile"""
+        context.map_data[0][0] = macros.RESBASE
+        context.map_data[1][0] = macros.COMBASE
+        context.map_data[2][0] = macros.INDBASE
+        context.map_data[3][0] = 2  # River
+
+        map_view.drawAll(context, self.mock_view)
+
+        expected = {
+            (0, 0): (30, 200, 30),
+            (1, 0): (40, 80, 200),
+            (2, 0): (230, 190, 50),
+            (3, 0): (110, 110, 110),
+            (4, 0): (70, 110, 70),
+            (5, 0): (60, 100, 60),
+        }
+        for (x, y), color in expected.items():
+            for px, py in ((x * 3, y * 3), (x * 3 + 2, y * 3 + 2)):
+                self.assertEqual(self.test_surface.get_at((px, py))[:3], color)
+
     def test_drawRes(self):
         """Test drawing residential zones only"""
         # Set up mixed zone types
@@ -179,6 +200,8 @@ class TestMapView(Assertions):
 
         # Check that surface exists
         self.assertIsInstance(self.mock_view.surface, pygame.Surface)
+        self.assertEqual(self.test_surface.get_at((0, 0))[:3], (30, 200, 30))
+        self.assertEqual(self.test_surface.get_at((3, 0))[:3], (0, 0, 0))
 
     def test_drawCom(self):
         """Test drawing commercial zones only"""
@@ -227,6 +250,26 @@ class TestMapView(Assertions):
         # Check that surface exists
         self.assertIsInstance(self.mock_view.surface, pygame.Surface)
 
+    def test_drawPopDensity_matches_maybeDrawRect(self):
+        """Test the overlay cells against maybeDrawRect"""
+        context.pop_density[0][0] = 100
+        context.pop_density[3][2] = 250
+        context.pop_density[5][5] = 10  # Below the lowest category
+
+        map_view.drawPopDensity(context, self.mock_view)
+
+        reference = pygame.Surface((360, 300))
+        self.mock_view.surface = reference
+        map_view.drawAll(context, self.mock_view)
+        for x, y in ((0, 0), (3, 2), (5, 5)):
+            val = map_view.GetCI(context.pop_density[x][y])
+            map_view.maybeDrawRect(self.mock_view, val, x * 6, y * 6, 6, 6)
+
+        self.assertEqual(
+            pygame.image.tobytes(self.test_surface, "RGB"),
+            pygame.image.tobytes(reference, "RGB"),
+        )
+
     def test_drawRateOfGrowth(self):
         """Test drawing rate of growth overlay"""
         # Set up growth rate data
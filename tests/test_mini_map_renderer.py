@@ -9,6 +9,7 @@ from src.micropolis import map_renderer as map_renderer_module
 from src.micropolis import sim_view as sim_view_module
 from micropolis.app_config import AppConfig
 from micropolis.constants import (
+    CONDBIT,
     EDITOR_H,
     EDITOR_W,
     MAP_H,
@@ -227,3 +228,122 @@ def test_dynamic_filter_overlay_changes_pixels(seeded_context: AppContext) -> No
     base_color = base_surface.get_at((1, 1))
     overlay_color = overlay_surface.get_at((1, 1))
     assert tuple(overlay_color) != tuple(base_color)
+
+
+def _seed_overlay_data(context: AppContext) -> None:
+    power_states = (0, CONDBIT, ZONEBIT, ZONEBIT | PWRBIT)
+    for x in range(WORLD_X):
+        for y in range(WORLD_Y):
+            context.map_data[x][y] = power_states[(x + 2 * y) % 4]
+    for name in (
+        "pop_density",
+        "trf_density",
+        "pollution_mem",
+        "crime_mem",
+        "land_value_mem",
+    ):
+        grid = getattr(context, name)
+        for x in range(len(grid)):
+            for y in range(len(grid[x])):
+                grid[x][y] = (x * 11 + y * 5 + len(name)) % 256
+
+
+@pytest.mark.parametrize("overlay", sorted(map_renderer_module._OVERLAY_GRIDS))
+def test_overlay_color_grid_matches_per_tile_colors(
+    seeded_context: AppContext, overlay: str
+) -> None:
+    import numpy as np
+
+    _seed_overlay_data(seeded_context)
+    xs = np.arange(WORLD_X)
+    ys = np.arange(WORLD_Y)
+    colors = map_renderer_module._OVERLAY_GRIDS[overlay](seeded_context, xs, ys)
+
+    for x in range(WORLD_X):
+        for y in range(WORLD_Y):
+            expected = get_overlay_color(seeded_context, overlay, x, y)
+            assert tuple(colors[x, y]) == (expected or (0, 0, 0, 0))
+
+
+@pytest.mark.parametrize("overlay", ["power", "traffic"])
+def test_vectorized_overlay_render_matches_per_tile(
+    seeded_context: AppContext, monkeypatch: pytest.MonkeyPatch, overlay: str
+) -> None:
+    _seed_overlay_data(seeded_context)
+    seeded_context.sim.editor.surface.fill((40, 90, 30))
+    renderer = get_or_create_map_renderer(seeded_context)
+    renderer.set_viewport_pixels(200, 150)
+    renderer.scroll_pixels(37, 21)
+
+    vectorized = renderer.render(overlay_mode=overlay).copy()
+    monkeypatch.setattr(map_renderer_module, "_OVERLAY_GRIDS", {})
+    per_tile = renderer.render(overlay_mode=overlay)
+
+    assert pygame.image.tobytes(vectorized, "RGBA") == pygame.image.tobytes(
+        per_tile, "RGBA"
+    )
+
+
+def test_minimap_redraws_only_changed_tiles(seeded_context: AppContext) -> None:
+    renderer = get_or_create_minimap_renderer(seeded_context)
+    renderer.render(show_viewport=False)
+    assert renderer.tiles_drawn == WORLD_X * WORLD_Y
+
+    renderer.render(show_viewport=False)
+    assert renderer.tiles_drawn == 0
+
+    seeded_context.map_data[5][6] = 9
+    surface = renderer.render(show_viewport=False)
+    assert renderer.tiles_drawn == 1
+    pixel = surface.get_at((5 * renderer.tile_size, 6 * renderer.tile_size))
+    assert tuple(pixel) == _color_for_tile(9)
+
+
+def test_minimap_blink_layer_draws_unpowered_zones(
+    seeded_context: AppContext,
+) -> None:
+    from micropolis.constants import LIGHTNINGBOLT
+
+    renderer = get_or_create_minimap_renderer(seeded_context)
+    seeded_context.map_data[4][4] = ZONEBIT | 7
+    seeded_context.map_data[5][4] = ZONEBIT | PWRBIT | 7
+    point = (4 * renderer.tile_size + 1, 4 * renderer.tile_size + 1)
+    powered_point = (5 * renderer.tile_size + 1, 4 * renderer.tile_size + 1)
+
+    blinking = renderer.render(blink_override=True, show_viewport=False)
+    assert tuple(blinking.get_at(point)) == _color_for_tile(LIGHTNINGBOLT)
+    assert tuple(blinking.get_at(powered_point)) == _color_for_tile(7)
+
+    steady = renderer.render(blink_override=False, show_viewport=False)
+    assert renderer.tiles_drawn == 0
+    assert tuple(steady.get_at(point)) == _color_for_tile(7)
+
+
+def test_minimap_overlay_layer_kept_while_data_unchanged(
+    seeded_context: AppContext,
+) -> None:
+    renderer = get_or_create_minimap_renderer(seeded_context)
+    first = renderer.sample_density_overlay("traffic")
+
+    seeded_context.cycle += 1
+    assert renderer.sample_density_overlay("traffic") is first
+
+    seeded_context.trf_density[3][3] = 200
+    seeded_context.cycle += 1
+    updated = renderer.sample_density_overlay("traffic")
+    assert updated is not first
+    expected = get_overlay_color(seeded_context, "traffic", 6, 6)
+    assert tuple(updated.get_at((6 * renderer.tile_size, 6 * renderer.tile_size))) == (
+        expected
+    )
+
+
+def test_minimap_zoomed_tile_size_draws_from_atlas(seeded_context: AppContext) -> None:
+    from micropolis.mini_map_renderer import MiniMapRenderer
+
+    renderer = MiniMapRenderer(seeded_context, seeded_context.sim.map, tile_size=12)
+    seeded_context.map_data[2][3] = 7
+
+    surface = renderer.render(show_viewport=False)
+    assert surface.get_size() == (WORLD_X * 12, WORLD_Y * 12)
+    assert tuple(surface.get_at((2 * 12 + 6, 3 * 12 + 6))) == _color_for_tile(7)
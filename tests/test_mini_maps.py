@@ -4,10 +4,13 @@ test_mini_maps.py - Unit tests for mini_maps.py
 Tests the small overview map rendering system ported from g_smmaps.c.
 """
 
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import sys
 import os
 
+import pygame
+
 from micropolis import constants as const
 from micropolis.view_types import MakeNewXDisplay
 from micropolis.sim_view import create_map_view
@@ -236,3 +239,54 @@ class TestMiniMaps(Assertions):
         """Test solid color rendering with no image buffer"""
         mini_maps._render_solid_color(self.view, None, 0xFF0000, 16, 4)
         # Should return early with no image
+
+
+def test_dynamic_filter_mask_matches_dynamic_filter():
+    context.dynamic_data = [0] * 32
+    bounds = [40, 200, 0, 255, 10, 180, 0, 255, 5, 120, 30, 250, 0, 90, 0, 255]
+    context.dynamic_data[:16] = bounds
+    for name in ("pop_density", "trf_density", "crime_mem", "land_value_mem"):
+        grid = getattr(context, name)
+        for x in range(len(grid)):
+            for y in range(len(grid[x])):
+                grid[x][y] = (x * 37 + y * 11 + len(name)) % 256
+    for x in range(len(context.police_map_effect)):
+        for y in range(len(context.police_map_effect[x])):
+            context.police_map_effect[x][y] = (x * 13 + y * 29) % 160
+    for x in range(len(context.rate_og_mem)):
+        for y in range(len(context.rate_og_mem[x])):
+            context.rate_og_mem[x][y] = (x * 17 + y * 7) % 200 - 100
+
+    mask = mini_maps.dynamic_filter_mask(context)
+
+    expected = [
+        [
+            bool(mini_maps.dynamicFilter(context, col, row))
+            for row in range(const.WORLD_Y)
+        ]
+        for col in range(const.WORLD_X)
+    ]
+    assert mask.tolist() == expected
+    assert 0 < mask.sum() < mask.size
+
+
+def test_drawRes_writes_filtered_tiles_to_surface():
+    sheet = pygame.Surface((4, 4 * const.TILE_COUNT), pygame.SRCALPHA)
+    sheet.fill((10, 20, 30, 255), pygame.Rect(0, 0, 4, 4))
+    sheet.fill((0, 200, 0, 255), pygame.Rect(0, macros.RESBASE * 4, 4, 4))
+    sheet.fill((0, 0, 200, 255), pygame.Rect(0, macros.COMBASE * 4, 4, 4))
+    view = SimpleNamespace(
+        surface=pygame.Surface((const.WORLD_X * 3, const.WORLD_Y * 3)),
+        _small_tile_sheet=sheet,
+    )
+    context.map_data = [[0] * const.WORLD_Y for _ in range(const.WORLD_X)]
+    context.map_data[0][0] = macros.RESBASE
+    context.map_data[1][0] = macros.COMBASE
+
+    with patch.object(mini_maps, "_render_small_tile") as render:
+        mini_maps.drawRes(context, view)
+
+    render.assert_not_called()
+    assert view.surface.get_at((2, 2))[:3] == (0, 200, 0)
+    assert view.surface.get_at((3, 0))[:3] == (10, 20, 30)  # Commercial hidden
+    assert view.surface.get_at((8, 8))[:3] == (10, 20, 30)
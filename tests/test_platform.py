@@ -7,8 +7,9 @@ coordinate conversion, view management, and drawing operations.
 
 from micropolis.app_config import AppConfig
 from micropolis.context import AppContext
-from micropolis.constants import COLOR_BLACK, COLOR_WHITE
+from micropolis.constants import COLOR_BLACK, COLOR_WHITE, TRA
 from micropolis.sim import Sim
+from micropolis.sim_sprite import SimSprite
 from micropolis.sim_view import SimView
 import pytest
 import pygame
@@ -437,6 +438,14 @@ class TestUtilityFunctions:
         assert sim.graphs == 0
         assert sim.sprites == 0
 
+    def test_make_new_sim_clears_sprite_index(self, app_context):
+        """Sprites of the old sim are not left in the index."""
+        app_context.sprite_index.add(SimSprite(type=TRA, x=0, y=0, frame=1))
+
+        make_new_sim(app_context)
+
+        assert len(app_context.sprite_index) == 0
+
     def test_do_stop_micropolis(self, app_context):
         """Test stopping micropolis."""
         sim = make_new_sim()
@@ -0,0 +1,39 @@
+"""
+Tests for the fixed-size traffic position stack.
+"""
+
+import pytest
+
+from micropolis.constants import MAXDIS
+from micropolis.pos_stack import PosStack
+
+
+def test_push_pop_and_iterate_bottom_to_top():
+    stack = PosStack()
+    assert stack.capacity == MAXDIS
+    stack.push(1, 2)
+    stack.push(3, 4)
+    assert list(stack) == [(1, 2), (3, 4)]
+    assert (stack.xs[1], stack.ys[2]) == (1, 4)  # 1-based like SMapXStack
+    assert stack.pop() == (3, 4)
+    assert len(stack) == 1
+    stack.clear()
+    with pytest.raises(IndexError):
+        stack.pop()
+
+
+def test_push_past_capacity_raises():
+    stack = PosStack(capacity=2)
+    stack.extend([(0, 0), (1, 1)])
+    with pytest.raises(IndexError):
+        stack.push(2, 2)
+    assert stack.count == 2
+
+
+def test_context_stack_aliases():
+    context.pos_stack_num = 0
+    context.s_map_x_stack = [0, 7]
+    context.s_map_y_stack = [0, 9]
+    context.pos_stack_num = 1
+    assert list(context.pos_stack) == [(7, 9)]
+    assert context.s_map_x_stack is context.pos_stack.xs
@@ -5,10 +5,16 @@ Tests the power distribution system including flood-fill algorithm,
 power bit manipulation, and connectivity checking.
 """
 
+import array
+
+import numpy as np
+
 from micropolis import power
 import micropolis.constants
 from micropolis.app_config import AppConfig
 from micropolis.context import AppContext
+from micropolis.power_index import PowerIndex
+from micropolis.tile_map import TILE_DTYPE, TileMap
 import pytest
 
 
@@ -93,3 +99,161 @@ def test_power_scan_basic(app_context: AppContext):
     assert power.TestPowerBit(context, 10, 10)
     assert context.max_power == 700
 
+
+
+def _flood_fill_reference(tiles):
+    """Unbounded-stack version of the original DoPowerScan flood fill."""
+    width, height = tiles.shape
+    powered = np.zeros(tiles.shape, dtype=bool)
+    stack = []
+    for x, y in zip(*np.nonzero(tiles & power.PWRBIT)):
+        powered[x, y] = True
+        stack.append((x, y))
+    while stack:
+        x, y = stack.pop()
+        for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
+            if 0 <= nx < width and 0 <= ny < height:
+                if tiles[nx, ny] & power.CONDBIT and not powered[nx, ny]:
+                    powered[nx, ny] = True
+                    stack.append((nx, ny))
+    return powered
+
+
+def _random_power_tiles(seed):
+    rng = np.random.default_rng(seed)
+    shape = (micropolis.constants.WORLD_X, micropolis.constants.WORLD_Y)
+    tiles = np.where(rng.random(shape) < 0.55, power.CONDBIT, 0)
+    tiles |= np.where(rng.random(shape) < 0.01, power.PWRBIT, 0)
+    return tiles.astype(TILE_DTYPE)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_power_index_matches_flood_fill(seed):
+    tiles = _random_power_tiles(seed)
+    index = PowerIndex()
+    assert np.array_equal(index.powered_mask(tiles), _flood_fill_reference(tiles))
+
+
+def test_power_index_tracks_edits_incrementally():
+    tiles = _random_power_tiles(5)
+    index = PowerIndex()
+    index.powered_mask(tiles)
+    assert index.rebuilds == 1
+
+    rng = np.random.default_rng(6)
+    for x, y in rng.integers(0, 100, size=(40, 2)).tolist():
+        tiles[x, y] |= power.CONDBIT
+        index.note_region(tiles, x, y)
+    assert np.array_equal(index.powered_mask(tiles), _flood_fill_reference(tiles))
+    assert index.rebuilds == 1
+
+    # Removing a conductor splits components, which forces a rebuild.
+    xs, ys = np.nonzero(tiles & power.CONDBIT)
+    tiles[xs[0], ys[0]] ^= power.CONDBIT
+    assert np.array_equal(index.powered_mask(tiles), _flood_fill_reference(tiles))
+    assert index.rebuilds == 2
+
+
+def test_power_index_reconciles_unreported_edits():
+    tiles = np.zeros(
+        (micropolis.constants.WORLD_X, micropolis.constants.WORLD_Y),
+        dtype=TILE_DTYPE,
+    )
+    tiles[0, 0] = power.PWRBIT
+    index = PowerIndex()
+    assert index.powered_mask(tiles).sum() == 1
+    tiles[1:5, 0] = power.CONDBIT
+    assert index.powered_mask(tiles)[:5, 0].all()
+
+
+def test_power_scan_packs_power_map(app_context: AppContext):
+    context = app_context
+    context.map_data = TileMap()
+    context.map_data[30][40] = power.PWRBIT
+    for x in range(31, 50):
+        context.map_data[x][40] = power.CONDBIT
+    context.map_data[60][40] = power.CONDBIT
+
+    power.DoPowerScan(context)
+
+    for x in range(30, 50):
+        assert power.TestPowerBit(context, x, 40)
+    assert not power.TestPowerBit(context, 50, 40)
+    assert not power.TestPowerBit(context, 60, 40)
+    assert sum(bin(word).count("1") for word in context.power_map) == 20
+
+
+def test_power_map_is_packed_unsigned_words(app_context: AppContext):
+    context = app_context
+    assert isinstance(context.power_map, array.array)
+    assert context.power_map.typecode == "H"
+    assert len(context.power_map) == power.PWRMAPSIZE
+
+    power.SetPowerBit(context, 15, 3)
+    power.ClearPowerBit(context, 14, 3)
+    assert power.TestPowerBit(context, 15, 3)
+    assert power.power_words(context)[power.powerword(15, 3)] == 1 << 15
+
+
+def test_pack_and_unpack_round_trip():
+    rng = np.random.default_rng(3)
+    shape = (micropolis.constants.WORLD_X, micropolis.constants.WORLD_Y)
+    powered = rng.random(shape) < 0.3
+    words = power.pack_power_map(powered)
+    assert words.shape == (power.PWRMAPSIZE,)
+    assert np.array_equal(power.unpack_power_map(words), powered)
+
+
+def test_bulk_queries_match_per_tile_bits(app_context: AppContext):
+    context = app_context
+    rng = np.random.default_rng(4)
+    shape = (micropolis.constants.WORLD_X, micropolis.constants.WORLD_Y)
+    powered = rng.random(shape) < 0.4
+    for x, y in zip(*np.nonzero(powered)):
+        power.SetPowerBit(context, int(x), int(y))
+
+    assert np.array_equal(power.powered_grid(context), powered)
+    assert power.count_powered_tiles(context) == int(powered.sum())
+
+    rect = power.powered_rect(context, 110, 95, 20, 10)
+    expected = np.zeros((20, 10), dtype=bool)
+    expected[:10, :5] = powered[110:, 95:]
+    assert np.array_equal(rect, expected)
+
+    assert power.zone_powered(context, 50, 50) == bool(powered[49:52, 49:52].any())
+
+
+def test_bulk_queries_accept_legacy_sequences(app_context: AppContext):
+    context = app_context
+    context.power_map = bytearray(power.PWRMAPSIZE)
+    context.power_map[power.powerword(2, 1)] = 1 << 2
+    assert power.powered_grid(context)[2, 1]
+    power.fill_power_map(context, ~0)
+    assert isinstance(context.power_map, array.array)
+    assert power.count_powered_tiles(context) == power.PWRMAPSIZE * 16
+
+
+def test_classify_power_tiles_follows_small_map_rules():
+    tiles = np.array(
+        [
+            [
+                10,
+                micropolis.constants.RESBASE | power.ZONEBIT | power.PWRBIT,
+                micropolis.constants.RESBASE | power.ZONEBIT,
+                micropolis.constants.POWERBASE | power.CONDBIT,
+                micropolis.constants.ROADBASE + 100,
+            ]
+        ],
+        dtype=TILE_DTYPE,
+    )
+    classes, low = power.classify_power_tiles(tiles)
+    assert classes.tolist() == [
+        [
+            power.POWER_SHOW_TILE,
+            power.POWER_SHOW_POWERED,
+            power.POWER_SHOW_UNPOWERED,
+            power.POWER_SHOW_CONDUCTIVE,
+            power.POWER_SHOW_BLANK,
+        ]
+    ]
+    assert low[0, 0] == 10
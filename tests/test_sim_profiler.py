@@ -0,0 +1,104 @@
+"""
+Tests for the opt-in simulate() profiler.
+"""
+
+import json
+
+import pytest
+
+from micropolis import sim_control, simulation
+from micropolis.allocation import init_map_arrays
+from micropolis.app_config import AppConfig
+from micropolis.constants import ROADBASE, WORLD_X, WORLD_Y
+from micropolis.context import AppContext
+from micropolis.sim_profiler import SimProfiler, profiled
+from micropolis.tile_map import TileMap
+
+
+@pytest.fixture
+def road_context() -> AppContext:
+    ctx = AppContext(config=AppConfig())
+    init_map_arrays(ctx)
+    ctx.map_data = TileMap(WORLD_X, WORLD_Y)
+    ctx.map_data[1][5] = ROADBASE + 2
+    return ctx
+
+
+@profiled
+def _outer(profiler_calls):
+    profiler_calls.append("outer")
+    _inner(profiler_calls)
+
+
+@profiled
+def _inner(profiler_calls):
+    profiler_calls.append("inner")
+
+
+def test_profiled_handlers_pass_through_when_idle():
+    calls = []
+    _outer(calls)
+    assert calls == ["outer", "inner"]
+
+
+def test_ring_buffer_keeps_latest_ticks():
+    profiler = SimProfiler(capacity=3)
+    profiler.enable()
+    for tick in range(5):
+        profiler.begin_tick(tick, "cycle")
+        profiler.end_tick()
+    assert profiler.ticks == 5
+    assert [sample.index for sample in profiler.samples] == [2, 3, 4]
+    assert profiler.summary()["cycle"]["calls"] == 3
+
+
+def test_nested_handlers_fold_into_call_paths():
+    profiler = SimProfiler()
+    profiler.enable()
+    profiler.begin_tick(1, "map_scan")
+    _outer([])
+    _outer([])
+    profiler.end_tick()
+
+    summary = profiler.summary()
+    assert summary["map_scan;_outer"]["calls"] == 2
+    assert summary["map_scan;_outer;_inner"]["calls"] == 2
+    frames = [line.rsplit(" ", 1)[0] for line in profiler.folded_stacks()]
+    assert frames == [
+        "simulate;map_scan",
+        "simulate;map_scan;_outer",
+        "simulate;map_scan;_outer;_inner",
+    ]
+
+
+def test_disabled_profiler_records_nothing(road_context):
+    simulation.simulate(road_context, 1)
+    assert road_context.sim_profiler.ticks == 0
+
+
+def test_simulate_records_phases_and_handlers(road_context, tmp_path):
+    sim_control.start_sim_profiling(road_context, capacity=32)
+    assert sim_control.is_sim_profiling(road_context)
+    for mod16 in range(16):
+        simulation.simulate(road_context, mod16)
+    sim_control.stop_sim_profiling(road_context)
+    simulation.simulate(road_context, 0)
+
+    profile = sim_control.get_sim_profile(road_context)
+    assert profile["map_scan"]["calls"] == 8
+    assert profile["map_scan;do_road"]["calls"] == 1
+    assert sum(
+        entry["calls"] for key, entry in profile.items() if ";" not in key
+    ) == 16
+
+    json_path = sim_control.dump_sim_profile(road_context, str(tmp_path / "p.json"))
+    data = json.loads(open(json_path, encoding="utf-8").read())
+    assert data["ticks"] == 16
+    assert len(data["samples"]) == 16
+
+    folded = sim_control.dump_sim_profile(road_context, str(tmp_path / "p.folded"))
+    lines = open(folded, encoding="utf-8").read().splitlines()
+    assert any(line.startswith("simulate;map_scan;do_road ") for line in lines)
+
+    sim_control.reset_sim_profile(road_context)
+    assert sim_control.get_sim_profile(road_context) == {}
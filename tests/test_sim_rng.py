@@ -0,0 +1,49 @@
+"""
+Tests for the fixed-width rand.c generator.
+"""
+
+from micropolis import random as sim_random
+from micropolis.app_config import AppConfig
+from micropolis.context import AppContext
+from micropolis.sim_rng import SimRng
+
+
+def _reference(seed, count):
+    # Unbounded integer version of rand.c, as sim_rand used to compute it.
+    value = seed
+    out = []
+    for _ in range(count):
+        value = value * 1103515245 + 12345
+        out.append((value % (0x10000 << 8)) >> 8)
+    return out
+
+
+def test_sequence_matches_unbounded_lcg():
+    rng = SimRng(12345)
+    assert [rng.rand() for _ in range(2000)] == _reference(12345, 2000)
+    assert rng.state < 2**32
+
+
+def test_negative_seed_matches_reference():
+    rng = SimRng(-7)
+    assert [rng.rand() for _ in range(50)] == _reference(-7, 50)
+
+
+def test_draw_n_continues_the_sequence():
+    rng = SimRng(99)
+    first = [rng.rand() for _ in range(3)]
+    batch = rng.draw_n(100)
+    last = rng.rand()
+    assert batch.dtype.name == "uint16"
+    assert first + batch.tolist() + [last] == _reference(99, 104)
+    assert rng.draw_n(0).size == 0
+
+
+def test_context_next_is_rng_state():
+    ctx = AppContext(config=AppConfig())
+    ctx.next = 2**40 + 5
+    assert ctx.next == 5
+    sim_random.sim_srand(ctx, 8)
+    values = [sim_random.sim_rand(ctx) for _ in range(10)]
+    values += sim_random.sim_rand_n(ctx, 10).tolist()
+    assert values == _reference(8, 20)
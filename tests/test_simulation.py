@@ -5,9 +5,13 @@ This module tests the simulation.py module to ensure it produces
 the same outputs as the original C version for given inputs.
 """
 
+import numpy as np
+import pytest
+
 import micropolis.constants
 from micropolis.context import AppContext
-from micropolis import simulation
+from micropolis import power, scanner, simulation
+from micropolis.tile_map import TILE_DTYPE, TileMap
 
 context: AppContext
 
@@ -29,9 +33,9 @@ class TestSimulationIntegration:
                 context.map_data[x][y] = 0
 
         # Reset simulation counters
-        simulation.fcycle = 0
-        simulation.scycle = 0
-        simulation.spdcycle = 0
+        context.fcycle = 0
+        context.scycle = 0
+        context.spdcycle = 0
 
     def test_simulate_phase_0_initialization(self):
         """Test phase 0: time increment, valve setting, census clearing"""
@@ -85,3 +89,124 @@ class TestSimulationIntegration:
         assert context.trf_density[0][0] == 50 - 24  # 26-200 range
         assert context.trf_density[1][1] == 250 - 34  # >200 range
         assert context.trf_density[2][2] == 0  # <24 becomes 0
+
+
+def _reference_map_scan(ctx, x1, x2):
+    """The original cell-by-cell MapScan loop, used as a parity oracle."""
+    c = micropolis.constants
+    for x in range(x1, x2):
+        for y in range(c.WORLD_Y):
+            ctx.cchr = ctx.map_data[x][y]
+            if not ctx.cchr:
+                continue
+            ctx.cchr9 = ctx.cchr & c.LOMASK
+            if ctx.cchr9 < c.FLOOD:
+                continue
+            ctx.s_map_x = x
+            ctx.s_map_y = y
+            if ctx.cchr9 < c.ROADBASE:
+                if ctx.cchr9 >= c.FIREBASE:
+                    ctx.fire_pop += 1
+                    if (simulation.rand16(ctx) & 3) == 0:
+                        simulation.do_fire(ctx)
+                    continue
+                if ctx.cchr9 < c.RADTILE:
+                    simulation.do_flood()
+                else:
+                    simulation.do_rad_tile(ctx)
+                continue
+            if ctx.new_power and (ctx.cchr & c.CONDBIT):
+                simulation.SetZPower(ctx)
+            if c.ROADBASE <= ctx.cchr9 < c.POWERBASE:
+                simulation.do_road(ctx)
+                continue
+            if ctx.cchr & c.ZONEBIT:
+                simulation.do_zone()
+                continue
+            if c.RAILBASE <= ctx.cchr9 < c.RESBASE:
+                simulation.do_rail(ctx)
+                continue
+            if c.SOMETINYEXP <= ctx.cchr9 <= c.LASTTINYEXP:
+                ctx.map_data[x][y] = c.RUBBLE + (simulation.rand16(ctx) & 3) + c.BULLBIT
+
+
+def _run_recorded_scan(monkeypatch, scan, tiles, new_power):
+    """Run ``scan`` over the map with handlers replaced by recorders.
+
+    The fire handler spreads fire down its column and into the next one so
+    the scan has to notice tiles that become active mid-pass.
+    """
+    c = micropolis.constants
+    log = []
+    draws = iter(range(1_000_000))
+
+    def fake_rand16(ctx=None):
+        value = next(draws) * 7919
+        log.append(("rand", value))
+        return value
+
+    def handler(name):
+        def record(*args):
+            log.append((name, context.s_map_x, context.s_map_y))
+        return record
+
+    def spreading_fire(ctx):
+        log.append(("fire", ctx.s_map_x, ctx.s_map_y))
+        x, y = ctx.s_map_x, ctx.s_map_y
+        if y + 2 < c.WORLD_Y:
+            ctx.map_data[x][y + 2] = c.FIREBASE
+        if x + 1 < c.WORLD_X:
+            ctx.map_data[x + 1][y] = c.FIREBASE
+
+    monkeypatch.setattr(simulation, "rand16", fake_rand16)
+    monkeypatch.setattr(simulation, "do_fire", spreading_fire)
+    for name in ("do_flood", "do_rad_tile", "do_road", "do_zone", "do_rail", "SetZPower"):
+        monkeypatch.setattr(simulation, name, handler(name))
+
+    context.map_data = TileMap(tiles=tiles.copy())
+    context.new_power = new_power
+    context.fire_pop = 0
+    for start in range(0, c.WORLD_X, c.WORLD_X // 8):
+        scan(context, start, start + c.WORLD_X // 8)
+    return log, context.map_data.tolist(), context.fire_pop
+
+
+@pytest.mark.parametrize("new_power", [0, 1])
+def test_map_scan_matches_cell_loop(monkeypatch, new_power):
+    c = micropolis.constants
+    rng = np.random.default_rng(21)
+    shape = (c.WORLD_X, c.WORLD_Y)
+    low = rng.choice(
+        [0, 2, 21, 44, c.FLOOD, c.RADTILE, c.FIREBASE, c.ROADBASE, c.POWERBASE,
+         c.RAILBASE, c.RESBASE, 700, c.SOMETINYEXP, 900],
+        size=shape,
+        p=[0.3, 0.2, 0.2, 0.05, 0.01, 0.01, 0.01, 0.05, 0.03, 0.03, 0.05, 0.02, 0.02, 0.02],
+    )
+    flags = rng.choice([0, c.CONDBIT, c.ZONEBIT, c.PWRBIT], size=shape, p=[0.7, 0.15, 0.1, 0.05])
+    tiles = (low | flags).astype(TILE_DTYPE)
+
+    expected = _run_recorded_scan(monkeypatch, _reference_map_scan, tiles, new_power)
+    actual = _run_recorded_scan(monkeypatch, simulation.map_scan, tiles, new_power)
+    assert actual == expected
+    assert any(entry[0] == "fire" for entry in expected[0])
+
+
+def test_active_scan_rows_skips_inert_tiles():
+    c = micropolis.constants
+    column = [0, 2, 21, c.RUBBLE, c.FIREBASE, c.ROADBASE, c.POWERBASE | c.CONDBIT,
+              c.RESBASE + 1, c.RESBASE | c.ZONEBIT]
+    assert simulation.active_scan_rows(column, 0) == [4, 5, 8]
+    assert simulation.active_scan_rows(column, 1) == [4, 5, 6, 8]
+    assert simulation.active_scan_rows(column, 0, start=5) == [5, 8]
+
+
+def test_cycle_globals_are_read_only_views_of_context():
+    context.scycle = 7
+    assert simulation.scycle == 7
+    with pytest.raises(AttributeError):
+        simulation.scycle = 0
+    with pytest.raises(AttributeError):
+        scanner.DonDither = 1
+    context.don_dither = 3
+    assert scanner.DonDither == 3
+    assert power.max_power == context.max_power
@@ -0,0 +1,142 @@
+"""
+Parity tests for the vectorized smoothing kernels.
+
+Each scanner smoothing pass is checked against a straight port of the
+original per-cell loops from s_scan.c, for both the plain and the
+``DonDither`` serpentine error-carry variants.
+"""
+
+import numpy as np
+import pytest
+
+from micropolis import scanner
+from micropolis.constants import HWLDX, HWLDY, QWX, QWY, SM_X, SM_Y
+from micropolis.smoothing import (
+    serpentine_dither,
+    serpentine_order,
+    smooth_average,
+    smooth_half,
+)
+from micropolis.tile_map import OVERLAY_GRIDS, ArrayGrid
+
+
+def _plain_reference(src, width, height, average):
+    out = [[0] * height for _ in range(width)]
+    for x in range(width):
+        for y in range(height):
+            z = 0
+            if x > 0:
+                z += src[x - 1][y]
+            if x < width - 1:
+                z += src[x + 1][y]
+            if y > 0:
+                z += src[x][y - 1]
+            if y < height - 1:
+                z += src[x][y + 1]
+            if average:
+                out[x][y] = min((z + src[x][y]) >> 2, 255)
+            else:
+                out[x][y] = ((z >> 2) + src[x][y]) >> 1
+    return out
+
+
+def _dither_reference(src, width, height, centre_shift, shift):
+    out = [[0] * height for _ in range(width)]
+    x = y = z = 0
+    direction = 1
+    while x < width:
+        while y != height and y != -1:
+            z += src[x if x == 0 else x - 1][y]
+            z += src[x if x == width - 1 else x + 1][y]
+            z += src[x][y if y == 0 else y - 1]
+            z += src[x][y if y == height - 1 else y + 1]
+            z += src[x][y] << centre_shift
+            out[x][y] = (z >> shift) & 0xFF
+            z &= (1 << shift) - 1
+            y += direction
+        direction = -direction
+        y += direction
+        x += 1
+    return out
+
+
+def _random_grid(name, seed, high=256):
+    width, height, dtype = OVERLAY_GRIDS[name]
+    rng = np.random.default_rng(seed)
+    raw = rng.integers(0, high, size=(width, height))
+    return raw.tolist(), ArrayGrid.from_columns(raw, dtype)
+
+
+def test_serpentine_order_walks_columns_alternately():
+    assert serpentine_order(3, 2).tolist() == [0, 1, 3, 2, 4, 5]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_kernels_match_reference_loops(seed):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 256, size=(9, 7))
+    src = values.tolist()
+    assert smooth_average(values).tolist() == _plain_reference(src, 9, 7, True)
+    assert smooth_half(values).tolist() == _plain_reference(src, 9, 7, False)
+    assert serpentine_dither(values, 0, 2).tolist() == _dither_reference(
+        src, 9, 7, 0, 2
+    )
+    assert serpentine_dither(values, 2, 3).tolist() == _dither_reference(
+        src, 9, 7, 2, 3
+    )
+
+
+@pytest.mark.parametrize("as_list", [False, True])
+@pytest.mark.parametrize("dither", [0, 2])
+def test_do_smooth_parity(monkeypatch, as_list, dither):
+    monkeypatch.setattr(context, "don_dither", dither)
+    nested, grid = _random_grid("tem", 1)
+    context.tem = nested if as_list else grid
+    scanner.DoSmooth(context)
+    if dither:
+        expected = _dither_reference(nested, HWLDX, HWLDY, 0, 2)
+    else:
+        expected = _plain_reference(nested, HWLDX, HWLDY, True)
+    assert context.tem2 == expected
+
+
+@pytest.mark.parametrize("dither", [0, 4])
+def test_do_smooth2_parity(monkeypatch, dither):
+    monkeypatch.setattr(context, "don_dither", dither)
+    nested, grid = _random_grid("tem2", 2)
+    context.tem2 = grid
+    scanner.DoSmooth2(context)
+    if dither:
+        expected = _dither_reference(nested, HWLDX, HWLDY, 0, 2)
+    else:
+        expected = _plain_reference(nested, HWLDX, HWLDY, True)
+    assert context.tem == expected
+
+
+@pytest.mark.parametrize("dither", [0, 1])
+def test_smooth_terrain_parity(monkeypatch, dither):
+    monkeypatch.setattr(context, "don_dither", dither)
+    nested, grid = _random_grid("Qtem", 3, high=241)
+    context.Qtem = grid
+    scanner.SmoothTerrain(context)
+    if dither:
+        expected = _dither_reference(nested, QWX, QWY, 2, 3)
+    else:
+        expected = _plain_reference(nested, QWX, QWY, False)
+    assert context.terrain_mem == expected
+
+
+@pytest.mark.parametrize(
+    ("smooth", "name"),
+    [
+        (scanner.SmoothFSMap, "fire_st_map"),
+        (scanner.SmoothPSMap, "police_map"),
+    ],
+)
+def test_station_map_smoothing_parity(smooth, name):
+    nested, grid = _random_grid(name, 4, high=4000)
+    setattr(context, name, grid)
+    smooth(context)
+    expected = _plain_reference(nested, SM_X, SM_Y, False)
+    assert getattr(context, name) == expected
+    assert context.stem == expected
@@ -0,0 +1,55 @@
+"""
+Tests for the sprite spatial index.
+"""
+
+from micropolis.constants import BUS, SHI, TRA
+from micropolis.sim_sprite import SimSprite
+from micropolis.sprite_index import CELL_SIZE, SpriteIndex
+
+
+def _sprite(kind, x, y):
+    return SimSprite(type=kind, x=x, y=y, frame=1)
+
+
+def test_near_returns_newest_first_and_skips_far_sprites():
+    index = SpriteIndex()
+    a = _sprite(TRA, 100, 100)
+    b = _sprite(BUS, 110, 90)
+    far = _sprite(BUS, 100 + 3 * CELL_SIZE, 100)
+    for sprite in (a, b, far):
+        index.add(sprite)
+
+    assert index.near(100, 100) == [b, a]
+    assert len(index) == 3
+
+
+def test_update_moves_sprite_between_cells():
+    index = SpriteIndex()
+    sprite = _sprite(TRA, 0, 0)
+    index.add(sprite)
+    sprite.x = 10 * CELL_SIZE
+    assert index.near(10 * CELL_SIZE, 0) == []
+    index.update(sprite)
+    assert index.near(10 * CELL_SIZE, 0) == [sprite]
+    assert index.near(0, 0) == []
+
+
+def test_type_map_tracks_type_changes_and_removal():
+    index = SpriteIndex()
+    ship = _sprite(SHI, 0, 0)
+    bus = _sprite(BUS, 0, 0)
+    index.add(ship)
+    index.add(bus)
+    assert index.of_type(SHI) == [ship]
+
+    bus.type = SHI
+    index.refresh()
+    assert index.of_type(SHI) == [bus, ship]
+    assert index.of_type(BUS) == []
+
+    index.remove(ship)
+    index.remove(ship)
+    assert ship not in index
+    assert index.of_type(SHI) == [bus]
+    index.clear()
+    assert len(index) == 0
@@ -71,3 +71,62 @@ def test_generate_train_population_requirement(mock_rand):
     sprite_manager.generate_train(context, 50, 50)
     # should not crash; generation may or may not create a sprite
     assert True
+
+
+def test_destroyed_sprites_are_reused_from_pool():
+    sprite = sprite_manager.new_sprite(context, "", constants.EXP, 10, 20)
+    sprite.flag = 7
+    sprite_manager.destroy_sprite(context, sprite)
+    assert context.free_sprites is sprite
+
+    reused = sprite_manager.new_sprite(context, "", constants.TRA, 30, 40)
+    assert reused is sprite
+    assert context.free_sprites is None
+    assert (reused.type, reused.x, reused.flag) == (constants.TRA, 30, 0)
+    assert not hasattr(reused, "__dict__")
+
+
+def test_move_objects_releases_finished_sprites():
+    context.sim_speed = 1
+    sprites = [
+        sprite_manager.new_sprite(context, "", constants.EXP, i, i) for i in range(6)
+    ]
+    named = sprite_manager.new_sprite(context, "keep", constants.EXP, 0, 0)
+    for sprite in sprites[::2] + [named]:
+        sprite.frame = 0
+
+    sprite_manager.move_objects(context)
+
+    alive = []
+    sprite = context.sim.sprite
+    while sprite:
+        alive.append(sprite)
+        sprite = sprite.next
+    assert alive == [named, sprites[5], sprites[3], sprites[1]]
+    assert context.sim.sprites == 4
+    pooled = 0
+    sprite = context.free_sprites
+    while sprite:
+        pooled += 1
+        sprite = sprite.next
+    assert pooled == 3
+
+
+def test_sprite_command_reads_and_writes_fields():
+    sprite = sprite_manager.new_sprite(context, "bus", constants.BUS, 5, 6)
+    command = sprite_manager.SpriteCommand(sprite)
+    assert command.handle_command("x") == "5"
+    command.handle_command("x", "12")
+    assert sprite.x == 12
+
+
+def test_sprite_index_follows_sprite_lifecycle():
+    bus = sprite_manager.new_sprite(context, "", constants.BUS, 100, 100)
+    train = sprite_manager.new_sprite(context, "", constants.TRA, 104, 100)
+    index = context.sprite_index
+    assert index.of_type(constants.BUS) == [bus]
+    assert sprite_manager._nearby_sprites(context, bus) == [train, bus]
+
+    sprite_manager.destroy_sprite(context, train)
+    assert train not in index
+    assert sprite_manager._nearby_sprites(context, bus) == [bus]
@@ -0,0 +1,83 @@
+"""
+Tests for batched LegacyStateContract notifications.
+"""
+
+import pytest
+
+from micropolis import simulation
+from micropolis.allocation import init_map_arrays
+from micropolis.app_config import AppConfig
+from micropolis.context import AppContext
+from micropolis.state_contract import LegacyStateContract, LegacyTypes
+
+
+@pytest.fixture
+def bound():
+    ctx = AppContext(config=AppConfig())
+    types = LegacyTypes()
+    contract = LegacyStateContract()
+    contract.bind(ctx, types)
+    contract.reset_stats()
+    return ctx, types, contract
+
+
+def test_unbatched_writes_push_immediately(bound):
+    ctx, types, contract = bound
+    ctx.total_funds = 123
+    assert types.TotalFunds == 123
+    assert contract.stats.as_dict() == {
+        "notifications": 1,
+        "coalesced": 0,
+        "pushed": 1,
+        "flushes": 0,
+    }
+
+
+def test_batched_writes_coalesce_until_flush(bound):
+    ctx, types, contract = bound
+    before = types.TotalFunds
+    contract.set_batched(True)
+    for funds in range(100, 105):
+        ctx.total_funds = funds
+    ctx.auto_budget = False
+    ctx.city_name = "not bound twice"
+
+    assert types.TotalFunds == before
+    assert contract.flush() == 3
+    assert types.TotalFunds == 104
+    assert types.AutoBudget == 0
+    assert contract.flush() == 0
+    assert contract.stats.notifications == 7
+    assert contract.stats.coalesced == 4
+    assert contract.stats.pushed == 3
+    assert contract.stats.flushes == 1
+
+
+def test_leaving_batch_flushes_pending(bound):
+    ctx, types, contract = bound
+    with contract.batch():
+        ctx.city_tax = 13
+        assert types.BudgetTaxRate != 13
+    assert not contract.batched
+    assert types.BudgetTaxRate == 13
+
+
+def test_legacy_write_supersedes_pending_value(bound):
+    ctx, types, contract = bound
+    contract.set_batched(True)
+    ctx.road_fund = 10
+    types.BudgetRoadFund = 20
+    contract.flush()
+    assert ctx.road_fund == 20
+    assert types.BudgetRoadFund == 20
+
+
+def test_simulate_flushes_batched_contract(bound):
+    ctx, types, contract = bound
+    init_map_arrays(ctx)
+    contract.set_batched(True)
+    start = ctx.city_time
+    for _ in range(simulation.TICKS_PER_MONTH):
+        simulation.simulate(ctx, 0)
+    assert types.CityTime == ctx.city_time > start
+    assert not contract._pending
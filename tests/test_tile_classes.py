@@ -0,0 +1,81 @@
+"""
+Tests for the per-tile-id property tables.
+"""
+
+import numpy as np
+
+from micropolis import tile_classes as tc
+from micropolis.constants import (
+    ANIMBIT,
+    BULLBIT,
+    CHURCH,
+    COMCLR,
+    FIRE,
+    FREEZ,
+    HTRFBASE,
+    LOMASK,
+    NUCLEAR,
+    POWERBASE,
+    RAILBASE,
+    RESBASE,
+    RIVER,
+    ROADBASE,
+    RZB,
+    TREEBASE,
+)
+
+
+def test_tables_cover_every_tile_id():
+    for values, array in (
+        (tc.TILE_CLASS, tc.TILE_CLASS_ARRAY),
+        (tc.TILE_FLAGS, tc.TILE_FLAGS_ARRAY),
+        (tc.POP_DENSITY, tc.POP_DENSITY_ARRAY),
+        (tc.POLLUTION, tc.POLLUTION_ARRAY),
+        (tc.TRAFFIC_LEVEL, tc.TRAFFIC_LEVEL_ARRAY),
+        (tc.DRIVE_RESULT, tc.DRIVE_RESULT_ARRAY),
+    ):
+        assert len(values) == LOMASK + 1
+        assert array.tolist() == list(values)
+        assert not array.flags.writeable
+
+
+def test_classes_follow_tile_ranges():
+    assert tc.TILE_CLASS[RIVER] == tc.TileClass.WATER
+    assert tc.TILE_CLASS[TREEBASE] == tc.TileClass.TREE
+    assert tc.TILE_CLASS[FIRE + 3] == tc.TileClass.FIRE
+    assert tc.TILE_CLASS[ROADBASE] == tc.TileClass.ROAD
+    assert tc.TILE_CLASS[POWERBASE] == tc.TileClass.POWERLINE
+    assert tc.TILE_CLASS[RAILBASE] == tc.TileClass.RAIL
+    assert tc.TILE_CLASS[RESBASE] == tc.TileClass.RESIDENTIAL
+    assert tc.TILE_CLASS[NUCLEAR] == tc.TileClass.NUCLEAR
+
+
+def test_flags():
+    assert tc.TILE_FLAGS[ROADBASE] & tc.TF_ROAD
+    assert tc.TILE_FLAGS[ROADBASE] & tc.TF_TRANSIT
+    assert not tc.TILE_FLAGS[POWERBASE] & tc.TF_TRANSIT
+    for centre in (FREEZ, RZB, CHURCH, COMCLR, NUCLEAR):
+        assert tc.TILE_FLAGS[centre] & tc.TF_ZONE_CENTER
+    assert not tc.TILE_FLAGS[RZB + 1] & tc.TF_ZONE_CENTER
+    assert tc.TILE_FLAGS[FIRE] & tc.TF_ON_FIRE
+    assert tc.TILE_FLAGS[FIRE] & tc.TF_BULLDOZABLE
+    assert not tc.TILE_FLAGS[TREEBASE] & tc.TF_SCAN
+
+
+def test_scalar_values():
+    assert tc.POLLUTION[HTRFBASE] == 75
+    assert tc.POP_DENSITY[RZB] == 16
+    assert tc.TRAFFIC_LEVEL[HTRFBASE] == 2
+    assert tc.DRIVE_RESULT[0] == -1
+    assert tc.DRIVE_RESULT[ROADBASE + 2] == 1
+
+
+def test_arrays_fancy_index_whole_map():
+    tiles = np.array(
+        [[(FIRE + 1) | ANIMBIT, ROADBASE | BULLBIT], [TREEBASE, HTRFBASE]],
+        dtype=np.uint16,
+    )
+    pollution = tc.POLLUTION_ARRAY[tiles & LOMASK]
+    assert pollution.tolist() == [[90, 0], [0, 75]]
+    on_fire = (tc.TILE_FLAGS_ARRAY[tiles & LOMASK] & tc.TF_ON_FIRE) != 0
+    assert on_fire.tolist() == [[True, False], [False, False]]
@@ -9,8 +9,10 @@ from micropolis.app_config import AppConfig
 from micropolis.constants import LIGHTNINGBOLT, TILE_COUNT, ZONEBIT
 from micropolis.context import AppContext
 from micropolis.graphics_setup import (
+    TileAtlas,
     get_small_tile_overlay_surface,
     get_small_tile_surface,
+    get_tile_atlas,
     get_tile_surface,
     resolve_tile_for_render,
 )
@@ -155,3 +157,72 @@ def test_small_tile_overlay_color_ramp_applies_gradient() -> None:
     pixel = overlay_surface.get_at((0, 0))
     assert pixel[2] > pixel[0]
     assert pixel[3] > 0
+
+
+def _gradient_sheet() -> pygame.Surface:
+    sheet = pygame.Surface((4, 4 * TILE_COUNT), pygame.SRCALPHA)
+    for index in range(TILE_COUNT):
+        for y in range(4):
+            for x in range(4):
+                color = ((index * 5) % 256, x * 60, y * 60, 255 - (index % 3) * 60)
+                sheet.set_at((x, index * 4 + y), color)
+    return sheet
+
+
+def test_tile_atlas_matches_per_tile_smoothscale() -> None:
+    sheet = _gradient_sheet()
+    atlas = TileAtlas(sheet, 4)
+
+    for index in (0, 1, 17, TILE_COUNT - 1):
+        tile = sheet.subsurface(pygame.Rect(0, index * 4, 4, 4))
+        expected = pygame.transform.smoothscale(tile, (12, 12))
+        scaled = atlas.tile(index, 12)
+        assert scaled.get_size() == (12, 12)
+        assert pygame.image.tobytes(scaled, "RGBA") == pygame.image.tobytes(
+            expected, "RGBA"
+        )
+        area = atlas.sheet(12).subsurface(atlas.tile_rect(index, 12))
+        assert pygame.image.tobytes(area, "RGBA") == pygame.image.tobytes(
+            expected, "RGBA"
+        )
+
+    assert atlas.sheet(4) is sheet
+
+
+def test_tile_atlas_evicts_least_recently_used_size() -> None:
+    atlas = TileAtlas(_gradient_sheet(), 4, max_sizes=2)
+    atlas.sheet(8)
+    atlas.sheet(12)
+    atlas.sheet(8)
+    atlas.sheet(16)
+    assert atlas.sizes == (8, 16)
+    with pytest.raises(ValueError):
+        atlas.sheet(0)
+
+
+def test_tile_atlas_pixels_stack_tiles_by_index() -> None:
+    sheet = _gradient_sheet()
+    atlas = TileAtlas(sheet, 4)
+
+    pixels = atlas.pixels(4)
+    assert pixels.shape == (TILE_COUNT, 4, 4, 3)
+    assert atlas.pixels(4) is pixels
+    for index in (0, 17, TILE_COUNT - 1):
+        for x, y in ((0, 0), (3, 1)):
+            expected = sheet.get_at((x, index * 4 + y))[:3]
+            assert tuple(pixels[index, x, y]) == tuple(expected)
+
+
+def test_get_tile_atlas_follows_view_sheet() -> None:
+    view = make_editor_view()
+    big = get_tile_atlas(view)
+    assert big is not None and big is get_tile_atlas(view)
+    assert big.tiles_per_row == 32
+
+    assert get_tile_atlas(SimView(), small=True) is None
+    setattr(view, "_small_tile_sheet", make_small_tile_sheet())
+    small = get_tile_atlas(view, small=True)
+    assert small is not None and small is get_tile_atlas(view, small=True)
+
+    setattr(view, "_small_tile_sheet", _gradient_sheet())
+    assert get_tile_atlas(view, small=True) is not small
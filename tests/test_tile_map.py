@@ -0,0 +1,204 @@
+"""
+Test suite for the array-backed tile map.
+
+Covers the ``map_data[x][y]`` compatibility view, copy semantics, the typed
+overlay grids and the array helpers used by vectorized passes.
+"""
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from micropolis import animations, constants, simulation
+from micropolis.tile_map import (
+    OVERLAY_GRIDS,
+    TILE_DTYPE,
+    ArrayGrid,
+    TileMap,
+    ensure_overlay_grid,
+    ensure_tile_map,
+    fill_grid,
+    new_overlay_grid,
+    store_tile_array,
+    tile_array,
+)
+
+
+def test_tile_map_default_shape_and_dtype():
+    tiles = TileMap()
+    assert len(tiles) == constants.WORLD_X
+    assert len(tiles[0]) == constants.WORLD_Y
+    assert tiles.array.shape == (constants.WORLD_X, constants.WORLD_Y)
+    assert tiles.array.dtype == TILE_DTYPE
+    assert tiles.array.flags["C_CONTIGUOUS"]
+
+
+def test_scalar_access_shares_backing_array():
+    tiles = TileMap()
+    tiles[10][20] = constants.ZONEBIT | 5
+    assert tiles.array[10, 20] == constants.ZONEBIT | 5
+    assert isinstance(tiles[10][20], int)
+
+    tiles.array[3, 4] = 99
+    assert tiles[3][4] == 99
+
+    tiles[10][20] |= constants.PWRBIT
+    assert tiles[10][20] == constants.ZONEBIT | constants.PWRBIT | 5
+
+
+def test_column_assignment_writes_into_array():
+    tiles = TileMap(4, 3)
+    column = tiles[1]
+    tiles[1] = [7, 8, 9]
+    assert tiles.array[1].tolist() == [7, 8, 9]
+    # The existing column view still aliases the array.
+    assert column[2] == 9
+
+
+def test_copy_is_independent_and_equality_accepts_lists():
+    tiles = TileMap(3, 2)
+    tiles[0][0] = 1
+    for duplicate in (tiles.copy(), copy.copy(tiles), copy.deepcopy(tiles)):
+        assert duplicate == tiles
+        duplicate[0][0] = 2
+        assert tiles[0][0] == 1
+
+    assert tiles == [[1, 0], [0, 0], [0, 0]]
+    assert tiles != [[0, 0], [0, 0], [0, 0]]
+    assert pickle.loads(pickle.dumps(tiles)) == tiles
+
+
+def test_from_columns_masks_to_unsigned_short():
+    tiles = TileMap.from_columns([[0x1FFFF, 2], [3, 4]])
+    assert tiles.tolist() == [[0xFFFF, 2], [3, 4]]
+    assert ensure_tile_map(tiles) is tiles
+
+
+def test_tile_array_round_trip_for_nested_lists():
+    nested = [[0, 1], [2, 3]]
+    tiles = tile_array(nested)
+    tiles[1, 1] = 42
+    assert nested[1][1] == 3
+    store_tile_array(nested, tiles)
+    assert nested == [[0, 1], [2, 42]]
+
+
+def test_tile_array_is_live_view_for_tile_map():
+    tiles = TileMap(2, 2)
+    view = tile_array(tiles)
+    view[0, 1] = 5
+    store_tile_array(tiles, view)
+    assert tiles[0][1] == 5
+
+
+@pytest.mark.parametrize("as_list", [False, True])
+def test_animate_tiles_matches_per_tile_lookup(as_list):
+    rng = np.random.default_rng(1234)
+    raw = rng.integers(0, 1 << 16, size=(constants.WORLD_X, constants.WORLD_Y))
+    expected = raw.tolist()
+    for x in range(constants.WORLD_X):
+        for y in range(constants.WORLD_Y):
+            value = expected[x][y]
+            if value & constants.ANIMBIT:
+                frame = constants.ani_tile[value & constants.LOMASK]
+                expected[x][y] = frame | (value & constants.ALLBITS)
+
+    context.map_data = (
+        raw.tolist() if as_list else TileMap(tiles=raw.astype(TILE_DTYPE))
+    )
+    animations.animate_tiles(context)
+    assert context.map_data == expected
+
+
+@pytest.mark.parametrize("name", sorted(OVERLAY_GRIDS))
+def test_context_overlays_use_c_element_types(name):
+    width, height, dtype = OVERLAY_GRIDS[name]
+    grid = getattr(context, name)
+    assert isinstance(grid, ArrayGrid)
+    assert grid.array.shape == (width, height)
+    assert grid.array.dtype == dtype
+
+
+def test_overlay_scalar_writes_must_fit_element_type():
+    grid = new_overlay_grid("trf_density")
+    grid[0][0] = 255
+    with pytest.raises(ValueError):
+        grid[0][0] = 256
+    signed = new_overlay_grid("rate_og_mem")
+    signed[1][1] = -200
+    assert signed[1][1] == -200
+
+
+def test_ensure_overlay_grid_converts_and_resizes():
+    width, height, _ = OVERLAY_GRIDS["crime_mem"]
+    nested = [[x + y for y in range(height)] for x in range(width)]
+    grid = ensure_overlay_grid(nested, "crime_mem")
+    assert isinstance(grid, ArrayGrid)
+    assert grid == nested
+    assert ensure_overlay_grid(grid, "crime_mem") is grid
+
+    resized = ensure_overlay_grid([[1, 2], [3, 4]], "crime_mem")
+    assert resized.array.shape == (width, height)
+    assert not resized.array.any()
+
+
+def test_fill_grid_handles_both_representations():
+    grid = ArrayGrid(3, 2)
+    fill_grid(grid, 9)
+    assert grid == [[9, 9], [9, 9], [9, 9]]
+    nested = [[1, 2], [3, 4]]
+    fill_grid(nested, 0)
+    assert nested == [[0, 0], [0, 0]]
+
+
+def _dec_traffic_reference(values):
+    out = [column[:] for column in values]
+    for x, column in enumerate(out):
+        for y, z in enumerate(column):
+            if z > 0:
+                if z > 24:
+                    column[y] = z - 34 if z > 200 else z - 24
+                else:
+                    column[y] = 0
+    return out
+
+
+def _dec_rog_reference(values):
+    out = [column[:] for column in values]
+    for column in out:
+        for y, z in enumerate(column):
+            if z > 0:
+                column[y] = 200 if z > 200 else z - 1
+            elif z < 0:
+                column[y] = -200 if z < -200 else z + 1
+    return out
+
+
+@pytest.mark.parametrize("as_list", [False, True])
+def test_dec_traffic_mem_matches_cell_loop(as_list):
+    rng = np.random.default_rng(7)
+    raw = rng.integers(0, 256, size=OVERLAY_GRIDS["trf_density"][:2])
+    expected = _dec_traffic_reference(raw.tolist())
+    context.trf_density = (
+        raw.tolist()
+        if as_list
+        else ArrayGrid.from_columns(raw, OVERLAY_GRIDS["trf_density"][2])
+    )
+    simulation.dec_traffic_mem(context)
+    assert context.trf_density == expected
+
+
+@pytest.mark.parametrize("as_list", [False, True])
+def test_dec_rog_mem_matches_cell_loop(as_list):
+    rng = np.random.default_rng(11)
+    raw = rng.integers(-400, 401, size=OVERLAY_GRIDS["rate_og_mem"][:2])
+    expected = _dec_rog_reference(raw.tolist())
+    context.rate_og_mem = (
+        raw.tolist()
+        if as_list
+        else ArrayGrid.from_columns(raw, OVERLAY_GRIDS["rate_og_mem"][2])
+    )
+    simulation.dec_rog_mem(context)
+    assert context.rate_og_mem == expected
@@ -316,3 +316,32 @@ def run_all_tests():
 
         traceback.print_exc()
         return False
+
+
+def _traf_mem_after(values, path, vectorized):
+    from micropolis.tile_map import ArrayGrid, TileMap
+
+    context.map_data = TileMap()
+    for x in range(0, 40):
+        context.map_data[x][10] = 66
+    density = ArrayGrid(macros.HWLDX, macros.HWLDY)
+    for (x, y), value in values.items():
+        density[x][y] = value
+    context.trf_density = density if vectorized else density.tolist()
+    context.pos_stack.clear()
+    context.pos_stack.extend(path)
+    traffic.SetTrafMem(context)
+    state = context.sim_rng.state
+    return [list(column) for column in context.trf_density], state
+
+
+def test_set_traf_mem_scatter_matches_sequential():
+    """The vectorized SetTrafMem path matches the per-step loop."""
+    path = [(2, 10), (3, 10), (4, 10), (9, 10), (5, 12), (-1, 10)]
+    for values in ({}, {(1, 5): 150, (2, 5): 200}):
+        context.sim_rng.seed(1234)
+        expected = _traf_mem_after(values, path, vectorized=False)
+        context.sim_rng.seed(1234)
+        assert _traf_mem_after(values, path, vectorized=True) == expected
+        assert context.pos_stack.count == 0
+        assert (context.s_map_x, context.s_map_y) == (2, 10)
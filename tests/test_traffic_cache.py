@@ -0,0 +1,108 @@
+"""
+Tests for the cached traffic reachability mode.
+"""
+
+import micropolis.traffic as traffic
+import micropolis.zones as zones
+from micropolis.constants import COMBASE, HWLDX, HWLDY, MAXDIS, WORLD_X, WORLD_Y
+from micropolis.traffic_cache import TrafficRouteCache
+
+ROAD = 66
+
+
+def _blank_map():
+    return [[0 for _ in range(WORLD_Y)] for _ in range(WORLD_X)]
+
+
+def _road(map_data, x0, x1, y):
+    for x in range(x0, x1 + 1):
+        map_data[x][y] = ROAD
+
+
+def test_reachable_within_maxdis_only():
+    map_data = _blank_map()
+    _road(map_data, 0, MAXDIS + 10, 5)
+    map_data[10][4] = COMBASE + 1  # next to road tile 10
+    map_data[MAXDIS + 5][6] = COMBASE + 1  # beyond MAXDIS steps
+
+    cache = TrafficRouteCache()
+    cache.sync(map_data)
+    assert cache.reachable(0, 5, 0)
+    assert not cache.reachable(0, 5, 2)  # no residential destination
+
+    map_data[10][4] = 0
+    cache.sync(map_data)
+    assert not cache.reachable(0, 5, 0)
+    assert cache.reachable(MAXDIS, 5, 0)
+    assert cache.stats.invalidations == 1
+
+
+def test_sync_skips_repeated_stamp():
+    map_data = _blank_map()
+    _road(map_data, 0, 3, 5)
+    cache = TrafficRouteCache()
+    cache.sync(map_data, (1, 1))
+    assert not cache.reachable(0, 5, 0)
+
+    map_data[3][4] = COMBASE + 1
+    cache.sync(map_data, (1, 1))
+    assert not cache.reachable(0, 5, 0)
+    cache.sync(map_data, (1, 2))
+    assert cache.reachable(0, 5, 0)
+
+
+def _traffic_setup(context):
+    context.map_data = _blank_map()
+    context.trf_density = [[0 for _ in range(HWLDY)] for _ in range(HWLDX)]
+    context.pos_stack_num = 0
+    context.s_map_x_stack = []
+    context.s_map_y_stack = []
+    _road(context.map_data, 12, 20, 10)
+    context.s_map_x = 10
+    context.s_map_y = 10
+    context.traffic_cache.enable(sample_every=4)
+
+
+def test_cached_make_traf_fails_without_walking():
+    _traffic_setup(context)
+    state = context.sim_rng.state
+
+    assert traffic.MakeTraf(context, 0) == 0
+    assert context.sim_rng.state == state
+    assert (context.s_map_x, context.s_map_y) == (10, 10)
+    assert context.traffic_cache.stats.failed == 1
+
+
+def test_cached_make_traf_replays_remembered_route():
+    _traffic_setup(context)
+    context.map_data[14][11] = COMBASE + 1
+
+    assert traffic.MakeTraf(context, 0) == 1
+    first = sum(map(sum, context.trf_density))
+    assert first > 0
+    assert traffic.MakeTraf(context, 0) == 1
+    assert sum(map(sum, context.trf_density)) == 2 * first
+
+    stats = context.traffic_cache.stats
+    assert (stats.walks, stats.replays, stats.searches) == (1, 1, 1)
+    assert (context.s_map_x, context.s_map_y) == (10, 10)
+
+
+def test_cached_make_traf_fails_when_sampled_walk_fails(monkeypatch):
+    _traffic_setup(context)
+    context.map_data[14][11] = COMBASE + 1
+    monkeypatch.setattr(traffic, "TryDrive", lambda ctx: False)
+
+    assert traffic.MakeTraf(context, 0) == 0
+    assert sum(map(sum, context.trf_density)) == 0
+    assert context.traffic_cache.stats.walks == 1
+
+
+def test_zone_traffic_uses_route_cache_when_enabled():
+    _traffic_setup(context)
+
+    assert zones.MakeTraf(context, 0) == 0
+    assert context.traffic_cache.stats.failed == 1
+
+    context.traffic_cache.disable()
+    assert zones.MakeTraf(context, 0) == 1